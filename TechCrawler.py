@@ -1,135 +1,2886 @@
-import requests as req
-from bs4 import BeautifulSoup as bea
-import pandas as pd
+import time
+import_started = time.perf_counter()
 from concurrent.futures import ThreadPoolExecutor
+import threading
+import argparse
 import os
 from datetime import datetime
 import json
 import random
-import time
-from cachetools import TTLCache
+import sqlite3
+import zlib
 from functools import partial
 import re
-from tqdm import tqdm
 import inspect
+import csv
+import bisect
+import queue
+import atexit
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+import hashlib
+import math
+import pickle
+from collections import deque
+import sys
+from typing import TYPE_CHECKING
+
+# requests, bs4, soupsieve, tqdm, orjson ve asyncio ilk kullanıldıkları yerde içe aktarılır;
+# kısa çalıştırmalarda başlangıç süresinin büyük kısmı bu modüllerin yüklenmesine gidiyordu.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup as bea
 
 cofig_dir_path = "json_data/"
+cache_dir_path = "http_cache/"
+state_dir_path = "state/"
+history_db_path = "price_history.sqlite"
+config_bundle_path = f"{cache_dir_path}config_bundle.pickle"
+CONFIG_FILES = ("user_agents", "links", "manufacturers")
+# Paketteki ayarların biçimi değiştiğinde artırılır; eski biçimli paketler okunmaz, JSON'dan yeniden kurulur.
+CONFIG_BUNDLE_VERSION = 1
+metrics_dir_path = "metrics/"
+
+class ErrorLogSink:
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 batch_size: int = 256, flush_interval: float = 1.0, queue_size: int = 10000):
+        """
+        Hata kayıtlarını JSON Lines olarak ekleyen, iş parçacığı güvenli kayıt hedefi.
+
+        Kayıtlar bir kuyruğa bırakılır ve arka plandaki tek bir yazıcı iş parçacığı tarafından
+        toplu halde dosyaya eklenir; çağıran iş parçacığı dosya G/Ç'si için beklemez. Dosya
+        max_bytes boyutunu aştığında ya da gün değiştiğinde döndürülür.
+
+        Args:
+            path (str): JSON Lines kayıt dosyasının yolu.
+            max_bytes (int): Döndürmeden önce dosyanın ulaşabileceği en büyük boyut.
+            backup_count (int): Saklanacak döndürülmüş dosya sayısı.
+            batch_size (int): Tek seferde yazılacak en fazla kayıt sayısı.
+            flush_interval (float): Kuyruk boşken yazıcının en fazla bekleyeceği süre (saniye).
+            queue_size (int): Kuyruğun kapasitesi; dolduğunda yeni kayıtlar düşürülür ve sayılır.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.closed = False
+        self._file = None
+        self._opened_on = None
+        self._thread = threading.Thread(target=self._writer, name="ErrorLogSink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, record: dict) -> None:
+        """
+        Kaydı yazılmak üzere kuyruğa bırakır.
+
+        Args:
+            record (dict): JSON'a çevrilebilir hata kaydı.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._opened_on = datetime.now().date()
+
+    def _rotate_if_needed(self) -> None:
+        if self._file.tell() < self.max_bytes and datetime.now().date() == self._opened_on:
+            return
+        self._file.close()
+        if os.path.getsize(self.path):
+            root, ext = os.path.splitext(self.path)
+            os.replace(self.path, f"{root}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{ext}")
+            directory, base = os.path.split(root)
+            backups = sorted(name for name in os.listdir(directory or ".")
+                             if name.startswith(f"{base}-") and name.endswith(ext))
+            for name in backups[:-self.backup_count] if self.backup_count else backups:
+                os.remove(os.path.join(directory, name))
+        self._open()
+
+    def _writer(self) -> None:
+        self._open()
+        running = True
+        while running:
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [record for record in batch if record is not None]
+            try:
+                self._rotate_if_needed()
+                self._file.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch))
+                self._file.flush()
+            except Exception as e:
+                print(f"Dosya hatası: {e}")
+        self._file.close()
+
+    def close(self) -> None:
+        """
+        Kuyruktaki kayıtları yazar ve yazıcı iş parçacığını durdurur.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self._thread.join()
+        if self.dropped:
+            print(f"Uyarı: kuyruk dolu olduğu için {self.dropped} hata kaydı yazılamadı.")
 
 class Config:
-    def __init__(self):
+    def __init__(self, bundle_path: str = config_bundle_path, log_errors: bool = True):
+        """
+        Config sınıfını başlatır ve ayar dosyalarını yükler.
+
+        Ayarlar önce derlenmiş paketten okunur; paket yoksa ya da JSON dosyalarından biri paket
+        yazıldıktan sonra değiştiyse dosyalar yeniden ayrıştırılır ve paket yenilenir.
+
+        Args:
+            bundle_path (str): Derlenmiş ayar paketinin yolu; None ise her seferinde JSON okunur.
+            log_errors (bool): False ise hata kaydı açılmaz; hatalar take_errors ile alınmak üzere
+                bellekte biriktirilir (kaydı ana sürece bırakan ayrıştırma süreçleri için).
+        """
+        self.error_log= f'{cofig_dir_path}error_log.jsonl'
+        self.error_sink = ErrorLogSink(self.error_log) if log_errors else None
+        self.errors = []
+        self.bundle_path = bundle_path
+        settings = self.load_bundle()
+        self.from_bundle = settings is not None
+        if settings is None:
+            settings = {name: self.load_json(f'{cofig_dir_path}{name}.json') for name in CONFIG_FILES}
+            self.save_bundle(settings)
+        self.user_agents = settings["user_agents"]
+        self.links = settings["links"]
+        self.manufacturers = settings["manufacturers"]
+
+    @staticmethod
+    def bundle_signature() -> tuple:
+        """
+        Ayar dosyalarının yol, değişiklik zamanı ve boyutlarını paket biçimi ve Python sürümüyle
+        birlikte döndürür; dosyalardan biri yoksa None döner.
+        """
+        try:
+            stats = [os.stat(f'{cofig_dir_path}{name}.json') for name in CONFIG_FILES]
+        except OSError:
+            return None
+        return (CONFIG_BUNDLE_VERSION, sys.version_info[:2], cofig_dir_path,
+                tuple((name, stat.st_mtime_ns, stat.st_size) for name, stat in zip(CONFIG_FILES, stats)))
+
+    def load_bundle(self) -> dict:
+        """
+        Derlenmiş ayar paketini okur.
+
+        Returns:
+            dict: Dosya adı -> ayarlar; paket yoksa, okunamıyorsa, kaynak dosyalar değiştiyse ya da
+                ayarlar beklenen biçimde değilse None.
+        """
+        if not self.bundle_path:
+            return None
+        try:
+            with open(self.bundle_path, "rb") as f:
+                signature, settings = pickle.load(f)
+        except Exception:
+            return None
+        if signature != self.bundle_signature() or not self.valid_settings(settings):
+            return None
+        return settings
+
+    @staticmethod
+    def valid_settings(settings) -> bool:
+        """
+        Ayarların tarayıcının beklediği biçimde olup olmadığını döndürür: links site -> {adres: kategori},
+        manufacturers {"manufacturers": {...}}, user_agents {"user_agents": [...]}.
+        """
+        return (isinstance(settings, dict) and set(settings) == set(CONFIG_FILES)
+                and all(isinstance(settings[name], dict) for name in CONFIG_FILES)
+                and all(isinstance(categories, dict) for categories in settings["links"].values())
+                and isinstance(settings["manufacturers"].get("manufacturers"), dict)
+                and isinstance(settings["user_agents"].get("user_agents"), list))
+
+    def save_bundle(self, settings: dict) -> None:
+        """
+        Ayarları kaynak dosyaların imzasıyla birlikte pakete yazar. Okunamayan ya da boş dosya varsa
+        paket yazılmaz; hata bir sonraki başlangıçta yeniden kaydedilir.
+        """
+        signature = self.bundle_signature()
+        if not self.bundle_path or signature is None or not all(settings.values()):
+            return
+        temp_path = f"{self.bundle_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.bundle_path) or ".", exist_ok=True)
+            with open(temp_path, "wb") as f:
+                pickle.dump((signature, settings), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.bundle_path)
+        except OSError as e:
+            self.save_error_to_json(e)
+
+    def load_json(self, path: str) -> dict:
+        """
+        Belirtilen dosya yolundan JSON verilerini yükler.
+
+        Args:
+            path (str): Yüklenilecek JSON dosyasının yolu.
+
+        Returns:
+            dict: JSON verileri.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError as e:
+            self.save_error_to_json(e)
+            return {}
+        except json.JSONDecodeError as e :
+            self.save_error_to_json(e)
+            return {}
+            
+    def save_error_to_json(self, exception):
+        """
+        Hatayı JSON Lines hata kaydına eklenmek üzere kuyruğa bırakır.
+
+        Args:
+            exception (Exception): Kaydedilecek hata.
+        """
+        error_info = {
+            'error_name': type(exception).__name__,
+            'error_message': str(exception),
+            'function_name': inspect.currentframe().f_back.f_code.co_name,
+            'timestamp': datetime.now().isoformat()
+        }
+        self.write_error_records([error_info])
+
+    def write_error_records(self, records: list) -> None:
+        """
+        Hazır hata kayıtlarını (ör. ayrıştırma süreçlerinden gelenleri) kayda bırakır.
+        """
+        if self.error_sink is None:
+            self.errors.extend(records)
+            return
+        for record in records:
+            self.error_sink.write(record)
+
+    def take_errors(self) -> list:
+        """
+        Kayıt açılmadan biriktirilen hata kayıtlarını döndürür ve listeyi boşaltır.
+        """
+        errors, self.errors = self.errors, []
+        return errors
+
+    def close(self) -> None:
+        """
+        Bekleyen hata kayıtlarını dosyaya yazar.
+        """
+        if self.error_sink is not None:
+            self.error_sink.close()
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+COUNT_BUCKETS = (0, 1, 5, 10, 20, 30, 50, 100, 200, 500)
+
+class CrawlMetrics:
+    def __init__(self, prefix: str = "techcrawler"):
+        """
+        Tarama boyunca sayaç ve histogram toplayan, iş parçacığı güvenli ölçüm deposu.
+
+        Çalıştırma sonunda Prometheus metin biçiminde (.prom) ve JSON özeti olarak yazılır.
+
+        Args:
+            prefix (str): Tüm ölçüm adlarının önüne eklenecek ön ek.
+        """
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """
+        Sayacı artırır.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, buckets: tuple, **labels) -> None:
+        """
+        Histograma bir gözlem ekler.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {"buckets": buckets, "counts": [0] * len(buckets),
+                                                    "count": 0, "sum": 0.0}
+            index = bisect.bisect_left(buckets, value)
+            if index < len(buckets):
+                histogram["counts"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += value
+
+    def record_response(self, host: str, status, seconds: float, nbytes: int, attempt: int) -> None:
+        """
+        Bir HTTP denemesinin gecikmesini, durum kodunu, boyutunu ve yeniden deneme olup olmadığını kaydeder.
+
+        Args:
+            host (str): İsteğin yapıldığı host.
+            status (int): HTTP durum kodu; bağlantı hatalarında None.
+            seconds (float): İsteğin süresi.
+            nbytes (int): Alınan gövde boyutu.
+            attempt (int): Deneme sırası (0 ilk deneme).
+        """
+        self.observe("fetch_latency_seconds", seconds, LATENCY_BUCKETS, host=host)
+        self.inc("responses_total", host=host, status=str(status) if status is not None else "error")
+        if nbytes:
+            self.inc("response_bytes_total", nbytes, host=host)
+        if attempt:
+            self.inc("retries_total", host=host)
+
+    @staticmethod
+    def _labels(labels: tuple, extra: str = "") -> str:
+        parts = [f'{key}="{value}"' for key, value in labels]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def to_prometheus(self) -> str:
+        """
+        Ölçümleri Prometheus metin biçiminde döndürür.
+        """
+        lines = []
+        with self.lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE {self.prefix}_{name} counter")
+                for (metric, labels), value in sorted(self.counters.items()):
+                    if metric == name:
+                        lines.append(f"{self.prefix}_{name}{self._labels(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {self.prefix}_{name} histogram")
+                for (metric, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram["buckets"], histogram["counts"]):
+                        cumulative += count
+                        bucket_labels = self._labels(labels, f'le="{bound}"')
+                        lines.append(f"{self.prefix}_{name}_bucket{bucket_labels} {cumulative}")
+                    bucket_labels = self._labels(labels, 'le="+Inf"')
+                    lines.append(f"{self.prefix}_{name}_bucket{bucket_labels} {histogram['count']}")
+                    lines.append(f"{self.prefix}_{name}_sum{self._labels(labels)} {histogram['sum']}")
+                    lines.append(f"{self.prefix}_{name}_count{self._labels(labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _quantile(histogram: dict, q: float):
+        target = q * histogram["count"]
+        cumulative = 0
+        for bound, count in zip(histogram["buckets"], histogram["counts"]):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return None
+
+    def summary(self) -> dict:
+        """
+        Ölçümlerin JSON'a uygun özetini döndürür; histogramlar için adet, toplam, ortalama ve
+        kova sınırlarından yaklaşık p50/p95 verilir.
+        """
+        result = {"counters": {}, "histograms": {}}
+        with self.lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                result["counters"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+            for (name, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+                count = histogram["count"]
+                result["histograms"].setdefault(name, []).append({
+                    "labels": dict(labels), "count": count, "sum": histogram["sum"],
+                    "mean": histogram["sum"] / count if count else None,
+                    "p50": self._quantile(histogram, 0.5), "p95": self._quantile(histogram, 0.95)})
+        return result
+
+    def write(self, directory: str, stamp: str) -> tuple:
+        """
+        Ölçümleri <directory>/crawl_<stamp>.prom ve .json dosyalarına yazar.
+
+        Returns:
+            tuple: Yazılan .prom ve .json dosyalarının yolları.
+        """
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, f"crawl_{stamp}.prom")
+        json_path = os.path.join(directory, f"crawl_{stamp}.json")
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=4)
+        return prom_path, json_path
+
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+class LexborNode:
+    """
+    selectolax (lexbor) düğümlerini, get_total_pages ve extract_products'ın kullandığı
+    BeautifulSoup arayüzünün alt kümesiyle (select, select_one, find, find_all, text,
+    get_text, get, []) sarmalar.
+    """
+    def __init__(self, node):
+        self.node = node
+
+    @staticmethod
+    def wrap(node):
+        return LexborNode(node) if node is not None else None
+
+    @staticmethod
+    def _selector(name: str = None, class_: str = None) -> str:
+        selector = name or "*"
+        if class_:
+            # BeautifulSoup boşluk içeren class_ değerini tam öznitelik eşleşmesi olarak yorumlar.
+            selector += '[class="{}"]'.format(class_.replace('"', '\\"')) if " " in class_ else f'[class~="{class_}"]'
+        return selector
+
+    def select(self, selector: str) -> list:
+        return [LexborNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector: str):
+        return self.wrap(self.node.css_first(selector))
+
+    def find(self, name: str = None, class_: str = None):
+        return self.select_one(self._selector(name, class_))
+
+    def find_all(self, name: str = None, class_: str = None) -> list:
+        return self.select(self._selector(name, class_))
+
+    @property
+    def text(self) -> str:
+        return self.node.text(deep=True)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, key: str, default=None):
+        value = self.node.attributes.get(key)
+        return value if value is not None else default
+
+    def __getitem__(self, key: str):
+        value = self.node.attributes[key]
+        return value if value is not None else ""
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"LexborNode({self.node.tag})"
+
+class RegionLexborNode(LexborNode):
+    """
+    Sayfanın tamamından değil, yalnızca adaptörün bölgelerinden kurulmuş selectolax ağacı.
+    """
+
+RegionSoup = None
+REGION_TREES = (RegionLexborNode,)
+
+def region_soup_type() -> type:
+    """
+    Sayfanın tamamından değil, yalnızca adaptörün bölgelerinden kurulmuş BeautifulSoup ağacının
+    sınıfını döndürür. bs4 ilk bölgesel ayrıştırmada içe aktarıldığı için sınıf o an oluşturulur.
+    """
+    global RegionSoup, REGION_TREES
+    if RegionSoup is None:
+        from bs4 import BeautifulSoup
+
+        class RegionSoup(BeautifulSoup):
+            pass
+
+        REGION_TREES = (RegionLexborNode, RegionSoup)
+    return RegionSoup
+
+def parse_html(text: str, parser: str = "html.parser", adapter=None):
+    """
+    HTML metnini seçilen ayrıştırıcı ile ağaca dönüştürür.
+
+    Adaptör verilirse ve sayfada bölgelerinden biri bulunursa yalnızca bu bölgeler ayrıştırılır;
+    menü, üst bilgi ve alt bilgi için hiç düğüm oluşturulmaz. Bölge bulunamazsa tüm belge ayrıştırılır.
+
+    Args:
+        text (str): HTML metni.
+        parser (str): "html.parser", "lxml" ya da "selectolax".
+        adapter (SiteAdapter): Verilirse ağaç bu adaptörün bölgeleriyle sınırlanır.
+
+    Returns:
+        BeautifulSoup | LexborNode: select/select_one arayüzüne sahip kök düğüm.
+    """
+    region = adapter.region_html(text) if adapter else None
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+        return RegionLexborNode(LexborHTMLParser(region)) if region else LexborNode(LexborHTMLParser(text))
+    if region:
+        return region_soup_type()(region, parser)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(text, parser)
+
+class CompiledSelector:
+    """
+    İlk kullanımda bir kez derlenen ve tüm sayfalarda yeniden kullanılan CSS seçici.
+
+    BeautifulSoup ağaçlarında soupsieve ile derlenmiş desen, selectolax ağaçlarında
+    lexbor'un kendi seçici motoru kullanılır.
+    """
+    def __init__(self, css: str):
+        self.css = css
+        self._pattern = None
+
+    @property
+    def pattern(self):
+        if self._pattern is None:
+            import soupsieve
+            self._pattern = soupsieve.compile(self.css)
+        return self._pattern
+
+    def select(self, node) -> list:
+        if isinstance(node, LexborNode):
+            return node.select(self.css)
+        return self.pattern.select(node)
+
+    def select_one(self, node):
+        if isinstance(node, LexborNode):
+            return node.select_one(self.css)
+        return self.pattern.select_one(node)
+
+def clean_text(value: str) -> str:
+    """
+    Alan değerinden tırnak ve ₺ işaretini atar, boşlukları kırpar.
+    """
+    return value.replace('"', '').replace("₺", "").strip()
+
+# Adaptörlerin okuduğu işaretleme (JSON-LD betikleri, teknosa'nın fiyatı taşıyan gizli input'u) atılmaz;
+# aksi halde yalnızca fiyatı değişen sayfa aynı parmak izini alır ve eski satırlar yeniden kullanılır.
+volatile_html_pattern = re.compile(
+    r"<script\b(?![^>]*application/ld\+json)[^>]*>.*?</script\s*>|<style\b.*?</style\s*>|<noscript\b.*?</noscript\s*>"
+    r"|<!--.*?-->|<meta\b[^>]*>|\s(?:data-)?[\w-]*(?:csrf|token|nonce)[\w-]*=(?:\"[^\"]*\"|'[^']*')",
+    re.S | re.I)
+whitespace_pattern = re.compile(r"\s+")
+structured_data_pattern = re.compile(r"<script\b[^>]*application/ld\+json[^>]*>.*?</script\s*>", re.S | re.I)
+
+def html_fingerprint(text: str, start_pattern=None, end_pattern=None, include_structured: bool = False) -> str:
+    """
+    HTML'in verilen bölgesinin, değişken kısımlar (JSON-LD dışındaki betikler, stiller, yorumlar,
+    meta etiketleri, CSRF/nonce öznitelikleri, boşluklar) atılmış halinin özetini döndürür.
+
+    Args:
+        text (str): Sayfanın HTML'i.
+        start_pattern (re.Pattern): Bölgenin başlangıcı; bulunamazsa belgenin başı.
+        end_pattern (re.Pattern): Bölgenin sonu; bulunamazsa belgenin sonu.
+        include_structured (bool): True ise bölge dışındaki (ör. head içindeki) JSON-LD betikleri de özete katılır.
+
+    Returns:
+        str: 32 karakterlik onaltılık özet.
+    """
+    start = start_pattern.search(text) if start_pattern else None
+    begin = start.start() if start else 0
+    end = end_pattern.search(text, begin) if end_pattern else None
+    region = volatile_html_pattern.sub("", text[begin:end.start() if end else len(text)])
+    if include_structured:
+        region += "".join(structured_data_pattern.findall(text))
+    region = whitespace_pattern.sub(" ", region)
+    return hashlib.blake2b(region.encode("utf-8", "replace"), digest_size=16).hexdigest()
+
+tag_name_pattern = re.compile(r"<([a-zA-Z][\w:-]*)")
+element_tag_patterns = {}
+
+def element_end(text: str, start: int) -> int:
+    """
+    start konumunda açılan elemanın kapanış etiketinin bittiği konumu döndürür; aynı adlı iç içe
+    elemanlar sayılır. Eleman kapanmıyorsa belgenin sonu döner.
+    """
+    name = tag_name_pattern.match(text, start).group(1).lower()
+    pattern = element_tag_patterns.get(name)
+    if pattern is None:
+        pattern = element_tag_patterns[name] = re.compile(rf"<(/?){re.escape(name)}\b[^>]*>", re.I)
+    depth = 0
+    for match in pattern.finditer(text, start):
+        if match.group(1):
+            depth -= 1
+        elif not match.group().endswith("/>"):
+            depth += 1
+        if depth <= 0:
+            return match.end()
+    return len(text)
+
+def region_by_id(tag: str, element_id: str) -> str:
+    """
+    id özniteliği verilen değer olan elemanın başlangıç etiketini bulan düzenli ifadeyi döndürür.
+    """
+    return rf"<{tag}\b[^>]*\sid=[\"']{re.escape(element_id)}[\"']"
+
+def region_by_class(tag: str, class_name: str) -> str:
+    """
+    class listesinde verilen sınıfı (önek olarak değil, tam sınıf adı olarak) içeren elemanın
+    başlangıç etiketini bulan düzenli ifadeyi döndürür.
+    """
+    return rf"<{tag}\b[^>]*\sclass=[\"'](?:[^\"']*\s)?{re.escape(class_name)}(?=[\s\"'])"
+
+def region_html(text: str, patterns: list) -> str:
+    """
+    Başlangıç etiketi desenlerden birine uyan elemanları belge sırasıyla kesip birleştirir; başka bir
+    bölgenin içinde kalan eşleşmeler atlanır.
+
+    Args:
+        text (str): Sayfanın HTML'i.
+        patterns (list): Bölge başlangıç etiketlerini bulan derlenmiş düzenli ifadeler.
+
+    Returns:
+        str: Bölgelerin HTML'i ya da hiçbir bölge bulunamazsa None.
+    """
+    starts = sorted(match.start() for pattern in patterns for match in pattern.finditer(text))
+    pieces = []
+    end = 0
+    for start in starts:
+        if start >= end:
+            end = element_end(text, start)
+            pieces.append(text[start:end])
+    return "".join(pieces) or None
+
+def json_loads(text: str):
+    """
+    JSON metnini orjson ile (kurulu değilse json ile) çözer. İlk çağrıda modülü seçip kendini
+    onun loads işleviyle değiştirir.
+    """
+    global json_loads
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+    json_loads = loads
+    return loads(text)
+
+STRUCTURED_DATA_SELECTOR = 'script[type="application/ld+json"]'
+
+def structured_price_kurus(value) -> int:
+    """
+    Yapısal veride gelen fiyatı kuruşa çevirir. Sayılar ve noktadan sonra en fazla iki hane taşıyan
+    metinler ("12999.90") ondalık noktalı okunur; "12.999" ya da "12.999,00" gibi Türkçe yazımlar
+    parse_price_kurus ile okunur.
+
+    Returns:
+        int: Kuruş cinsinden fiyat; fiyat okunamazsa None.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(value * 100)
+    text = str(value)
+    if text.count(".") == 1 and re.search(r"\.\d{1,2}\D*$", text):
+        text = text.replace(",", "").replace(".", ",")
+    return parse_price_kurus(text)
+
+def format_price_tr(value) -> str:
+    """
+    Yapısal veride gelen fiyatı DOM'daki Türkçe yazımla ("1.234,56") aynı biçime çevirir; okunamayan
+    değer olduğu gibi döner.
+    """
+    kurus = structured_price_kurus(value)
+    if kurus is None:
+        return str(value).strip()
+    return f"{kurus // 100:,}".replace(",", ".") + f",{kurus % 100:02d}"
+
+def _structured_items(data):
+    """
+    JSON-LD verisindeki Product düğümlerini ItemList, ListItem ve @graph içinden çıkararak verir.
+    """
+    if isinstance(data, list):
+        for entry in data:
+            yield from _structured_items(entry)
+        return
+    if not isinstance(data, dict):
+        return
+    types = data.get("@type")
+    types = types if isinstance(types, list) else [types]
+    if "Product" in types:
+        yield data
+    elif "ItemList" in types:
+        for element in data.get("itemListElement") or []:
+            yield from _structured_items(element.get("item", element) if isinstance(element, dict) else element)
+    elif "ListItem" in types and isinstance(data.get("item"), dict):
+        yield from _structured_items(data["item"])
+    if "@graph" in data:
+        yield from _structured_items(data["@graph"])
+
+def _jsonld_products(adapter, soup, scraper) -> list:
+    """
+    Sayfaya gömülü JSON-LD bloklarından ürünleri isim/Fiyat/Üretici/Link şemasında çıkarır.
+
+    Returns:
+        list: Ürünler; sayfada ürün içeren yapısal veri yoksa boş liste.
+    """
+    products = []
+    for script in adapter.select(soup, "structured"):
+        try:
+            data = json_loads(script.get_text())
+        except ValueError:
+            continue
+        for item in _structured_items(data):
+            name = item.get("name")
+            if not name:
+                continue
+            offers = item.get("offers") or {}
+            offer = offers[0] if isinstance(offers, list) and offers else offers
+            price = (offer.get("price") or offer.get("lowPrice")) if isinstance(offer, dict) else None
+            brand = item.get("brand")
+            brand = brand.get("name") if isinstance(brand, dict) else brand
+            link = item.get("url") or (offer.get("url") if isinstance(offer, dict) else None)
+            products.append({"isim": name,
+                             "Fiyat": format_price_tr(price) if price not in (None, "") else "Fiyat yok",
+                             "Üretici": brand or scraper.get_manufacturer(name),
+                             "Link": adapter.absolute(link) if link else "Link bulunamadı"})
+    return products
+
+class SiteAdapter:
+    def __init__(self, name: str, base_url: str, pagination: str, selectors: dict,
+                 parse_total_pages, parse_product, cleaners: dict = None,
+                 fingerprint_region: tuple = (r"<body", r"<footer"), parse_structured=_jsonld_products,
+                 regions: list = None, region_selectors: dict = None):
+        """
+        Bir sitenin seçicilerini, sayfalama şemasını, URL tabanını ve alan temizleyicilerini tanımlar.
+
+        Args:
+            name (str): links.json'daki site adının küçük harfli hali.
+            base_url (str): Göreli ürün bağlantılarının başına eklenecek adres.
+            pagination (str): Sayfa URL şablonu; {url}, {path} (sondaki / atılmış url) ve {page} alanlarını alır.
+            selectors (dict): Ad -> CSS seçici; CompiledSelector'e sarılır ve ilk kullanımda derlenir.
+            parse_total_pages (callable): (adapter, soup) -> toplam sayfa sayısı.
+            parse_product (callable): (adapter, ürün düğümü, scraper) -> ham ürün sözlüğü ya da None.
+            cleaners (dict): Alan adı -> temizleyici; verilmeyen temel alanlara clean_text uygulanır.
+            fingerprint_region (tuple): (başlangıç, bitiş) düzenli ifadeleri; parmak izi yalnızca aradaki
+                ürün listesi ve sayfalayıcıyı kapsayan HTML'den hesaplanır.
+            parse_structured (callable): (adapter, soup, scraper) -> gömülü yapısal veriden (JSON-LD) ürünler;
+                ızgaradaki her ürünü fiyatıyla vermezse DOM seçicilerine düşülür. None ise doğrudan DOM kullanılır.
+            regions (list): Ürün listesini ve sayfalayıcıyı içeren elemanların başlangıç etiketi desenleri;
+                bölgesel ayrıştırmada ağaç yalnızca bu elemanlardan (ve JSON-LD betiklerinden) kurulur.
+            region_selectors (dict): Ad -> CSS seçici; bölgesel ağaçta body'den başlayan konumsal
+                seçicilerin yerine kullanılır.
+        """
+        self.name = name
+        self.base_url = base_url
+        self.pagination = pagination
+        self.selectors = {key: CompiledSelector(css) for key, css in selectors.items()}
+        self.selectors.setdefault("structured", CompiledSelector(STRUCTURED_DATA_SELECTOR))
+        self.parse_total_pages = parse_total_pages
+        self.parse_product = parse_product
+        self.parse_structured = parse_structured
+        self.cleaners = {field: clean_text for field in ("isim", "Fiyat", "Üretici", "Link")}
+        self.cleaners.update(cleaners or {})
+        self.fingerprint_start = re.compile(fingerprint_region[0], re.I)
+        self.fingerprint_end = re.compile(fingerprint_region[1], re.I)
+        self.regions = [re.compile(pattern, re.I) for pattern in regions or []]
+        if self.regions and parse_structured:
+            self.regions.append(re.compile(r"<script\b[^>]*\stype=[\"']?application/ld\+json", re.I))
+        self.region_selectors = {key: CompiledSelector(css) for key, css in (region_selectors or {}).items()}
+
+    def selector(self, node, key: str):
+        if self.region_selectors and isinstance(node, REGION_TREES):
+            return self.region_selectors.get(key) or self.selectors[key]
+        return self.selectors[key]
+
+    def select(self, node, key: str) -> list:
+        return self.selector(node, key).select(node)
+
+    def select_one(self, node, key: str):
+        return self.selector(node, key).select_one(node)
+
+    def region_html(self, text: str) -> str:
+        """
+        Sayfanın ürün listesi ve sayfalayıcı bölgelerinin HTML'ini; bölge tanımı yoksa ya da hiçbiri
+        bulunamazsa None döndürür.
+        """
+        return region_html(text, self.regions) if self.regions else None
+
+    def absolute(self, link: str) -> str:
+        """
+        Göreli ürün bağlantısını sitenin tam adresine çevirir.
+        """
+        return link if link.startswith("http") else self.base_url + link
+
+    def page_url(self, url: str, page_num: int) -> str:
+        """
+        Kategori URL'sinden verilen sayfa numarasının URL'sini üretir.
+        """
+        if page_num == 1:
+            return url
+        return self.pagination.format(url=url, path=url.rstrip("/"), page=page_num)
+
+    def total_pages(self, soup) -> int:
+        return self.parse_total_pages(self, soup)
+
+    def fingerprint(self, text: str) -> str:
+        """
+        Sayfanın ürün listesi bölgesinin ve ürünlerin okunabileceği JSON-LD verisinin parmak izini döndürür.
+        """
+        return html_fingerprint(text, self.fingerprint_start, self.fingerprint_end, self.parse_structured is not None)
+
+    def products(self, soup, scraper) -> list:
+        """
+        Sayfadaki ürünleri çıkarır ve alan temizleyicilerini uygular. Yapısal veri ızgaradaki
+        ürün düğümleri kadar ürünü fiyatlarıyla veriyorsa düğümler ayrıştırılmaz; fiyatı eksik ya
+        da sayısı ızgarayla tutmayan yapısal veride ürünler DOM'dan okunur.
+        """
+        structured = self.parse_structured(self, soup, scraper) if self.parse_structured else []
+        nodes = self.select(soup, "product")
+        if structured and len(structured) == len(nodes) and all(
+                product_info["Fiyat"] != "Fiyat yok" for product_info in structured):
+            path, all_products = "structured", structured
+        else:
+            path = "fallback" if structured else "dom"
+            all_products = []
+            for product in nodes:
+                product_info = self.parse_product(self, product, scraper)
+                if product_info is not None:
+                    all_products.append(product_info)
+            if not all_products and structured:
+                path, all_products = "structured", structured
+        if scraper.metrics:
+            scraper.metrics.inc("extract_pages_total", site=self.name, path=path)
+        for product_info in all_products:
+            for field, cleaner in self.cleaners.items():
+                if isinstance(product_info.get(field), str):
+                    product_info[field] = cleaner(product_info[field])
+        return all_products
+
+def _text_or(node, default: str) -> str:
+    return node.text.strip() if node else default
+
+def _gamegaraj_total_pages(adapter, soup) -> int:
+    page_number_element = adapter.select_one(soup, "paginator")
+    return int(page_number_element.text.strip()) if page_number_element else 1
+
+def _gamegaraj_product(adapter, product, scraper) -> dict:
+    title_link = adapter.select_one(product, "title")
+    title = title_link.text
+    return {"isim": title,
+            "Fiyat": _text_or(adapter.select_one(product, "price"), "Fiyat yok"),
+            "Üretici": scraper.get_manufacturer(title),
+            "Link": title_link["href"]}
+
+def _itopya_total_pages(adapter, soup) -> int:
+    strong_element = adapter.select_one(soup, "paginator")
+    return int(strong_element.get_text().strip().split('/')[1]) if strong_element else 1
+
+def _itopya_product(adapter, product, scraper) -> dict:
+    link_tag = adapter.select_one(product, "title")
+    if not link_tag:
+        return None
+    title = link_tag.get_text().strip()
+    price_tag = adapter.select_one(product, "price")
+    price = price_tag.get_text() if price_tag else "nan"
+    return {"isim": title,
+            "Fiyat": price,
+            "Üretici": scraper.get_manufacturer(title) if price_tag else "Bilinmiyor",
+            "Link": adapter.absolute(link_tag['href'])}
+
+def _sinerji_total_pages(adapter, soup) -> int:
+    page_links = adapter.select(soup, "paginator")
+    return max((int(link.text) for link in page_links if link.text.isdigit()), default=1)
+
+def _sinerji_product(adapter, product, scraper) -> dict:
+    title_element = adapter.select_one(product, "title")
+    product_name = title_element.text.strip() if title_element else "İsim yok"
+    specs_dict = {}
+    for spec in adapter.select(product, "specs"):
+        spec_text = spec.text.strip()
+        if ':' in spec_text:
+            key, value = spec_text.split(':', 1)
+            specs_dict[key.strip()] = value.strip()
+    manufacturer = scraper.get_manufacturer(product_name)
+    product_info = {"isim": product_name,
+                    "Fiyat": _text_or(adapter.select_one(product, "price"), "Fiyat yok"),
+                    "Üretici": manufacturer if manufacturer else "Bilinmiyor",
+                    "Link": adapter.absolute(title_element["href"]) if title_element else "Link yok"}
+    product_info.update(specs_dict)
+    return product_info
+
+def _incehesap_total_pages(adapter, soup) -> int:
+    return max((int(link.get('href', '').split('/sayfa-')[-1].strip('/'))
+                for link in adapter.select(soup, "paginator")
+                if '/sayfa-' in link.get('href', '')), default=1)
+
+def _incehesap_product(adapter, product, scraper) -> dict:
+    title = _text_or(adapter.select_one(product, "title"), "İsim yok")
+    return {"isim": title,
+            "Fiyat": _text_or(adapter.select_one(product, "price"), "Fiyat yok"),
+            "Üretici": scraper.get_manufacturer(title),
+            "Link": adapter.absolute(product['href'])}
+
+def _teknosa_total_pages(adapter, soup) -> int:
+    page_links = adapter.select_one(soup, "paginator")
+    split_text = page_links.text.split("/") if page_links and page_links.text else []
+    return int(split_text[1].strip().replace(")", "")) - 1 if len(split_text) > 1 else 1
+
+def _teknosa_product(adapter, product, scraper) -> dict:
+    link = adapter.select_one(product, "title")
+    title = link.get('title', "isim bulunamadı") if link else "isim bulunamadı"
+    price_input = adapter.select_one(product, "price")
+    return {"isim": title,
+            "Fiyat": price_input.get('value', "Fiyat bulunamadı") if price_input else "Fiyat bulunamadı",
+            "Üretici": title.split()[0] if title != "isim bulunamadı" else "bulunamadı",
+            "Link": adapter.absolute(link['href']) if link else "Link bulunamadı"}
+
+def _tebilon_total_pages(adapter, soup) -> int:
+    page_links = adapter.select_one(soup, "paginator")
+    return int(page_links.text) if page_links and page_links.text else 1
+
+def _tebilon_product(adapter, product, scraper) -> dict:
+    link = adapter.select_one(product, "title")
+    title = link.text if link else "isim bulunamadı"
+    return {"isim": title,
+            "Fiyat": _text_or(adapter.select_one(product, "price"), "Fiyat bulunamadı"),
+            "Üretici": title.split()[0] if title != "isim bulunamadı" else "bulunamadı",
+            "Link": adapter.absolute(link['href']) if link else "Link bulunamadı"}
+
+SITE_ADAPTERS = {adapter.name: adapter for adapter in (
+    SiteAdapter(
+        name="gamegaraj",
+        base_url="https://www.gamegaraj.com",
+        pagination="{path}/page/{page}/",
+        selectors={
+            "paginator": "body > div.edgtf-wrapper > div > div.edgtf-content > div > div.edgtf-container > div > div > div.edgtf-page-content-holder.edgtf-grid-col-9.edgtf-grid-col-push-3 > nav > ul > li:nth-child(2) > a",
+            "product": "li.product",
+            "title": ".edgtf-product-list-title a",
+            "price": ".price ins .woocommerce-Price-amount",
+        },
+        parse_total_pages=_gamegaraj_total_pages,
+        parse_product=_gamegaraj_product,
+        fingerprint_region=(r"edgtf-content", r"<footer"),
+        regions=[region_by_class("div", "edgtf-page-content-holder")],
+        region_selectors={"paginator": "div.edgtf-page-content-holder > nav > ul > li:nth-child(2) > a"}),
+    SiteAdapter(
+        name="itopya",
+        base_url="https://www.itopya.com",
+        pagination="{url}?pg={page}",
+        selectors={
+            "paginator": "body > section.container-fluid > div > div.col-12.col-md-9.col-lg-9.col-xl-10 > div:nth-child(5) > div.actions > span > strong",
+            "product": "#productList > div",
+            "title": "div.product-body > h2 > a",
+            "price": "div.product-footer > div.price > strong",
+        },
+        parse_total_pages=_itopya_total_pages,
+        parse_product=_itopya_product,
+        cleaners={"Fiyat": lambda value: clean_text(value.replace('\xa0', ''))},
+        fingerprint_region=(r"<section[^>]*class=\"container-fluid", r"<footer"),
+        regions=[region_by_class("div", "col-xl-10")],
+        region_selectors={"paginator": "div.col-xl-10 > div:nth-child(5) > div.actions > span > strong"}),
+    SiteAdapter(
+        name="sinerji",
+        base_url="https://www.sinerji.gen.tr",
+        pagination="{url}?px={page}",
+        selectors={
+            "paginator": "a[href*='?px=']",
+            "product": "section article",
+            "title": "div.title a",
+            "specs": "li",
+            "price": "div.row > div.col > span",
+        },
+        parse_total_pages=_sinerji_total_pages,
+        parse_product=_sinerji_product,
+        parse_structured=None,
+        regions=[r"<section\b", r"<a\b[^>]*\shref=[\"'][^\"']*\?px="]),
+    SiteAdapter(
+        name="incehesap",
+        base_url="https://www.incehesap.com",
+        pagination="{path}/sayfa-{page}/",
+        selectors={
+            "paginator": "body > main > div.container.space-y-5.pb-5 > div.flex.flex-col.xl\\:flex-row.gap-5 > div > div.card.flex.items-center.justify-betweensm\\:px-6 > nav > a",
+            "product": "body > main > div.container.space-y-5.pb-5 > div.flex.flex-col.xl\\:flex-row.gap-5 > div > div:nth-child(4) > div.grid.grid-cols-2.md\\:grid-cols-3.gap-1 > a",
+            "title": 'div[class="line-clamp-2 h-11 text-center leading-tight px-1 lg:px-4 md:space-x-3"]',
+            "price": 'span[class="mx-auto whitespace-nowrap text-lg font-bold leading-none tracking-tight text-orange-500 md:text-2xl mb-2"]',
+        },
+        parse_total_pages=_incehesap_total_pages,
+        parse_product=_incehesap_product,
+        fingerprint_region=(r"<main\b", r"</main>"),
+        regions=[region_by_class("div", "md:grid-cols-3"), region_by_class("div", "justify-betweensm:px-6")],
+        region_selectors={
+            "paginator": "div.card.flex.items-center.justify-betweensm\\:px-6 > nav > a",
+            "product": "div.grid.grid-cols-2.md\\:grid-cols-3.gap-1 > a",
+        }),
+    SiteAdapter(
+        name="teknosa",
+        base_url="https://www.teknosa.com",
+        pagination="{url}?page={page}",
+        selectors={
+            "paginator": "#site-main > div > div > div.col-12.section-1 > div > div > div.plp-grid > div.plp-body > div.plp-paging > div.plp-paging-button > button > span",
+            "product": "#product-item",
+            "title": "a",
+            "price": "input",
+        },
+        parse_total_pages=_teknosa_total_pages,
+        parse_product=_teknosa_product,
+        fingerprint_region=(r"id=\"site-main\"", r"<footer"),
+        regions=[region_by_id("div", "product-item"), region_by_class("div", "plp-paging")],
+        region_selectors={"paginator": "div.plp-paging-button > button > span"}),
+    SiteAdapter(
+        name="tebilon",
+        base_url="https://www.tebilon.com",
+        pagination="{url}?page={page}",
+        selectors={
+            "paginator": "#mainPage > main > section.showcase > div > div > div.showcase__showcaseProducts.col-md-12.col-sm-12.col-xs-12.mobileShow > div.col-md-12.productSort__paginationBottom > div > a:nth-child(5)",
+            "product": "#allProducts > div > div",
+            "title": "div > div > div > div.showcase__shadow.col-md-12.no-padding > div.showcase__title.col-md-12.text-center.no-padding.mobileShow > a",
+            "price": "div > div > div > div.showcase__shadow.col-md-12.no-padding > div:nth-child(4) > div > div > div.new.newPrice.col-md-12.col-12.text-center",
+        },
+        parse_total_pages=_tebilon_total_pages,
+        parse_product=_tebilon_product,
+        fingerprint_region=(r"<section[^>]*class=\"showcase", r"</main>"),
+        regions=[region_by_id("div", "allProducts"), region_by_class("div", "productSort__paginationBottom")],
+        region_selectors={"paginator": "div.productSort__paginationBottom > div > a:nth-child(5)"}),
+)}
+
+SITE_HOSTS = {urlparse(adapter.base_url).netloc: adapter for adapter in SITE_ADAPTERS.values()}
+
+def page_fingerprint(url: str, text: str) -> str:
+    """
+    URL'nin host'una ait adaptörün bölgesiyle, host tanınmıyorsa tüm belgeden parmak izi hesaplar.
+    """
+    adapter = SITE_HOSTS.get(urlparse(url).netloc)
+    return adapter.fingerprint(text) if adapter else html_fingerprint(text)
+
+class ResponseCache:
+    def __init__(self, path: str = f"{cache_dir_path}responses.sqlite", max_bytes: int = 512 * 1024 * 1024,
+                 fresh_ttl: int = 300, access_batch: int = 256):
+        """
+        Yanıtları URL anahtarıyla diskte saklayan kalıcı HTTP önbelleği.
+
+        Gövdeler zlib ile sıkıştırılarak ETag/Last-Modified bilgileriyle birlikte SQLite dosyasında
+        tutulur. Sınır aşıldığında en uzun süredir kullanılmayan kayıtlar, toplam sıkıştırılmış
+        boyut max_bytes altına inene kadar silinir. Okumalardaki erişim zamanları bellekte toplanıp
+        toplu halde yazılır.
+
+        Args:
+            path (str): SQLite önbellek dosyasının yolu.
+            max_bytes (int): Önbellekte tutulacak en fazla sıkıştırılmış veri miktarı (bayt).
+            fresh_ttl (int): Bu süreden (saniye) yeni kayıtlar sunucuya sorulmadan kullanılır.
+            access_batch (int): Bu kadar okumanın erişim zamanı birikince veritabanına yazılır.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fresh_ttl = fresh_ttl
+        self.access_batch = access_batch
+        self.accessed = {}
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body BLOB, encoding TEXT, etag TEXT, last_modified TEXT, "
+            "size INTEGER, stored_at REAL, accessed_at REAL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> dict:
+        """
+        URL için önbellekteki kaydı döndürür.
+
+        Args:
+            url (str): Kaydın URL'si.
+
+        Returns:
+            dict: text, etag, last_modified ve stored_at alanlarını içeren kayıt ya da None.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, encoding, etag, last_modified, stored_at FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is not None:
+                self.accessed[url] = time.time()
+                if len(self.accessed) >= self.access_batch:
+                    self._flush_accessed()
+                    self.connection.commit()
+        if row is None:
+            return None
+        body, encoding, etag, last_modified, stored_at = row
+        return {"text": zlib.decompress(body).decode(encoding or "utf-8", errors="replace"),
+                "etag": etag, "last_modified": last_modified, "stored_at": stored_at}
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Kaydın sunucuya sorulmadan kullanılabilecek kadar yeni olup olmadığını döndürür.
+        """
+        return time.time() - entry["stored_at"] < self.fresh_ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """
+        Kayıt için If-None-Match / If-Modified-Since başlıklarını üretir.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url: str, content: bytes, encoding: str, etag: str = None, last_modified: str = None) -> None:
+        """
+        Yanıt gövdesini sıkıştırarak önbelleğe yazar ve gerekirse eski kayıtları çıkarır.
+
+        Args:
+            url (str): Yanıtın URL'si.
+            content (bytes): Ham yanıt gövdesi.
+            encoding (str): Gövdenin karakter kodlaması.
+            etag (str): ETag başlığı.
+            last_modified (str): Last-Modified başlığı.
+        """
+        body = zlib.compress(content, 6)
+        now = time.time()
+        with self.lock:
+            previous = self.connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, encoding, etag, last_modified, len(body), now, now))
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            self.accessed.pop(url, None)
+            self._evict()
+            self.connection.commit()
+
+    def touch(self, url: str) -> None:
+        """
+        304 ile doğrulanan kaydın tazelik ve erişim zamanını günceller.
+        """
+        now = time.time()
+        with self.lock:
+            self.accessed.pop(url, None)
+            self.connection.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self.connection.commit()
+
+    def _flush_accessed(self) -> None:
+        if self.accessed:
+            self.connection.executemany("UPDATE responses SET accessed_at = ? WHERE url = ?",
+                                        [(accessed_at, url) for url, accessed_at in self.accessed.items()])
+            self.accessed.clear()
+
+    def _evict(self) -> None:
+        if self.total_bytes <= self.max_bytes:
+            return
+        self._flush_accessed()
+        rows = self.connection.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall()
+        for url, size in rows:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.total_bytes -= size
+
+    def close(self) -> None:
+        """
+        Bekleyen erişim zamanlarını yazar ve önbellek bağlantısını kapatır.
+        """
+        with self.lock:
+            self._flush_accessed()
+            self.connection.commit()
+            self.connection.close()
+
+class ResponseRecorder:
+    def __init__(self, path: str):
+        """
+        Fetcher'ın aldığı her yanıtı, yerel yeniden oynatma sunucusunun (replay_server.py)
+        sunabileceği bir derleme olarak SQLite dosyasına kaydeder.
+
+        Aynı URL için başarılı bir yanıt varsa sonradan gelen hata yanıtı onun üzerine yazılmaz.
+
+        Args:
+            path (str): Derleme dosyasının yolu.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS recordings ("
+            "url TEXT PRIMARY KEY, status INTEGER, content_type TEXT, body BLOB, recorded_at REAL)")
+        self.connection.commit()
+
+    def record(self, url: str, status: int, content_type: str, content: bytes) -> None:
+        """
+        Yanıtı derlemeye ekler.
+
+        Args:
+            url (str): İsteğin özgün URL'si.
+            status (int): HTTP durum kodu.
+            content_type (str): Content-Type başlığı.
+            content (bytes): Ham yanıt gövdesi.
+        """
+        with self.lock:
+            if status >= 400:
+                previous = self.connection.execute("SELECT status FROM recordings WHERE url = ?", (url,)).fetchone()
+                if previous and previous[0] < 400:
+                    return
+            self.connection.execute("INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?)",
+                                    (url, status, content_type, zlib.compress(content or b"", 6), time.time()))
+            self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Derleme bağlantısını kapatır.
+        """
+        with self.lock:
+            self.connection.close()
+
+def replay_url(replay_base: str, url: str) -> str:
+    """
+    Özgün URL'yi yeniden oynatma sunucusunun adresine çevirir ("<replay_base>/<özgün url>").
+
+    Önbellek, hız sınırlayıcı ve kayıtlar özgün URL ile çalışmaya devam eder; yalnızca
+    bağlantının kurulduğu adres değişir.
+    """
+    return f"{replay_base.rstrip('/')}/{url}" if replay_base else url
+
+class HostRateLimiter:
+    def __init__(self, initial_rate: float = 2.0, min_rate: float = 0.2, max_rate: float = 20.0,
+                 initial_concurrency: int = 4, max_concurrency: int = 32,
+                 rate_step: float = 0.1, decrease_factor: float = 0.5):
+        """
+        Host başına token kovası ile istek hızını ve eşzamanlılığı sınırlar.
+
+        Başarılı (2xx/3xx) yanıtlarda hız ve eşzamanlılık yavaşça artırılır (additive increase),
+        403/429/5xx ve bağlantı hatalarında sert biçimde düşürülür (multiplicative decrease).
+
+        Args:
+            initial_rate (float): Host başına başlangıç hızı (istek/saniye).
+            min_rate (float): İnilebilecek en düşük hız.
+            max_rate (float): Çıkılabilecek en yüksek hız.
+            initial_concurrency (int): Host başına başlangıçtaki eşzamanlı istek sınırı.
+            max_concurrency (int): Host başına en yüksek eşzamanlı istek sınırı.
+            rate_step (float): Her başarılı yanıtta hıza eklenecek miktar.
+            decrease_factor (float): Hata yanıtında hız ve eşzamanlılığın çarpılacağı katsayı.
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.decrease_factor = decrease_factor
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def _state(self, host: str) -> dict:
+        state = self.hosts.get(host)
+        if state is None:
+            state = {"rate": self.initial_rate, "tokens": 1.0, "updated": time.monotonic(),
+                     "concurrency": float(self.initial_concurrency), "in_flight": 0, "blocked_until": 0.0}
+            self.hosts[host] = state
+        return state
+
+    def _try_acquire(self, host: str) -> float:
+        """
+        Host için bir istek hakkı almayı dener.
+
+        Returns:
+            float: Hak alındıysa 0, alınamadıysa tekrar denemeden önce beklenecek süre.
+        """
+        with self.lock:
+            state = self._state(host)
+            now = time.monotonic()
+            state["tokens"] = min(1.0, state["tokens"] + (now - state["updated"]) * state["rate"])
+            state["updated"] = now
+            if now < state["blocked_until"]:
+                return state["blocked_until"] - now
+            if state["in_flight"] >= int(state["concurrency"]):
+                return 0.05
+            if state["tokens"] < 1.0:
+                return (1.0 - state["tokens"]) / state["rate"]
+            state["tokens"] -= 1.0
+            state["in_flight"] += 1
+            return 0
+
+    def acquire(self, host: str) -> None:
+        """
+        Host için istek hakkı alınana kadar çağıran iş parçacığını bekletir.
+        """
+        while True:
+            wait = self._try_acquire(host)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str) -> None:
+        """
+        Host için istek hakkı alınana kadar olay döngüsünü bloklamadan bekler.
+        """
+        import asyncio
+        while True:
+            wait = self._try_acquire(host)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, host: str, status: int = None, retry_after: float = None) -> None:
+        """
+        İsteğin sonucunu bildirir ve host'un hızını AIMD kuralına göre günceller.
+
+        Args:
+            host (str): İsteğin yapıldığı host.
+            status (int): HTTP durum kodu; bağlantı hatalarında None.
+            retry_after (float): Sunucunun Retry-After başlığında istediği bekleme süresi.
+        """
+        with self.lock:
+            state = self._state(host)
+            state["in_flight"] = max(0, state["in_flight"] - 1)
+            if status is not None and status < 400:
+                state["rate"] = min(self.max_rate, state["rate"] + self.rate_step)
+                state["concurrency"] = min(float(self.max_concurrency),
+                                           state["concurrency"] + 1.0 / state["concurrency"])
+            elif status is None or status in (403, 429) or status >= 500:
+                state["rate"] = max(self.min_rate, state["rate"] * self.decrease_factor)
+                state["concurrency"] = max(1.0, state["concurrency"] * self.decrease_factor)
+                state["tokens"] = min(state["tokens"], 0.0)
+                if retry_after:
+                    state["blocked_until"] = max(state["blocked_until"], time.monotonic() + retry_after)
+
+    @staticmethod
+    def parse_retry_after(value) -> float:
+        """
+        Retry-After başlığını saniyeye çevirir; tarih biçimi ya da geçersiz değerde None döner.
+        """
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+def windowed_results(items: list, submit, window: int):
+    """
+    Her öğe için submit(öğe) ile bir Future başlatır ve sonuçları öğe sırasıyla verir. Aynı anda
+    en fazla window Future uçuşta ya da tüketilmeyi bekler; sırası gelmemiş sayfalar kategori
+    uzunluğu kadar birikmez ve bellek sayfa sayısından bağımsız kalır.
+
+    Args:
+        items (list): Öğeler (ör. sayfa URL'leri).
+        submit (callable): Öğeden concurrent.futures.Future üreten işlev.
+        window (int): Aynı anda başlatılmış en fazla öğe sayısı.
+
+    Yields:
+        tuple: (öğe, Future sonucu).
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max(window, 1):
+            done_item, future = pending.popleft()
+            yield done_item, future.result()
+        pending.append((item, submit(item)))
+    while pending:
+        done_item, future = pending.popleft()
+        yield done_item, future.result()
+
+class PageFetcher:
+    def __init__(self, config: Config, retries: int = 5, delay: int = 2, rate_limiter: HostRateLimiter = None,
+                 cache: ResponseCache = None, parser: str = "html.parser", recorder: ResponseRecorder = None,
+                 replay_base: str = None, metrics: CrawlMetrics = None, regions: bool = False):
+        """
+        PageFetcher sınıfını başlatır.
+
+        Args:
+            config (Config): Config nesnesi.
+            retries (int): Yeniden deneme sayısı.
+            delay (int): Denemeler arasındaki gecikme süresi.
+            rate_limiter (HostRateLimiter): Host başına uyarlanabilir hız sınırlayıcı; None ise sınırlama yapılmaz.
+            cache (ResponseCache): Kalıcı yanıt önbelleği; None ise önbellek kullanılmaz.
+            parser (str): HTML ayrıştırıcı: "html.parser", "lxml" ya da "selectolax".
+            recorder (ResponseRecorder): Verilirse alınan her yanıt derlemeye kaydedilir.
+            replay_base (str): Verilirse istekler bu adresteki yeniden oynatma sunucusuna yönlendirilir.
+            metrics (CrawlMetrics): Verilirse gecikme, durum kodu, boyut ve ayrıştırma süreleri kaydedilir.
+            regions (bool): True ise tanınan sitelerin sayfalarında yalnızca ürün listesi ve sayfalayıcı
+                bölgeleri ayrıştırılır.
+        """
+        self.config = config
+        self.retries = retries
+        self.delay = delay
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.parser = parser
+        self.recorder = recorder
+        self.replay_base = replay_base
+        self.metrics = metrics
+        self.regions = regions
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=os.cpu_count() * 2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url: str, timeout: int = 15) -> "bea":
+        """
+        Belirtilen URL'den sayfayı alır.
+
+        Args:
+            url (str): Alınacak sayfanın URL'si.
+            timeout (int): Zaman aşımı süresi.
+
+        Returns:
+            BeautifulSoup: Alınan sayfanın BeautifulSoup nesnesi.
+        """
+        text = self.fetch_text(url, timeout)
+        if text is None:
+            return None
+        return self.parse(url, text)
+
+    def parse(self, url: str, text: str):
+        """
+        Sayfa metnini seçili ayrıştırıcıyla ağaca çevirir ve süresini kaydeder.
+        """
+        started = time.perf_counter()
+        soup = parse_html(text, self.parser, SITE_HOSTS.get(urlparse(url).netloc) if self.regions else None)
+        if self.metrics:
+            self.metrics.observe("parse_seconds", time.perf_counter() - started, PARSE_BUCKETS, host=urlparse(url).netloc)
+        return soup
+
+    def fetch_text(self, url: str, timeout: int = 15) -> str:
+        """
+        Belirtilen URL'nin HTML metnini alır. Önbellekte kayıt varsa sunucuya koşullu istek
+        gönderilir ve 304 yanıtında önbellekteki gövde kullanılır.
+
+        Args:
+            url (str): Alınacak sayfanın URL'si.
+            timeout (int): Zaman aşımı süresi.
+
+        Returns:
+            str: Sayfanın HTML metni ya da None.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            if self.metrics:
+                self.metrics.inc("cache_hits_total", host=urlparse(url).netloc, kind="fresh")
+            return entry["text"]
+
+        for attempt in range(self.retries):
+            if not self.config.user_agents:
+                print("Hata: Kullanıcı ajanı bulunamadı.")
+                return None
+            
+            header = dict(random.choice(self.config.user_agents.get('user_agents', [])))
+            header.update(ResponseCache.conditional_headers(entry))
+            host = urlparse(url).netloc
+            status = retry_after = None
+            nbytes = 0
+            if self.rate_limiter:
+                self.rate_limiter.acquire(host)
+            started = time.perf_counter()
+            try:
+                if attempt >= 3:
+                    print(f"{attempt + 1}. deneme: {url}")
+                response = self.session.get(replay_url(self.replay_base, url), headers=header, timeout=timeout)
+                status = response.status_code
+                nbytes = len(response.content)
+                retry_after = HostRateLimiter.parse_retry_after(response.headers.get("Retry-After"))
+                if self.recorder and status != 304:
+                    self.recorder.record(url, status, response.headers.get("Content-Type"), response.content)
+                response.raise_for_status()
+                if status == 304 and entry:
+                    self.cache.touch(url)
+                    if self.metrics:
+                        self.metrics.inc("cache_hits_total", host=host, kind="revalidated")
+                    if self.recorder:
+                        self.recorder.record(url, 200, "text/html; charset=utf-8", entry["text"].encode("utf-8"))
+                    return entry["text"]
+                text = response.text
+                if self.cache:
+                    self.cache.put(url, response.content, response.encoding,
+                                   response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                return text
+            
+            except Exception as e:
+                self.config.save_error_to_json(e)
+            finally:
+                if self.rate_limiter:
+                    self.rate_limiter.release(host, status, retry_after)
+                if self.metrics:
+                    self.metrics.record_response(host, status, time.perf_counter() - started, nbytes, attempt)
+
+            # Hız sınırlayıcı varsa geri çekilmeyi o yapar; sabit bekleme yalnızca sınırlayıcı yokken uygulanır.
+            if not self.rate_limiter:
+                time.sleep(self.delay)
+        return None
+
+    def close(self) -> None:
+        """
+        Paylaşılan HTTP oturumunu ve önbelleği kapatır.
+        """
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+        if self.recorder:
+            self.recorder.close()
+
+class AsyncPageFetcher:
+    def __init__(self, config: Config, retries: int = 5, delay: int = 2,
+                 concurrency: int = 200, per_host: int = 16, rate_limiter: HostRateLimiter = None,
+                 cache: ResponseCache = None, parser: str = "html.parser", recorder: ResponseRecorder = None,
+                 replay_base: str = None, metrics: CrawlMetrics = None, regions: bool = False):
+        """
+        AsyncPageFetcher sınıfını başlatır. İstekler arka planda çalışan tek bir
+        asyncio döngüsü üzerinden, host başına havuzlanmış keep-alive bağlantılarla yapılır.
+
+        Args:
+            config (Config): Config nesnesi.
+            retries (int): Yeniden deneme sayısı.
+            delay (int): Denemeler arasındaki gecikme süresi.
+            concurrency (int): Aynı anda uçuşta olabilecek en fazla istek sayısı.
+            per_host (int): Host başına açık tutulacak en fazla bağlantı sayısı.
+            rate_limiter (HostRateLimiter): Host başına uyarlanabilir hız sınırlayıcı; None ise sınırlama yapılmaz.
+            cache (ResponseCache): Kalıcı yanıt önbelleği; None ise önbellek kullanılmaz.
+            parser (str): HTML ayrıştırıcı: "html.parser", "lxml" ya da "selectolax".
+            recorder (ResponseRecorder): Verilirse alınan her yanıt derlemeye kaydedilir.
+            replay_base (str): Verilirse istekler bu adresteki yeniden oynatma sunucusuna yönlendirilir.
+            metrics (CrawlMetrics): Verilirse gecikme, durum kodu, boyut ve ayrıştırma süreleri kaydedilir.
+            regions (bool): True ise tanınan sitelerin sayfalarında yalnızca ürün listesi ve sayfalayıcı
+                bölgeleri ayrıştırılır.
+        """
+        self.config = config
+        self.retries = retries
+        self.delay = delay
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.cache = cache
+        self.parser = parser
+        self.recorder = recorder
+        self.replay_base = replay_base
+        self.metrics = metrics
+        self.regions = regions
+        self._session = None
+        self._semaphore = None
+        # Önbellek ve kayıt SQLite/dosya G/Ç'si yapar; döngüyü bekletmemek için tek bir disk iş parçacığında yürür.
+        self._disk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fetch-disk") \
+            if cache or recorder else None
+        import asyncio
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="AsyncPageFetcher", daemon=True)
+        self._thread.start()
+
+    async def _get_session(self):
+        """
+        aiohttp oturumunu ilk kullanımda, döngünün kendi iş parçacığında oluşturur.
+        """
+        if self._session is None:
+            import asyncio
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host,
+                                             keepalive_timeout=30, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _disk(self, function, *args):
+        """
+        Önbellek ya da kayıt işlemini disk iş parçacığında çalıştırıp sonucunu bekler.
+        """
+        return await self._loop.run_in_executor(self._disk_executor, partial(function, *args))
+
+    async def fetch_text(self, url: str, timeout: int = 15) -> str:
+        """
+        Belirtilen URL'nin HTML metnini asenkron olarak alır. Önbellekte kayıt varsa sunucuya
+        koşullu istek gönderilir ve 304 yanıtında önbellekteki gövde kullanılır.
+
+        Args:
+            url (str): Alınacak sayfanın URL'si.
+            timeout (int): Zaman aşımı süresi.
+
+        Returns:
+            str: Sayfanın HTML metni ya da None.
+        """
+        import asyncio
+        import aiohttp
+        entry = await self._disk(self.cache.get, url) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            if self.metrics:
+                self.metrics.inc("cache_hits_total", host=urlparse(url).netloc, kind="fresh")
+            return entry["text"]
+
+        session = await self._get_session()
+        for attempt in range(self.retries):
+            if not self.config.user_agents:
+                print("Hata: Kullanıcı ajanı bulunamadı.")
+                return None
+
+            header = dict(random.choice(self.config.user_agents.get('user_agents', [])))
+            header.update(ResponseCache.conditional_headers(entry))
+            host = urlparse(url).netloc
+            status = retry_after = None
+            nbytes = 0
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(host)
+            started = time.perf_counter()
+            try:
+                if attempt >= 3:
+                    print(f"{attempt + 1}. deneme: {url}")
+                async with self._semaphore:
+                    async with session.get(replay_url(self.replay_base, url), headers=header,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        status = response.status
+                        retry_after = HostRateLimiter.parse_retry_after(response.headers.get("Retry-After"))
+                        if self.recorder and status >= 400:
+                            await self._disk(self.recorder.record, url, status, response.headers.get("Content-Type"),
+                                             await response.read())
+                        response.raise_for_status()
+                        if status == 304 and entry:
+                            await self._disk(self.cache.touch, url)
+                            if self.metrics:
+                                self.metrics.inc("cache_hits_total", host=host, kind="revalidated")
+                            if self.recorder:
+                                await self._disk(self.recorder.record, url, 200, "text/html; charset=utf-8",
+                                                 entry["text"].encode("utf-8"))
+                            return entry["text"]
+                        content = await response.read()
+                        nbytes = len(content)
+                        encoding = response.get_encoding()
+                        if self.recorder:
+                            await self._disk(self.recorder.record, url, status, response.headers.get("Content-Type"),
+                                             content)
+                        if self.cache:
+                            await self._disk(self.cache.put, url, content, encoding,
+                                             response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                        return content.decode(encoding, errors="replace")
+
+            except Exception as e:
+                self.config.save_error_to_json(e)
+            finally:
+                if self.rate_limiter:
+                    self.rate_limiter.release(host, status, retry_after)
+                if self.metrics:
+                    self.metrics.record_response(host, status, time.perf_counter() - started, nbytes, attempt)
+
+            if not self.rate_limiter:
+                await asyncio.sleep(self.delay)
+        return None
+
+    def fetch(self, url: str, timeout: int = 15) -> "bea":
+        """
+        Belirtilen URL'den sayfayı alır. PageFetcher.fetch ile aynı sözleşmeye sahiptir;
+        ağ beklemesi olay döngüsünde, ayrıştırma ise çağıran iş parçacığında yapılır.
+
+        Args:
+            url (str): Alınacak sayfanın URL'si.
+            timeout (int): Zaman aşımı süresi.
+
+        Returns:
+            BeautifulSoup: Alınan sayfanın BeautifulSoup nesnesi.
+        """
+        text = self.fetch_text_future(url, timeout).result()
+        if text is None:
+            return None
+        return self.parse(url, text)
+
+    def parse(self, url: str, text: str):
+        """
+        Sayfa metnini seçili ayrıştırıcıyla ağaca çevirir ve süresini kaydeder.
+        """
+        started = time.perf_counter()
+        soup = parse_html(text, self.parser, SITE_HOSTS.get(urlparse(url).netloc) if self.regions else None)
+        if self.metrics:
+            self.metrics.observe("parse_seconds", time.perf_counter() - started, PARSE_BUCKETS, host=urlparse(url).netloc)
+        return soup
+
+    def fetch_many(self, urls: list, timeout: int = 15) -> list:
+        """
+        Birden fazla URL'yi aynı anda alır. Sonuçlar verilen URL sırasıyla döner.
+
+        Args:
+            urls (list): Alınacak sayfaların URL'leri.
+            timeout (int): Zaman aşımı süresi.
+
+        Returns:
+            list: Her URL için BeautifulSoup nesnesi ya da None.
+        """
+        return list(self.fetch_iter(urls, timeout))
+
+    def fetch_text_future(self, url: str, timeout: int = 15):
+        """
+        URL'nin alınmasını olay döngüsünde başlatır ve iş parçacığı bloklamadan beklenebilecek bir Future döndürür.
+
+        Returns:
+            concurrent.futures.Future: Sonucu fetch_text'in döndürdüğü metin olan Future.
+        """
+        return self.submit(self.fetch_text(url, timeout))
+
+    def fetch_iter(self, urls: list, timeout: int = 15, window: int = 32):
+        """
+        Birden fazla URL'yi aynı anda başlatır; sonuçları URL sırasıyla, hazır oldukça verir.
+
+        Args:
+            urls (list): Alınacak sayfaların URL'leri.
+            timeout (int): Zaman aşımı süresi.
+            window (int): Aynı anda alınan ya da tüketilmeyi bekleyen en fazla sayfa sayısı.
+
+        Yields:
+            BeautifulSoup: Her URL için BeautifulSoup nesnesi ya da None.
+        """
+        for url, text in windowed_results(urls, lambda url: self.fetch_text_future(url, timeout), window):
+            yield self.parse(url, text) if text is not None else None
+
+    def submit(self, coroutine):
+        """
+        Eşyordamı fetcher'ın olay döngüsünde çalıştırır.
+
+        Returns:
+            concurrent.futures.Future: Eşyordamın sonucunu taşıyan Future.
+        """
+        import asyncio
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def close(self) -> None:
+        """
+        aiohttp oturumunu ve önbelleği kapatır, olay döngüsünü durdurur.
+        """
+        if self._session is not None:
+            import asyncio
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        if self._disk_executor:
+            self._disk_executor.shutdown()
+        if self.cache:
+            self.cache.close()
+        if self.recorder:
+            self.recorder.close()
+
+PRODUCT_COLUMNS = ["isim", "Fiyat", "Üretici", "Link", "Özellikler"]
+
+class CategoryWriter:
+    def __init__(self, path: str, output_format: str = "csv"):
+        """
+        Bir kategorinin ürünlerini sayfa sayfa diske ekleyen akış yazıcısı.
+
+        Satırlar sabit PRODUCT_COLUMNS şemasıyla "<dosya>.part" dosyasına yazılır ve her sayfadan
+        sonra diske boşaltılır; kategori bitince dosya asıl adına taşınır. Çökme durumunda o ana
+        kadar yazılan sayfalar .part dosyasında kalır.
+
+        Args:
+            path (str): Çıktı dosyasının yolu.
+            output_format (str): "csv" ya da "parquet".
+        """
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.output_format = output_format
+        self.rows_written = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if output_format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._schema = pa.schema([(column, pa.string()) for column in PRODUCT_COLUMNS])
+            self._file = pq.ParquetWriter(self.part_path, self._schema)
+        else:
+            self._file = open(self.part_path, "w", newline="", encoding="utf-8-sig")
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(PRODUCT_COLUMNS)
+
+    @staticmethod
+    def to_row(product: dict) -> list:
+        """
+        Ürün sözlüğünü sabit şemaya oturtur; şema dışındaki alanlar (ör. sinerji'nin teknik
+        özellikleri) Özellikler sütununda JSON olarak saklanır.
+        """
+        extras = {key: value for key, value in product.items() if key not in PRODUCT_COLUMNS}
+        return [product.get("isim"), product.get("Fiyat"), product.get("Üretici"), product.get("Link"),
+                json.dumps(extras, ensure_ascii=False) if extras else ""]
+
+    def write_rows(self, products: list) -> None:
+        """
+        Bir sayfanın ürünlerini ekler ve diske boşaltır.
+
+        Args:
+            products (list): Ürün bilgilerini içeren sözlükler.
+        """
+        if not products:
+            return
+        rows = [self.to_row(product) for product in products]
+        if self.output_format == "parquet":
+            import pyarrow as pa
+            self._file.write_table(pa.Table.from_arrays(
+                [pa.array(column, pa.string()) for column in zip(*rows)], schema=self._schema))
+        else:
+            self._csv.writerows(rows)
+            self._file.flush()
+        self.rows_written += len(rows)
+
+    def close(self, completed: bool = True) -> None:
+        """
+        Dosyayı kapatır. Kategori tamamlandıysa .part dosyası asıl adına taşınır; hiç ürün
+        yazılmadıysa dosya silinir.
+
+        Args:
+            completed (bool): Kategorinin tüm sayfaları işlendiyse True.
+        """
+        self._file.close()
+        if not self.rows_written:
+            os.remove(self.part_path)
+        elif completed:
+            os.replace(self.part_path, self.path)
+
+class ProductWriter:
+    def __init__(self, main_directory: str, formatli_tarih_saat: str, output_format: str = "csv"):
+        """
+        Site/kategori başına CategoryWriter açan çıktı yöneticisi.
+
+        Args:
+            main_directory (str): Çalıştırmanın ana çıktı dizini.
+            formatli_tarih_saat (str): Dizin ve dosya adlarında kullanılan zaman damgası.
+            output_format (str): "csv" ya da "parquet".
+        """
+        self.main_directory = main_directory
+        self.formatli_tarih_saat = formatli_tarih_saat
+        self.output_format = output_format
+
+    def open(self, site_name: str, category_name: str) -> CategoryWriter:
+        """
+        Kategori için yeni bir akış yazıcısı açar.
+
+        Returns:
+            CategoryWriter: Sayfa sayfa satır eklenecek yazıcı.
+        """
+        timestamp_directory = f"{site_name}_{self.formatli_tarih_saat}"
+        extension = "parquet" if self.output_format == "parquet" else "csv"
+        path = os.path.join(self.main_directory, timestamp_directory, f"{site_name}_{category_name}.{extension}")
+        return CategoryWriter(path, self.output_format)
+
+    def close(self) -> None:
+        """
+        Kategori yazıcıları kendi dosyalarını kapattığından yapacak iş yoktur; PriceHistoryStore ile arayüz uyumu için vardır.
+        """
+
+def parse_price_kurus(price: str) -> int:
+    """
+    Türkçe yazımlı fiyatı ("1.234,56") kuruş cinsinden tamsayıya çevirir.
+
+    Returns:
+        int: Kuruş cinsinden fiyat; fiyat okunamazsa None.
+    """
+    digits = re.sub(r"[^0-9,]", "", price or "")
+    if not digits or not any(char.isdigit() for char in digits):
+        return None
+    lira, _, kurus = digits.partition(",")
+    return int(lira or 0) * 100 + int((kurus + "00")[:2])
+
+class PriceHistoryWriter:
+    def __init__(self, store, site_name: str, category_name: str):
+        """
+        Bir kategorinin sayfalarını PriceHistoryStore'a toplu ekleyen yazıcı; CategoryWriter ile aynı arayüze sahiptir.
+        """
+        self.store = store
+        self.site_name = site_name
+        self.category_name = category_name
+        self.rows_written = 0
+
+    def write_rows(self, products: list) -> None:
+        if products:
+            self.store.insert_page(self.site_name, self.category_name, products)
+            self.rows_written += len(products)
+
+    def close(self, completed: bool = True) -> None:
+        pass
+
+class PriceHistoryStore:
+    def __init__(self, path: str = history_db_path, crawled_at: str = None):
+        """
+        Tüm çalıştırmaların fiyatlarını tek bir gömülü SQLite veritabanında tutan depolama arka ucu.
+
+        Her sayfa tek bir işlemde toplu eklenir. Link, site/kategori ve zaman sütunlarında
+        indeks bulunur; latest_prices, price_history ve category_snapshot sorguları bu
+        indeksleri kullanır.
+
+        Args:
+            path (str): Veritabanı dosyasının yolu.
+            crawled_at (str): Bu çalıştırmanın ISO-8601 zaman damgası; verilmezse şimdiki zaman.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.crawled_at = crawled_at or datetime.now().isoformat(timespec="seconds")
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS prices (
+                id INTEGER PRIMARY KEY,
+                crawled_at TEXT NOT NULL,
+                site TEXT NOT NULL,
+                category TEXT NOT NULL,
+                link TEXT NOT NULL,
+                isim TEXT,
+                uretici TEXT,
+                fiyat_kurus INTEGER,
+                fiyat_metin TEXT,
+                ozellikler TEXT
+            );
+            CREATE INDEX IF NOT EXISTS prices_link ON prices (link, crawled_at);
+            CREATE INDEX IF NOT EXISTS prices_scope ON prices (site, category, crawled_at);
+            CREATE INDEX IF NOT EXISTS prices_crawled_at ON prices (crawled_at);
+        """)
+        self.connection.commit()
+
+    def open(self, site_name: str, category_name: str) -> PriceHistoryWriter:
+        """
+        ProductWriter.open ile aynı şekilde kategori yazıcısı döndürür.
+        """
+        return PriceHistoryWriter(self, site_name, category_name)
+
+    def insert_page(self, site_name: str, category_name: str, products: list) -> None:
+        """
+        Bir sayfanın ürünlerini tek işlemde ekler.
+        """
+        rows = []
+        for product in products:
+            row = CategoryWriter.to_row(product)
+            rows.append((self.crawled_at, site_name, category_name, row[3] or "", row[0], row[2],
+                         parse_price_kurus(row[1]), row[1], row[4] or None))
+        with self.lock:
+            self.connection.executemany(
+                "INSERT INTO prices (crawled_at, site, category, link, isim, uretici, fiyat_kurus, fiyat_metin, ozellikler) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.connection.commit()
+
+    def _query(self, sql: str, parameters: tuple) -> list:
+        with self.lock:
+            return [dict(row) for row in self.connection.execute(sql, parameters).fetchall()]
+
+    def latest_prices(self, site_name: str = None, category_name: str = None) -> list:
+        """
+        Her ürünün en son kaydedilen fiyatını döndürür; site ve kategoriye göre süzülebilir.
+
+        Returns:
+            list: Ürün başına bir satır (sözlük).
+        """
+        conditions, parameters = [], []
+        if site_name:
+            conditions.append("site = ?")
+            parameters.append(site_name)
+        if category_name:
+            conditions.append("category = ?")
+            parameters.append(category_name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._query(
+            f"SELECT * FROM prices WHERE id IN (SELECT MAX(id) FROM prices {where} GROUP BY link) "
+            f"ORDER BY site, category, isim", tuple(parameters))
+
+    def price_history(self, link: str) -> list:
+        """
+        Bir ürünün tüm fiyat geçmişini zamana göre sıralı döndürür.
+        """
+        return self._query("SELECT crawled_at, site, category, isim, fiyat_kurus, fiyat_metin FROM prices "
+                           "WHERE link = ? ORDER BY crawled_at", (link,))
+
+    def category_snapshot(self, site_name: str, category_name: str, crawled_at: str = None) -> list:
+        """
+        Bir site/kategorinin verilen zamandaki (verilmezse en son) tam görüntüsünü döndürür.
+        """
+        if crawled_at is None:
+            latest = self._query("SELECT MAX(crawled_at) AS crawled_at FROM prices WHERE site = ? AND category = ?",
+                                 (site_name, category_name))
+            crawled_at = latest[0]["crawled_at"]
+        return self._query("SELECT * FROM prices WHERE site = ? AND category = ? AND crawled_at = ? ORDER BY id",
+                           (site_name, category_name, crawled_at))
+
+    def close(self) -> None:
+        """
+        Veritabanı bağlantısını kapatır.
+        """
+        with self.lock:
+            self.connection.close()
+
+class IncrementalTracker:
+    def __init__(self, state_path: str, delta_path: str):
+        """
+        Ürünlerin son bilinen durumunu Link anahtarıyla saklar ve yalnızca değişiklikleri
+        (yeni ürün, fiyat değişimi, kaybolan ürün) JSON Lines delta akışına yazar.
+
+        Kaybolan ürünler yalnızca tüm sayfaları hatasız taranan kategoriler için bildirilir;
+        böylece yarıda kalan bir kategori yanlış "removed" kayıtları üretmez. Durum dosyası kuyruk
+        işçileri arasında paylaşılabilir: WAL kipinde açılır ve her sayfa tek bir yazma işleminde işlenir.
+
+        Args:
+            state_path (str): Durum veritabanının (SQLite) yolu; çalıştırmalar arasında korunur.
+            delta_path (str): Bu çalıştırmanın delta dosyasının yolu.
+        """
+        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+        os.makedirs(os.path.dirname(delta_path) or ".", exist_ok=True)
+        self.run_id = datetime.now().isoformat()
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(state_path, timeout=60, check_same_thread=False)
+        # WAL'a geçiş okuma kilidini yükseltir; meşgul zaman aşımı bunu kapsamadığı için, aynı anda açılan
+        # işçilerde kısa aralıklarla yeniden denenir.
+        for attempt in range(600):
+            try:
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                break
+            except sqlite3.OperationalError:
+                if attempt == 599:
+                    raise
+                time.sleep(0.1)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS products ("
+            "link TEXT PRIMARY KEY, site TEXT, category TEXT, isim TEXT, fiyat TEXT, uretici TEXT, "
+            "first_seen TEXT, last_seen TEXT)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS products_scope ON products (site, category)")
+        self.connection.commit()
+        self.delta_path = delta_path
+        self.delta_file = open(delta_path, "a", encoding="utf-8")
+        self.counts = {"insert": 0, "price_change": 0, "removed": 0}
+
+    def _emit(self, change: str, site_name: str, category_name: str, product: dict, old_price: str = None) -> None:
+        record = {"type": change, "site": site_name, "category": category_name,
+                  "Link": product.get("Link"), "isim": product.get("isim"), "Fiyat": product.get("Fiyat"),
+                  "Üretici": product.get("Üretici"), "timestamp": self.run_id}
+        if change == "price_change":
+            record["eski_fiyat"] = old_price
+        self.delta_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.counts[change] += 1
+
+    def observe(self, site_name: str, category_name: str, products: list) -> None:
+        """
+        Bir sayfanın ürünlerini son bilinen durumla karşılaştırır ve değişiklikleri yazar.
+
+        Args:
+            site_name (str): Site adı.
+            category_name (str): Kategori adı.
+            products (list): Sayfadan çıkarılan ürünler.
+        """
+        with self.lock:
+            # Okuma ve yazma aynı işlemde: başka bir işçi arada aynı ürünü ekleyemez.
+            self.connection.execute("BEGIN IMMEDIATE")
+            for product in products:
+                link = product.get("Link")
+                if not link:
+                    continue
+                previous = self.connection.execute("SELECT fiyat FROM products WHERE link = ?", (link,)).fetchone()
+                if previous is None:
+                    self._emit("insert", site_name, category_name, product)
+                    self.connection.execute("INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                            (link, site_name, category_name, product.get("isim"), product.get("Fiyat"),
+                                             product.get("Üretici"), self.run_id, self.run_id))
+                    continue
+                if previous[0] != product.get("Fiyat"):
+                    self._emit("price_change", site_name, category_name, product, previous[0])
+                self.connection.execute(
+                    "UPDATE products SET site = ?, category = ?, isim = ?, fiyat = ?, uretici = ?, last_seen = ? "
+                    "WHERE link = ?", (site_name, category_name, product.get("isim"), product.get("Fiyat"),
+                                       product.get("Üretici"), self.run_id, link))
+            self.connection.commit()
+            self.delta_file.flush()
+
+    def finish_category(self, site_name: str, category_name: str) -> None:
+        """
+        Tamamen taranan kategoride bu çalıştırmada görülmeyen ürünleri "removed" olarak yazar
+        ve durumdan siler.
+        """
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            rows = self.connection.execute(
+                "SELECT link, isim, fiyat, uretici FROM products WHERE site = ? AND category = ? AND last_seen != ?",
+                (site_name, category_name, self.run_id)).fetchall()
+            for link, isim, fiyat, uretici in rows:
+                self._emit("removed", site_name, category_name,
+                           {"Link": link, "isim": isim, "Fiyat": fiyat, "Üretici": uretici})
+            self.connection.executemany("DELETE FROM products WHERE link = ?", [(row[0],) for row in rows])
+            self.connection.commit()
+            self.delta_file.flush()
+
+    def close(self) -> None:
+        """
+        Delta dosyasını ve durum veritabanını kapatır.
+        """
+        with self.lock:
+            self.delta_file.close()
+            self.connection.close()
+
+class CrawlJournal:
+    def __init__(self, path: str = f"{state_dir_path}crawl_journal.sqlite", resume: bool = False, stamp: str = None):
+        """
+        Tamamlanan (site, kategori, sayfa) birimlerini çıkarılan satırlarıyla birlikte kalıcı olarak kaydeder.
+
+        --resume ile açıldığında son yarım kalan çalıştırmaya bağlanır: bitmiş kategoriler atlanır,
+        yarım kategorilerde kayıtlı sayfalar ağdan alınmadan günlükten yazılır ve yalnızca kalan
+        sayfalar yeniden kuyruğa girer. Çalıştırma tüm kategorileri bitirdiğinde satırlar silinir.
+        Yalnızca son çalıştırmaya devam edilebildiği için yeni bir çalıştırma başlarken önceki
+        çalıştırmaların (bitmemiş olanlar dahil) tüm kayıtları silinir; günlük her kusurlu taramada büyümez.
+
+        Args:
+            path (str): Günlük veritabanının yolu.
+            resume (bool): True ise son yarım kalan çalıştırmaya devam edilir.
+            stamp (str): Yeni çalıştırmanın zaman damgası; verilmezse şimdiki saat (%m-%d_%H).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT, stamp TEXT, started_at TEXT, finished_at TEXT);
+            CREATE TABLE IF NOT EXISTS pages (
+                run_id INTEGER, site TEXT, category TEXT, page INTEGER, total_pages INTEGER, rows BLOB,
+                PRIMARY KEY (run_id, site, category, page));
+            CREATE TABLE IF NOT EXISTS categories (
+                run_id INTEGER, site TEXT, category TEXT, PRIMARY KEY (run_id, site, category));
+        """)
+        previous = self.connection.execute(
+            "SELECT run_id, stamp FROM runs WHERE finished_at IS NULL ORDER BY run_id DESC LIMIT 1").fetchone() if resume else None
+        self.resumed = previous is not None
+        if self.resumed:
+            self.run_id, self.stamp = previous
+        else:
+            if resume:
+                print("Devam edilecek yarım çalıştırma bulunamadı; yeni tarama başlatılıyor.")
+            self.connection.execute("DELETE FROM pages")
+            self.connection.execute("DELETE FROM categories")
+            self.connection.execute("DELETE FROM runs")
+            self.stamp = stamp or datetime.now().strftime("%m-%d_%H")
+            self.run_id = self.connection.execute("INSERT INTO runs (stamp, started_at) VALUES (?, ?)",
+                                                  (self.stamp, datetime.now().isoformat())).lastrowid
+        self.connection.commit()
+
+    def is_category_done(self, site_name: str, category_name: str) -> bool:
+        with self.lock:
+            return self.connection.execute(
+                "SELECT 1 FROM categories WHERE run_id = ? AND site = ? AND category = ?",
+                (self.run_id, site_name, category_name)).fetchone() is not None
+
+    def completed_pages(self, site_name: str, category_name: str) -> dict:
+        """
+        Kategorinin günlükte kayıtlı sayfalarını döndürür.
+
+        Returns:
+            dict: Sayfa numarası -> o sayfada kaydedilen toplam sayfa sayısı.
+        """
+        with self.lock:
+            return dict(self.connection.execute(
+                "SELECT page, total_pages FROM pages WHERE run_id = ? AND site = ? AND category = ?",
+                (self.run_id, site_name, category_name)).fetchall())
+
+    def load_rows(self, site_name: str, category_name: str, page_num: int) -> list:
+        """
+        Günlükteki bir sayfanın çıkarılmış ürünlerini döndürür.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT rows FROM pages WHERE run_id = ? AND site = ? AND category = ? AND page = ?",
+                (self.run_id, site_name, category_name, page_num)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def record_page(self, site_name: str, category_name: str, page_num: int, total_pages: int, products: list) -> None:
+        """
+        Sayfayı ürünleriyle birlikte tamamlanmış olarak kaydeder.
+        """
+        rows = zlib.compress(json.dumps(products, ensure_ascii=False).encode("utf-8"))
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                                    (self.run_id, site_name, category_name, page_num, total_pages, rows))
+            self.connection.commit()
+
+    def finish_category(self, site_name: str, category_name: str) -> None:
+        """
+        Kategoriyi tamamlanmış olarak işaretler.
+        """
+        with self.lock:
+            self.connection.execute("INSERT OR IGNORE INTO categories VALUES (?, ?, ?)",
+                                    (self.run_id, site_name, category_name))
+            self.connection.commit()
+
+    def finish_run(self, total_categories: int) -> bool:
+        """
+        Tüm kategoriler tamamlandıysa çalıştırmayı kapatır ve günlükteki satırları siler.
+
+        Returns:
+            bool: Çalıştırma kapatıldıysa True; yarım kategori kaldıysa False.
+        """
+        with self.lock:
+            done = self.connection.execute("SELECT COUNT(*) FROM categories WHERE run_id = ?",
+                                           (self.run_id,)).fetchone()[0]
+            if done < total_categories:
+                return False
+            self.connection.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?",
+                                    (datetime.now().isoformat(), self.run_id))
+            self.connection.execute("DELETE FROM pages WHERE run_id = ?", (self.run_id,))
+            self.connection.commit()
+            return True
+
+    def close(self) -> None:
+        """
+        Günlük bağlantısını kapatır.
+        """
+        with self.lock:
+            self.connection.close()
+
+class ListingPage:
+    def __init__(self, url: str, fingerprint: str, soup=None, total_pages: int = None, products: list = None):
+        """
+        Parmak izi etkinken sayfa alıcısının döndürdüğü sayfa: ya yeni ayrıştırılmış ağacı ya da
+        içeriği değişmediği için önceki çalıştırmadan alınan toplam sayfa sayısı ve ürünleri taşır.
+        WebScraper.get_total_pages ve extract_products her iki durumu da tanır.
+        """
+        self.url = url
+        self.fingerprint = fingerprint
+        self.soup = soup
+        self.total_pages = total_pages
+        self.products = products
+
+    @property
+    def unchanged(self) -> bool:
+        return self.soup is None
+
+class FingerprintStore:
+    def __init__(self, path: str = f"{state_dir_path}fingerprints.sqlite"):
+        """
+        URL başına ürün listesi bölgesinin parmak izini ve o içerikten çıkarılan satırları saklar.
+
+        Sayfa içeriği önceki çalıştırmayla aynıysa satırlar buradan alınır ve ayrıştırma atlanır.
+
+        Args:
+            path (str): Veritabanı dosyasının yolu.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY, fingerprint TEXT, total_pages INTEGER, rows BLOB, updated_at TEXT)""")
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, fingerprint: str) -> ListingPage:
+        """
+        Parmak izi kayıtlı olanla aynıysa saklanan satırları taşıyan ListingPage, değilse None döndürür.
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT total_pages, rows FROM pages WHERE url = ? AND fingerprint = ?",
+                                          (url, fingerprint)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return ListingPage(url, fingerprint, total_pages=row[0], products=json.loads(zlib.decompress(row[1])))
+
+    def put(self, url: str, fingerprint: str, total_pages: int, products: list) -> None:
+        rows = zlib.compress(json.dumps(products, ensure_ascii=False).encode("utf-8"))
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                                    (url, fingerprint, total_pages, rows, datetime.now().isoformat()))
+            self.connection.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+class SqliteWorkQueue:
+    def __init__(self, path: str = f"{state_dir_path}work_queue.sqlite", visibility_timeout: float = 120.0,
+                 max_attempts: int = 5):
+        """
+        (site, kategori, sayfa) görevlerini kiralama (lease) ile dağıtan SQLite tabanlı iş kuyruğu.
+
+        Aynı dosyayı açan birden fazla süreç görev kiralar; kiralanan görev visibility_timeout
+        içinde onaylanmazsa (ack) yeniden kiralanabilir hale gelir, max_attempts denemeden sonra
+        başarısız sayılır. Sayfa 1 onaylanırken kalan sayfalar kuyruğa eklenir; bir kategorinin
+        tüm sayfaları bittiğinde claim_completed ile tek bir işçi kategoriyi çıktıya yazar.
+
+        Args:
+            path (str): Kuyruk veritabanının yolu (işçiler arasında paylaşılır).
+            visibility_timeout (float): Kiralanan görevin onaylanması için tanınan süre (saniye).
+            max_attempts (int): Bir görevin en fazla kaç kez kiralanacağı.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS categories (
+                site TEXT, category TEXT, url TEXT, total_pages INTEGER, exported INTEGER DEFAULT 0,
+                PRIMARY KEY (site, category));
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, site TEXT, category TEXT, page INTEGER, url TEXT,
+                state TEXT DEFAULT 'pending', token TEXT, worker TEXT, lease_until REAL DEFAULT 0,
+                attempts INTEGER DEFAULT 0, rows BLOB, UNIQUE (site, category, page));
+            CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, site);
+        """)
+
+    @property
+    def stamp(self) -> str:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+        return row[0] if row else None
+
+    def _transaction(self, work):
+        """
+        work(connection) fonksiyonunu yazma kilidi alınmış tek bir işlem içinde çalıştırır.
+        """
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(self.connection)
+                self.connection.execute("COMMIT")
+                return result
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def seed(self, links: dict, stamp: str) -> None:
+        """
+        Kuyruğu boşaltıp links.json'daki her kategorinin ilk sayfasını görev olarak ekler.
+        """
+        def work(connection):
+            connection.execute("DELETE FROM tasks")
+            connection.execute("DELETE FROM categories")
+            connection.execute("INSERT OR REPLACE INTO meta VALUES ('stamp', ?)", (stamp,))
+            for site_name, site_categories in links.items():
+                site_name = site_name.lower().strip()
+                for url, category_name in site_categories.items():
+                    connection.execute("INSERT OR IGNORE INTO categories (site, category, url) VALUES (?, ?, ?)",
+                                       (site_name, category_name, url))
+                    connection.execute("INSERT OR IGNORE INTO tasks (site, category, page, url) VALUES (?, ?, 1, ?)",
+                                       (site_name, category_name, url))
+        self._transaction(work)
+
+    def lease(self, worker_id: str, limit: int, sites: list = None) -> list:
+        """
+        En fazla limit görevi worker_id adına kiralar; süresi dolmuş kiralar da yeniden dağıtılır.
+
+        Args:
+            worker_id (str): İşçinin adı (yalnızca izleme için saklanır).
+            limit (int): Kiralanacak en fazla görev sayısı.
+            sites (list): Verilirse yalnızca bu sitelerin görevleri kiralanır.
+
+        Returns:
+            list: id, site, category, page, url, token anahtarlı görev sözlükleri.
+        """
+        site_filter = f" AND site IN ({', '.join('?' * len(sites))})" if sites else ""
+        site_args = list(sites or [])
+
+        def work(connection):
+            now = time.time()
+            connection.execute("UPDATE tasks SET state = 'failed', token = NULL "
+                               "WHERE state = 'leased' AND lease_until < ? AND attempts >= ?", (now, self.max_attempts))
+            rows = connection.execute(
+                "SELECT id, site, category, page, url FROM tasks "
+                "WHERE (state = 'pending' OR (state = 'leased' AND lease_until < ?))" + site_filter +
+                " ORDER BY page, id LIMIT ?", [now] + site_args + [limit]).fetchall()
+            tasks = []
+            for task_id, site_name, category_name, page_num, url in rows:
+                token = os.urandom(8).hex()
+                connection.execute("UPDATE tasks SET state = 'leased', token = ?, worker = ?, lease_until = ?, "
+                                   "attempts = attempts + 1 WHERE id = ?",
+                                   (token, worker_id, now + self.visibility_timeout, task_id))
+                tasks.append({"id": task_id, "site": site_name, "category": category_name,
+                              "page": page_num, "url": url, "token": token})
+            return tasks
+        return self._transaction(work)
+
+    def ack(self, task: dict, products: list, total_pages: int = None, next_pages: list = (),
+            done_pages: list = ()) -> bool:
+        """
+        Görevi ürünleriyle birlikte tamamlanmış olarak onaylar.
+
+        Args:
+            task (dict): lease ile alınan görev.
+            products (list): Sayfadan çıkarılan ürünler.
+            total_pages (int): Sayfa 1 için kategorinin toplam sayfa sayısı.
+            next_pages (list): Sayfa 1 için kuyruğa eklenecek (sayfa, url) çiftleri.
+            done_pages (list): Sayfa 1 işlenirken zaten alınmış (ör. son sayfa yoklanırken) sayfalar için
+                (sayfa, url, ürünler) üçlüleri; kuyruğa tamamlanmış olarak eklenir.
+
+        Returns:
+            bool: Kira hâlâ bu işçideyse True; süresi dolup başkasına geçtiyse False.
+        """
+        rows = zlib.compress(json.dumps(products, ensure_ascii=False).encode("utf-8"))
+
+        def work(connection):
+            updated = connection.execute(
+                "UPDATE tasks SET state = 'done', token = NULL, rows = ? WHERE id = ? AND token = ? AND state = 'leased'",
+                (rows, task["id"], task["token"])).rowcount
+            if not updated:
+                return False
+            if total_pages is not None:
+                connection.execute("UPDATE categories SET total_pages = ? WHERE site = ? AND category = ?",
+                                   (total_pages, task["site"], task["category"]))
+                connection.executemany(
+                    "INSERT OR IGNORE INTO tasks (site, category, page, url) VALUES (?, ?, ?, ?)",
+                    [(task["site"], task["category"], page_num, url) for page_num, url in next_pages])
+                connection.executemany(
+                    "INSERT OR IGNORE INTO tasks (site, category, page, url, state, rows) VALUES (?, ?, ?, ?, 'done', ?)",
+                    [(task["site"], task["category"], page_num, url,
+                      zlib.compress(json.dumps(page_products, ensure_ascii=False).encode("utf-8")))
+                     for page_num, url, page_products in done_pages])
+            return True
+        return self._transaction(work)
+
+    def fail(self, task: dict) -> bool:
+        """
+        Görevi başarısız bildirir; deneme hakkı kaldıysa yeniden kuyruğa döner.
+
+        Returns:
+            bool: Kira hâlâ bu işçideyse True.
+        """
+        def work(connection):
+            return connection.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "token = NULL, lease_until = 0 WHERE id = ? AND token = ? AND state = 'leased'",
+                (self.max_attempts, task["id"], task["token"])).rowcount > 0
+        return self._transaction(work)
+
+    def claim_completed(self, sites: list = None) -> list:
+        """
+        Tüm sayfaları biten (ya da ilk sayfası kalıcı olarak başarısız olan) kategorileri yazılmak üzere sahiplenir.
+
+        Her kategori yalnızca bir kez, tek bir işçiye döndürülür.
+
+        Returns:
+            list: (site, kategori) çiftleri.
+        """
+        site_filter = f" AND c.site IN ({', '.join('?' * len(sites))})" if sites else ""
+
+        def work(connection):
+            completed = connection.execute(
+                "SELECT c.site, c.category FROM categories c WHERE c.exported = 0" + site_filter + " AND ("
+                "(c.total_pages IS NOT NULL AND (SELECT COUNT(*) FROM tasks t WHERE t.site = c.site "
+                "AND t.category = c.category AND t.state IN ('done', 'failed')) >= c.total_pages) "
+                "OR EXISTS (SELECT 1 FROM tasks t WHERE t.site = c.site AND t.category = c.category "
+                "AND t.page = 1 AND t.state = 'failed'))", list(sites or [])).fetchall()
+            connection.executemany("UPDATE categories SET exported = 1 WHERE site = ? AND category = ?", completed)
+            return completed
+        return self._transaction(work)
+
+    def results(self, site_name: str, category_name: str):
+        """
+        Kategorinin sayfa sonuçlarını sayfa sırasıyla verir.
+
+        Yields:
+            tuple: (sayfa, ürün listesi); başarısız sayfalarda ürün listesi None.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT page, state, rows FROM tasks WHERE site = ? AND category = ? ORDER BY page",
+                (site_name, category_name)).fetchall()
+        for page_num, state, rows_blob in rows:
+            yield page_num, json.loads(zlib.decompress(rows_blob)) if state == "done" else None
+
+    def is_drained(self, sites: list = None) -> bool:
+        """
+        Bekleyen ya da kirada olan görev kalmadıysa True döndürür.
+        """
+        site_filter = f" AND site IN ({', '.join('?' * len(sites))})" if sites else ""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT 1 FROM tasks WHERE state IN ('pending', 'leased')" + site_filter + " LIMIT 1",
+                list(sites or [])).fetchone() is None
+
+    def counts(self) -> dict:
+        """
+        Görev durumlarına göre sayıları döndürür.
+        """
+        with self.lock:
+            return dict(self.connection.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state").fetchall())
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+class RedisWorkQueue:
+    LEASE_SCRIPT = """
+        local p, now, deadline, limit, max_attempts = ARGV[1], tonumber(ARGV[2]), ARGV[3], tonumber(ARGV[4]), tonumber(ARGV[5])
+        for _, id in ipairs(redis.call('ZRANGEBYSCORE', p .. ':leased', '-inf', now)) do
+            redis.call('ZREM', p .. ':leased', id)
+            local key = p .. ':task:' .. id
+            local task = redis.call('HMGET', key, 'site', 'category', 'page', 'attempts')
+            if tonumber(task[4]) >= max_attempts then
+                redis.call('HSET', key, 'state', 'failed', 'token', '')
+                local cat = p .. ':cat:' .. task[1] .. '|' .. task[2]
+                redis.call('HINCRBY', cat, 'finished', 1)
+                if task[3] == '1' then redis.call('HSET', cat, 'failed_first', 1) end
+            else
+                redis.call('HSET', key, 'state', 'pending', 'token', '')
+                redis.call('RPUSH', p .. ':pending:' .. task[1], id)
+            end
+        end
+        local leased = {}
+        for i = 7, #ARGV do
+            while #leased < limit do
+                local id = redis.call('LPOP', p .. ':pending:' .. ARGV[i])
+                if not id then break end
+                local key = p .. ':task:' .. id
+                redis.call('HSET', key, 'state', 'leased', 'token', ARGV[6] .. #leased)
+                redis.call('HINCRBY', key, 'attempts', 1)
+                redis.call('ZADD', p .. ':leased', deadline, id)
+                table.insert(leased, id)
+            end
+        end
+        return leased
+    """
+    FINISH_SCRIPT = """
+        local p, id, token, state, max_attempts = ARGV[1], ARGV[2], ARGV[3], ARGV[4], tonumber(ARGV[5])
+        local key = p .. ':task:' .. id
+        local task = redis.call('HMGET', key, 'state', 'token', 'site', 'category', 'page', 'attempts')
+        if task[1] ~= 'leased' or task[2] ~= token then return 0 end
+        redis.call('ZREM', p .. ':leased', id)
+        local cat = p .. ':cat:' .. task[3] .. '|' .. task[4]
+        if state == 'failed' and tonumber(task[6]) < max_attempts then
+            redis.call('HSET', key, 'state', 'pending', 'token', '')
+            redis.call('RPUSH', p .. ':pending:' .. task[3], id)
+            return 1
+        end
+        redis.call('HSET', key, 'state', state, 'token', '')
+        redis.call('HINCRBY', cat, 'finished', 1)
+        if state == 'failed' then
+            if task[5] == '1' then redis.call('HSET', cat, 'failed_first', 1) end
+            return 1
+        end
+        redis.call('SET', p .. ':rows:' .. id, ARGV[6])
+        if ARGV[7] ~= '' then
+            redis.call('HSET', cat, 'total_pages', ARGV[7])
+            local next_end = 8 + tonumber(ARGV[8]) * 2
+            for i = 9, next_end, 2 do
+                local next_id = task[3] .. '|' .. task[4] .. '|' .. ARGV[i]
+                if redis.call('EXISTS', p .. ':task:' .. next_id) == 0 then
+                    redis.call('HSET', p .. ':task:' .. next_id, 'site', task[3], 'category', task[4], 'page', ARGV[i],
+                               'url', ARGV[i + 1], 'state', 'pending', 'attempts', 0)
+                    redis.call('RPUSH', p .. ':pending:' .. task[3], next_id)
+                end
+            end
+            for i = next_end + 1, #ARGV, 3 do
+                local done_id = task[3] .. '|' .. task[4] .. '|' .. ARGV[i]
+                if redis.call('EXISTS', p .. ':task:' .. done_id) == 0 then
+                    redis.call('HSET', p .. ':task:' .. done_id, 'site', task[3], 'category', task[4], 'page', ARGV[i],
+                               'url', ARGV[i + 1], 'state', 'done', 'attempts', 0)
+                    redis.call('SET', p .. ':rows:' .. done_id, ARGV[i + 2])
+                    redis.call('HINCRBY', cat, 'finished', 1)
+                end
+            end
+        end
+        return 1
+    """
+    CLAIM_SCRIPT = """
+        local p = ARGV[1]
+        local claimed = {}
+        for _, name in ipairs(redis.call('SMEMBERS', p .. ':cats')) do
+            local cat = p .. ':cat:' .. name
+            local state = redis.call('HMGET', cat, 'site', 'exported', 'total_pages', 'finished', 'failed_first')
+            local wanted = #ARGV == 1
+            for i = 2, #ARGV do if ARGV[i] == state[1] then wanted = true end end
+            if wanted and state[2] ~= '1' and ((state[3] and tonumber(state[4] or 0) >= tonumber(state[3])) or state[5] == '1') then
+                redis.call('HSET', cat, 'exported', 1)
+                table.insert(claimed, name)
+            end
+        end
+        return claimed
+    """
+
+    def __init__(self, url: str, visibility_timeout: float = 120.0, max_attempts: int = 5,
+                 prefix: str = "techcrawler:queue"):
+        """
+        SqliteWorkQueue ile aynı arayüze sahip, Redis uyumlu bir sunucu üzerinde çalışan iş kuyruğu.
+
+        Farklı makinelerdeki işçiler aynı sunucuyu paylaşır. Kiralama, onay ve tamamlanan kategori
+        sahiplenme işlemleri Lua betikleriyle atomik olarak yürütülür. redis paketi gerektirir.
+
+        Args:
+            url (str): redis://host:port/db biçiminde sunucu adresi.
+            visibility_timeout (float): Kiralanan görevin onaylanması için tanınan süre (saniye).
+            max_attempts (int): Bir görevin en fazla kaç kez kiralanacağı.
+            prefix (str): Anahtar öneki; aynı sunucuda birden fazla kuyruk ayırmak için.
+        """
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.prefix = prefix
+        self._lease = self.client.register_script(self.LEASE_SCRIPT)
+        self._finish = self.client.register_script(self.FINISH_SCRIPT)
+        self._claim = self.client.register_script(self.CLAIM_SCRIPT)
+
+    @property
+    def stamp(self) -> str:
+        value = self.client.hget(f"{self.prefix}:meta", "stamp")
+        return value.decode("utf-8") if value else None
+
+    def seed(self, links: dict, stamp: str) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+        pipeline = self.client.pipeline()
+        if keys:
+            pipeline.delete(*keys)
+        pipeline.hset(f"{self.prefix}:meta", "stamp", stamp)
+        for site_name, site_categories in links.items():
+            site_name = site_name.lower().strip()
+            pipeline.sadd(f"{self.prefix}:sites", site_name)
+            for url, category_name in site_categories.items():
+                name = f"{site_name}|{category_name}"
+                pipeline.sadd(f"{self.prefix}:cats", name)
+                pipeline.hset(f"{self.prefix}:cat:{name}", mapping={"site": site_name, "category": category_name,
+                                                                   "url": url, "finished": 0})
+                pipeline.hset(f"{self.prefix}:task:{name}|1", mapping={
+                    "site": site_name, "category": category_name, "page": 1, "url": url,
+                    "state": "pending", "attempts": 0})
+                pipeline.rpush(f"{self.prefix}:pending:{site_name}", f"{name}|1")
+        pipeline.execute()
+
+    def lease(self, worker_id: str, limit: int, sites: list = None) -> list:
+        sites = sites or sorted(site.decode("utf-8") for site in self.client.smembers(f"{self.prefix}:sites"))
+        now = time.time()
+        token = f"{worker_id}:{os.urandom(6).hex()}:"
+        ids = self._lease(args=[self.prefix, now, now + self.visibility_timeout, limit, self.max_attempts, token] + sites)
+        tasks = []
+        for index, task_id in enumerate(ids):
+            task_id = task_id.decode("utf-8")
+            fields = {key.decode("utf-8"): value.decode("utf-8")
+                      for key, value in self.client.hgetall(f"{self.prefix}:task:{task_id}").items()}
+            tasks.append({"id": task_id, "site": fields["site"], "category": fields["category"],
+                          "page": int(fields["page"]), "url": fields["url"], "token": f"{token}{index}"})
+        return tasks
+
+    def ack(self, task: dict, products: list, total_pages: int = None, next_pages: list = (),
+            done_pages: list = ()) -> bool:
+        rows = zlib.compress(json.dumps(products, ensure_ascii=False).encode("utf-8"))
+        pairs = [value for page_num, url in next_pages for value in (page_num, url)]
+        triples = [value for page_num, url, page_products in done_pages
+                   for value in (page_num, url,
+                                 zlib.compress(json.dumps(page_products, ensure_ascii=False).encode("utf-8")))]
+        return bool(self._finish(args=[self.prefix, task["id"], task["token"], "done", self.max_attempts, rows,
+                                       "" if total_pages is None else total_pages, len(next_pages)] + pairs + triples))
+
+    def fail(self, task: dict) -> bool:
+        return bool(self._finish(args=[self.prefix, task["id"], task["token"], "failed", self.max_attempts, "", ""]))
+
+    def claim_completed(self, sites: list = None) -> list:
+        return [tuple(name.decode("utf-8").split("|", 1)) for name in self._claim(args=[self.prefix] + list(sites or []))]
+
+    def results(self, site_name: str, category_name: str):
+        total_pages = self.client.hget(f"{self.prefix}:cat:{site_name}|{category_name}", "total_pages")
+        for page_num in range(1, int(total_pages or 1) + 1):
+            task_id = f"{site_name}|{category_name}|{page_num}"
+            if self.client.hget(f"{self.prefix}:task:{task_id}", "state") == b"done":
+                yield page_num, json.loads(zlib.decompress(self.client.get(f"{self.prefix}:rows:{task_id}")))
+            else:
+                yield page_num, None
+
+    def is_drained(self, sites: list = None) -> bool:
+        sites = sites or [site.decode("utf-8") for site in self.client.smembers(f"{self.prefix}:sites")]
+        if any(self.client.llen(f"{self.prefix}:pending:{site}") for site in sites):
+            return False
+        leased = self.client.zrange(f"{self.prefix}:leased", 0, -1)
+        return not any(task_id.decode("utf-8").split("|", 1)[0] in sites for task_id in leased)
+
+    def counts(self) -> dict:
+        counts = {}
+        for key in self.client.scan_iter(match=f"{self.prefix}:task:*"):
+            state = self.client.hget(key, "state").decode("utf-8")
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+
+    def close(self) -> None:
+        self.client.close()
+
+def open_work_queue(location: str, visibility_timeout: float = 120.0, max_attempts: int = 5):
+    """
+    Adres redis:// ya da rediss:// ile başlıyorsa RedisWorkQueue, değilse SQLite dosyası için SqliteWorkQueue açar.
+    """
+    if location.startswith(("redis://", "rediss://")):
+        return RedisWorkQueue(location, visibility_timeout, max_attempts)
+    return SqliteWorkQueue(location, visibility_timeout, max_attempts)
+
+TRACKING_PARAMS = {"gclid", "fbclid", "yclid", "msclkid", "dclid", "gbraid", "wbraid", "_ga", "_gl",
+                   "ref", "referrer", "src", "source", "campaign", "affiliate", "aff_id"}
+TRACKING_PREFIXES = ("utm_", "mc_", "pk_")
+
+def canonical_url(link: str) -> str:
+    """
+    Ürün bağlantısını karşılaştırılabilir tek biçime getirir; tekrar ayıklamada anahtar olarak
+    kullanılır, çıktıya yazılan bağlantı değiştirilmez.
+
+    Şema ve host küçük harfe çevrilir, varsayılan port ve parça (#...) atılır, izleme
+    parametreleri (utm_*, gclid, fbclid, ...) silinip kalanlar sıralanır, yinelenen ve
+    sondaki eğik çizgiler kaldırılır. http(s) ile başlamayan değerler ("Link bulunamadı") ve
+    ayrıştırılamayan (ör. portu bozuk) bağlantılar olduğu gibi döner.
+
+    Args:
+        link (str): Ürün bağlantısı.
+
+    Returns:
+        str: Kanonik bağlantı.
+    """
+    if not link or not link.startswith(("http://", "https://", "HTTP://", "HTTPS://")):
+        return link
+    try:
+        parts = urlsplit(link.strip())
+        port = parts.port
+    except ValueError:
+        return link
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower().rstrip(".")
+    if port and port != {"http": 80, "https": 443}.get(scheme):
+        host = f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                             if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+class SeenSet:
+    def __init__(self):
+        """
+        Çalıştırma boyunca görülen ürün anahtarlarını tutan, iş parçacığı güvenli küme.
+        """
+        self.keys = set()
+        self.lock = threading.Lock()
+
+    def add(self, key: str) -> bool:
         """
-        Config sınıfını başlatır ve ayar dosyalarını yükler.
+        Anahtarı ekler.
+
+        Returns:
+            bool: Anahtar ilk kez görüldüyse True, daha önce eklendiyse False.
         """
-        self.user_agents = self.load_json(f'{cofig_dir_path}user_agents.json')
-        self.links = self.load_json(f'{cofig_dir_path}links.json')
-        self.manufacturers = self.load_json(f'{cofig_dir_path}manufacturers.json')
-        self.error_log= f'{cofig_dir_path}error_log.json'
+        with self.lock:
+            if key in self.keys:
+                return False
+            self.keys.add(key)
+            return True
 
-    def load_json(self, path: str) -> dict:
+class BloomSeenSet:
+    def __init__(self, capacity: int = 5_000_000, error_rate: float = 0.001):
         """
-        Belirtilen dosya yolundan JSON verilerini yükler.
+        SeenSet ile aynı arayüze sahip, sabit bellekli Bloom filtresi.
 
-        Args:
-            path (str): Yüklenilecek JSON dosyasının yolu.
+        Çok büyük taramalarda bağlantıların kendisi yerine yalnızca bitleri saklanır; örneğin
+        5 milyon anahtar ve %0,1 hata oranı için ~9 MB yeterlidir. Yanlış pozitifler nedeniyle
+        error_rate oranında benzersiz ürün tekrar sanılıp atlanabilir, tekrarlar ise hiç kaçmaz.
 
-        Returns:
-            dict: JSON verileri.
+        Args:
+            capacity (int): Beklenen en fazla anahtar sayısı.
+            error_rate (float): Bu kapasitede kabul edilen yanlış pozitif oranı.
         """
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError as e:
-            self.save_error_to_json(e)
-            return {}
-        except json.JSONDecodeError as e :
-            self.save_error_to_json(e)
-            return {}
-            
-    def save_error_to_json(self, exception):
-        error_info = {
-            'error_name': type(exception).__name__,
-            'error_message': str(exception),
-            'function_name': inspect.currentframe().f_back.f_code.co_name,
-            'timestamp': datetime.now().isoformat()
-        }
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.lock = threading.Lock()
 
-        try:
-            with open(self.error_log, 'a+') as file:
-                file.seek(0)  
-                try:
-                    error_data = json.load(file)
-                except (json.JSONDecodeError, ValueError):  
-                    error_data = []
-                error_data.append(error_info)
-                file.seek(0)    
-                json.dump(error_data, file, indent=4)
-        except Exception as e:
-            print(f"Dosya hatası: {e}")
+    def add(self, key: str) -> bool:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        positions = [(first + index * second) % self.size for index in range(self.hash_count)]
+        with self.lock:
+            new = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not self.bits[position >> 3] & mask:
+                    self.bits[position >> 3] |= mask
+                    new = True
+            return new
 
-class PageFetcher:
-    def __init__(self, config: Config, retries: int = 5, delay: int = 2):
+class ManufacturerMatcher:
+    def __init__(self, manufacturers: dict):
         """
-        PageFetcher sınıfını başlatır.
+        manufacturers.json anahtarlarından bir kez derlenen, tek geçişli üretici eşleyici.
+
+        Anahtarlar düz metin olarak kaçışlanır (G.SKILL'deki nokta joker değildir), kelime
+        sınırlarıyla ve büyük/küçük harf duyarsız aranır. Aynı konumda birden fazla anahtar
+        eşleşirse en uzunu ("Samsung SSD" > "Samsung") kazanır.
 
         Args:
-            config (Config): Config nesnesi.
-            retries (int): Yeniden deneme sayısı.
-            delay (int): Denemeler arasındaki gecikme süresi.
+            manufacturers (dict): Anahtar -> üretici adı eşlemesi.
         """
-        self.config = config
-        self.retries = retries
-        self.delay = delay
-        self.cache = TTLCache(maxsize=100, ttl=300)
+        keys = sorted(manufacturers, key=len, reverse=True)
+        # Her anahtar kendi grubunda aranır; eşleşen metin yeniden küçültülüp aranmaz, çünkü
+        # "GİGABYTE" ya da "Kıngston" casefold sonrası hiçbir anahtara eşit olmaz.
+        self.values = [manufacturers[key] for key in keys]
+        self.pattern = re.compile(r"(?<!\w)(?:" + "|".join(f"({re.escape(key)})" for key in keys) + r")(?!\w)",
+                                  re.IGNORECASE) if keys else None
 
-    def fetch(self, url: str, timeout: int = 15) -> bea:
+    def match(self, product_name: str) -> str:
         """
-        Belirtilen URL'den sayfayı alır.
+        Ürün adında geçen ilk üreticiyi döndürür.
 
         Args:
-            url (str): Alınacak sayfanın URL'si.
-            timeout (int): Zaman aşımı süresi.
+            product_name (str): Ürün adı.
 
         Returns:
-            BeautifulSoup: Alınan sayfanın BeautifulSoup nesnesi.
+            str: Üretici adı ya da eşleşme yoksa None.
         """
-        if url in self.cache:
-            return self.cache[url]
+        found = self.pattern.search(product_name) if self.pattern else None
+        return self.values[found.lastindex - 1] if found else None
 
-        for attempt in range(self.retries):
-            if not self.config.user_agents:
-                print("Hata: Kullanıcı ajanı bulunamadı.")
-                return None
-            
-            header = random.choice(self.config.user_agents.get('user_agents', [])) 
-            try:
-                if attempt >= 3:
-                    print(f"{attempt + 1}. deneme: {url}")
-                response = req.get(url, headers=header, timeout=timeout)
-                response.raise_for_status()
-                soup = bea(response.text, "html.parser")
-                self.cache[url] = soup
-                return soup
-            
-            except Exception as e:
-                self.config.save_error_to_json(e)
+    def match_many(self, product_names: list) -> list:
+        """
+        Ürün adı listesinin tamamını tek bir regex geçişiyle etiketler.
 
-            time.sleep(self.delay)
-        return None
+        Args:
+            product_names (list): Ürün adları.
+
+        Returns:
+            list: Her ad için üretici adı ya da None, verilen sırayla.
+        """
+        results = [None] * len(product_names)
+        if not self.pattern or not product_names:
+            return results
+        names = [str(name).replace("\n", " ") for name in product_names]
+        line_starts = []
+        position = 0
+        for name in names:
+            line_starts.append(position)
+            position += len(name) + 1
+        for found in self.pattern.finditer("\n".join(names)):
+            index = bisect.bisect_right(line_starts, found.start()) - 1
+            if results[index] is None:
+                results[index] = self.values[found.lastindex - 1]
+        return results
 
 class WebScraper:
-    def __init__(self, config: Config  , PageFetcher:PageFetcher):
+    def __init__(self, config: Config  , PageFetcher:PageFetcher, output_format: str = "csv",
+                 incremental: bool = False, write_snapshot: bool = True, metrics: CrawlMetrics = None,
+                 journal: CrawlJournal = None, stamp: str = None, seen: SeenSet = None,
+                 fingerprints: FingerprintStore = None, probe_pages: int = 0, page_window: int = None):
         """
-        WebScraper sınıfını başlatır ve gerekli dizinleri oluşturur.
+        WebScraper sınıfını başlatır. Çıktı dizinleri ilk kayıtta oluşturulur.
 
         Args:
             config (Config): Config nesnesi.
+            output_format (str): Ürün çıktısının biçimi: "csv", "parquet" ya da "sqlite" (PriceHistoryStore).
+            incremental (bool): True ise Link'e göre değişiklikler delta dosyasına yazılır.
+            write_snapshot (bool): False ise tam kategori dosyaları yazılmaz (yalnızca delta).
+            metrics (CrawlMetrics): Verilirse çıkarma/kaydetme süreleri ve sayfa başına ürün sayısı kaydedilir.
+            journal (CrawlJournal): Verilirse tamamlanan sayfalar günlüğe yazılır; devam edilen çalıştırmada
+                çıktı dizini ve zaman damgası günlükten alınır.
+            stamp (str): Verilirse çıktı dizini bu zaman damgasıyla adlandırılır (kuyruk işçileri aynı dizine yazar).
+            seen (SeenSet | BloomSeenSet): Verilirse kanonik bağlantısı bu çalıştırmada daha önce yazılmış
+                ürünler (başka kategori ya da kayan sayfalama tekrarları) çıktıya yazılmadan atlanır.
+            fingerprints (FingerprintStore): Verilirse ürün listesi bölgesi önceki çalıştırmayla aynı olan
+                sayfalar ayrıştırılmaz, satırları depodan alınır.
+            probe_pages (int): 0'dan büyükse sayfalayıcı okunamayıp toplam 1 sayfa görünen kategorilerde
+                son sayfa en fazla bu sayfaya kadar yoklanarak bulunur.
+            page_window (int): Bir kategoride aynı anda alınan ya da yazılmayı bekleyen en fazla sayfa
+                sayısı; None ise çekirdek sayısının iki katı.
         """
         now = datetime.now()
-        self.formatli_tarih_saat = now.strftime("%m-%d_%H")
+        self.formatli_tarih_saat = stamp or (journal.stamp if journal else now.strftime("%m-%d_%H"))
         self.main_directory = f"Site_Data_{self.formatli_tarih_saat}"
-        os.makedirs(self.main_directory, exist_ok=True)
         self.config =config
         self.page_fetcher = PageFetcher
+        self.page_executor = None
+        self.metrics_stamp = self.formatli_tarih_saat
+        self.page_window = page_window or os.cpu_count() * 2
+        self.manufacturer_matcher = ManufacturerMatcher(config.manufacturers.get("manufacturers", {}))
+        if output_format == "sqlite":
+            self.product_writer = PriceHistoryStore(history_db_path, now.isoformat(timespec="seconds"))
+        else:
+            self.product_writer = ProductWriter(self.main_directory, self.formatli_tarih_saat, output_format)
+        self.write_snapshot = write_snapshot
+        self.metrics = metrics
+        self.journal = journal
+        self.seen = seen
+        self.fingerprints = fingerprints
+        self.probe_pages = probe_pages
+        self.duplicates_dropped = 0
+        self.tracker = IncrementalTracker(
+            f"{state_dir_path}product_state.sqlite",
+            os.path.join(self.main_directory, f"delta_{self.formatli_tarih_saat}.jsonl")) if incremental else None
+        self.stats_lock = threading.Lock()
+        self.pages_scraped = 0
+        self.products_scraped = 0
 
     def get_manufacturer(self, product_name: str) -> str:
         """
@@ -142,16 +2893,16 @@ class WebScraper:
             str: Üretici adı.
         """
         try:
-            for key in self.config.manufacturers:
-                if re.search(key, product_name, re.IGNORECASE):
-                    return self.config.manufacturers[key]
+            manufacturer = self.manufacturer_matcher.match(product_name)
+            if manufacturer:
+                return manufacturer
             
             return product_name.split(" ")[0]
         except Exception as e:
             self.config.save_error_to_json(e)
             return None 
     
-    def get_total_pages(self, soup: bea, site_name: str) -> int:
+    def get_total_pages(self, soup: "bea", site_name: str) -> int:
         """
         Verilen BeautifulSoup nesnesinden toplam sayfa sayısını alır.
 
@@ -162,56 +2913,16 @@ class WebScraper:
         Returns:
             int: Toplam sayfa sayısı ya da 1 
         """
+        if isinstance(soup, ListingPage):
+            if soup.unchanged:
+                return soup.total_pages or 1
+            soup.total_pages = self.get_total_pages(soup.soup, site_name)
+            return soup.total_pages
+        adapter = SITE_ADAPTERS.get(site_name.lower())
+        if adapter is None:
+            return 1
         try:
-            if   site_name == "gameGaraj":
-                page_number_element = soup.select_one("body > div.edgtf-wrapper > div > div.edgtf-content > div > div.edgtf-container > div > div > div.edgtf-page-content-holder.edgtf-grid-col-9.edgtf-grid-col-push-3 > nav > ul > li:nth-child(2) > a")
-                if page_number_element:
-                    total_pages = int(page_number_element.text.strip())
-                else:
-                    total_pages = 1
-
-            elif site_name == "itopya":
-                strong_element = soup.select_one('body > section.container-fluid > div > div.col-12.col-md-9.col-lg-9.col-xl-10 > div:nth-child(5) > div.actions > span > strong')
-                if strong_element:
-                    total_pages_text = strong_element.get_text().strip()
-                    total_pages = int(total_pages_text.split('/')[1])
-                else:
-                    total_pages = 1
-
-            elif site_name == "sinerji":
-                page_links = soup.select("a[href*='?px=']")
-                total_pages = max(int(link.text) for link in page_links if link.text.isdigit()) if page_links else 1
-            
-            elif site_name == "incehesap":
-                page_links = soup.select("body > main > div.container.space-y-5.pb-5 > div.flex.flex-col.xl\\:flex-row.gap-5 > div > div.card.flex.items-center.justify-betweensm\\:px-6 > nav > a")
-                if page_links:
-                    total_pages = max(
-                        int(link.get('href', '').split('/sayfa-')[-1].strip('/'))
-                        for link in page_links
-                        if '/sayfa-' in link.get('href', '')
-                    )
-                else:
-                    total_pages = 1
-                    
-            elif site_name == "teknosa":
-                page_links = soup.select_one("#site-main > div > div > div.col-12.section-1 > div > div > div.plp-grid > div.plp-body > div.plp-paging > div.plp-paging-button > button > span")
-                if page_links and page_links.text:
-                    split_text = page_links.text.split("/")
-                    if len(split_text) > 1:
-                        total_pages = int(split_text[1].strip().replace(")", "")) - 1
-                    else:
-                        total_pages = 1
-            
-            elif site_name == "tebilon":
-                page_links =  soup.select_one("#mainPage > main > section.showcase > div > div > div.showcase__showcaseProducts.col-md-12.col-sm-12.col-xs-12.mobileShow > div.col-md-12.productSort__paginationBottom > div > a:nth-child(5)")
-                if page_links and page_links.text:
-                        total_pages = int(page_links.text)
-                else:
-                    total_pages = 1
-            
-            else:
-                total_pages = 1
-            last_try = total_pages * 3
+            total_pages = adapter.total_pages(soup)
         except (IndexError, ValueError) as e:
             self.config.save_error_to_json(e)
             total_pages = 1
@@ -220,7 +2931,7 @@ class WebScraper:
         else:
             return 1
 
-    def extract_products(self, soup: bea, site_name: str, tür: str =None) -> list:
+    def extract_products(self, soup: "bea", site_name: str, tür: str =None) -> list:
         """
         BeautifulSoup nesnesinden ürünleri çıkarır.
 
@@ -231,187 +2942,437 @@ class WebScraper:
         Returns:
             list: Ürün bilgilerini içeren sözlükler.
         """
-        all_products = []
-        if   site_name == "gameGaraj":
-            products = soup.select("li.product")
-            for product in products:
-                price_element = product.select_one(".price ins .woocommerce-Price-amount")
-                price = price_element.text.strip() if price_element else "Fiyat yok"
-                title = product.select_one(".edgtf-product-list-title a").text
-                product_link = product.select_one(".edgtf-product-list-title a")["href"]
-                manufacturer = self.get_manufacturer(title)
-                all_products.append({"isim": title.replace('"','').replace("₺","").strip(), 
-                                    "Fiyat": price.replace('"','').replace("₺","").strip(), 
-                                    "Üretici": manufacturer.replace('"', '').replace("₺","").strip(), 
-                                    "Link": product_link.strip()})
-
-        elif site_name == "itopya":
-            for product in soup.select('#productList > div'):
-                link_tag = product.select_one('div.product-body > h2 > a')
-                if link_tag:
-                    product_link = link_tag['href'] if link_tag['href'].startswith("http") else "https://www.itopya.com" + link_tag['href']
-                    title = link_tag.get_text().strip()
-                    price_tag = product.select_one('div.product-footer > div.price > strong')
-                    price = price_tag.get_text().strip().replace('\xa0', '').replace('₺', '').strip() if price_tag else "nan"
-                    manufacturer = self.get_manufacturer(title) if price != "nan" else "Bilinmiyor"
-                    all_products.append({
-                        "isim": title.replace('"','').replace("₺","").strip(), 
-                        "Fiyat": price.strip(),
-                        "Üretici": manufacturer.replace('"','').replace("₺","").strip(), 
-                        "Link": product_link.strip()})
-
-        elif site_name == "sinerji":
-            products = soup.select("section article")
-            for product in products:
-                title_element = product.select_one("div.title a")
-                product_name = title_element.text.strip() if title_element else "İsim yok"
-                product_link = title_element["href"] if title_element else "Link yok"
-                specs = product.find_all("li")
-                specs_dict = {}
-                for spec in specs:
-                    spec_text = spec.text.strip()
-                    if ':' in spec_text:
-                        key, value = spec_text.split(':', 1)
-                        specs_dict[key.strip()] = value.strip()
-                manufacturer = self.get_manufacturer(product_name)
-                price = product.select_one("div.row > div.col > span")
-                price = price.text.replace('"', "").replace("₺","")
-                product_info = {"isim": product_name.replace('"','').replace("₺","").strip(), 
-                                "Fiyat" : price.strip(),
-                                "Üretici": manufacturer.replace('"','').replace("₺","").strip() if manufacturer else "Bilinmiyor",
-                                "Link": ("https://www.sinerji.gen.tr" + product_link).replace('"','').replace("₺","").strip()}
-                product_info.update(specs_dict)
-                all_products.append(product_info)
-        
-        elif site_name == "incehesap":
-            products = soup.select('body > main > div.container.space-y-5.pb-5 > div.flex.flex-col.xl\\:flex-row.gap-5 > div > div:nth-child(4) > div.grid.grid-cols-2.md\\:grid-cols-3.gap-1 > a')
-            for product in products:
-                title_element = product.find('div', class_='line-clamp-2 h-11 text-center leading-tight px-1 lg:px-4 md:space-x-3')
-                title = title_element.text.strip() if title_element else "İsim yok"
-                product_link = product['href'] if product else "Link yok"
-                price_element = product.find('span', class_='mx-auto whitespace-nowrap text-lg font-bold leading-none tracking-tight text-orange-500 md:text-2xl mb-2')
-                price = price_element.text.strip() if price_element else "Fiyat yok"
-                manufacturer = self.get_manufacturer(title)
-                all_products.append({
-                    "isim": title.replace('"','').replace("₺","").strip(), 
-                    "Fiyat": price.replace('"','').replace("₺","").strip(),
-                    "Üretici": manufacturer.replace('"','').replace("₺","").strip(),
-                    "Link": product_link.replace('"','').replace("₺","").strip()})
-                
-        elif site_name == "teknosa":
-            product_list = soup.select("#product-item")
-            for product in product_list:
-                name_link_manufacturer = product.select_one("a")
-                title = name_link_manufacturer.get('title', "isim bulunamadı") if name_link_manufacturer else "isim bulunamadı"
-                product_link = name_link_manufacturer['href'] if name_link_manufacturer and name_link_manufacturer['href'].startswith("http") else "https://www.teknosa.com" + name_link_manufacturer['href'] if name_link_manufacturer else "Link bulunamadı"
-                price = product.select_one("input").get('value', "Fiyat bulunamadı") if product.select_one("input") else "Fiyat bulunamadı"
-                manufacturer = title.split()[0] if title != "isim bulunamadı" else "bulunamadı"
-                all_products.append({
-                    "isim": title.replace('"','').replace("₺","").strip(), 
-                    "Fiyat": price.replace('"','').replace("₺","").strip(),
-                    "Üretici": manufacturer.replace('"','').replace("₺","").strip(),
-                    "Link": product_link.replace('"','').replace("₺","").strip()})
-                
-        elif site_name =="tebilon":
-            product_list = soup.select("#allProducts > div > div")
-            for product in product_list:
-                name_link_manufacturer = product.select_one("div > div > div > div.showcase__shadow.col-md-12.no-padding > div.showcase__title.col-md-12.text-center.no-padding.mobileShow > a")
-                price_tag = product.select_one("div > div > div > div.showcase__shadow.col-md-12.no-padding > div:nth-child(4) > div > div > div.new.newPrice.col-md-12.col-12.text-center")
-
-                title = name_link_manufacturer.text if name_link_manufacturer else "isim bulunamadı"
-                product_link = (name_link_manufacturer['href'] if name_link_manufacturer and name_link_manufacturer['href'].startswith("http") 
-                                else f"https://www.tebilon.com{name_link_manufacturer['href']}" if name_link_manufacturer else "Link bulunamadı")
-                price = price_tag.text.strip() if price_tag else "Fiyat bulunamadı"
-                manufacturer = title.split()[0] if title != "isim bulunamadı" else "bulunamadı"
-                
-                all_products.append({
-                    "isim": title.replace('"','').replace("₺","").strip(),
-                    "Fiyat": price.replace('"','').replace("₺","").strip(),
-                    "Üretici": manufacturer.replace('"','').replace("₺","").strip(),
-                    "Link": product_link.replace('"','').replace("₺","").strip()
-                })
-                            
-        return all_products
+        if isinstance(soup, ListingPage):
+            if soup.unchanged:
+                return soup.products
+            products = self.extract_products(soup.soup, site_name)
+            self.fingerprints.put(soup.url, soup.fingerprint, soup.total_pages, products)
+            return products
+        adapter = SITE_ADAPTERS.get(site_name.lower())
+        if adapter is None:
+            return []
+        started = time.perf_counter()
+        products = adapter.products(soup, self)
+        if self.metrics:
+            self.metrics.observe("extract_seconds", time.perf_counter() - started, PARSE_BUCKETS, site=site_name)
+        return products
 
-    def save_to_csv(self, all_products: list, site_name: str, category_name: str) -> None:
+    def scrape_products(self, url: str, category_name: str, site_name: str) -> int:
         """
-        Ürün bilgilerini CSV dosyasına kaydeder.
+        Belirtilen URL'den ürünleri çeker ve her sayfanın ürünlerini çıkarıldığı anda
+        kategori dosyasına ekler. Bellekte en fazla bir sayfanın ürünleri tutulur.
 
         Args:
-            all_products (list): Ürün bilgilerini içeren sözlükler.
-            site_name (str): Site adı.
-            category_name (str): Kategori adı.
+            url (str): Ürünlerin çekileceği ana URL.
+            category_name (str): Ürünlerin ait olduğu kategori adı.
+            site_name (str): Web sitesinin adı.
 
         Returns:
-            str: CSV dosyasına kaydedilen ürün sayısını belirten bir mesaj.
+            int: Kaydedilen ürün sayısı.
         """
+        writer = None
+        completed = False
+        product_count = 0
+        failed_pages = 0
+
         try:
-            if not all_products:
-                return f"{site_name}_{category_name}.csv için kaydedilecek ürün bulunamadı. Hiçbir veri yazılmadı."
-
-            df = pd.DataFrame(all_products)
-            timestamp_directory = f"{site_name}_{self.formatli_tarih_saat}"
-            full_directory = os.path.join(self.main_directory, timestamp_directory)
-            os.makedirs(full_directory, exist_ok=True)
-
-            csv_filename = f"{site_name}_{category_name}.csv"
-            df.to_csv(os.path.join(full_directory, csv_filename), index=False, encoding='utf-8-sig')
-            message = f"{len(all_products)} {category_name} bilgisi '{csv_filename}' dosyasına kaydedildi."
-            return message
+            journaled = {}
+            probed = {}
+            if self.journal:
+                if self.journal.is_category_done(site_name, category_name):
+                    return 0
+                journaled = self.journal.completed_pages(site_name, category_name)
+
+            if 1 in journaled:
+                total_pages = journaled[1]
+                products = self.journal.load_rows(site_name, category_name, 1)
+            else:
+                soup = self.fetch_page(url)
+                if not soup:
+                    return 0
+                total_pages =int( self.get_total_pages(soup, site_name) )
+                products = self.extract_products(soup, site_name)
+                del soup
+                if self.probe_pages and total_pages == 1 and products:
+                    total_pages, probed = self.discover_last_page(url, site_name, products)
+                if self.journal:
+                    self.journal.record_page(site_name, category_name, 1, total_pages, products)
+
+            page_urls = [self.build_page_url(url, site_name, page_num)
+                         for page_num in range(2, total_pages + 1) if page_num not in journaled and page_num not in probed]
+
+            if self.write_snapshot:
+                writer = self.product_writer.open(site_name, category_name)
+            product_count += self.write_page(writer, products, site_name, category_name)
+            previous = products
+            fetched = self.fetch_pages(page_urls)
+            for page_num in range(2, total_pages + 1):
+                if page_num in journaled:
+                    products = self.journal.load_rows(site_name, category_name, page_num)
+                else:
+                    if page_num in probed:
+                        products = probed.pop(page_num)
+                    else:
+                        page_soup = next(fetched)
+                        if not page_soup:
+                            failed_pages += 1
+                            continue  
+                        products = self.extract_products(page_soup, site_name)
+                    if self.journal:
+                        self.journal.record_page(site_name, category_name, page_num, total_pages, products)
+
+                if self.is_repeated_page(previous, products):
+                    print(f"{site_name} {category_name}: {page_num}. sayfa bir öncekinin tekrarı, kategori burada bitirildi.")
+                    break
+                product_count += self.write_page(writer, products, site_name, category_name)
+                previous = products
+            completed = True
+            if not failed_pages:
+                if self.tracker:
+                    self.tracker.finish_category(site_name, category_name)
+                if self.journal:
+                    self.journal.finish_category(site_name, category_name)
+            return product_count
         except Exception as e:
             self.config.save_error_to_json(e)
+        finally:
+            if writer:
+                writer.close(completed)
+
+    @staticmethod
+    def page_signature(products: list) -> tuple:
+        return tuple(product.get("Link") or product.get("isim") for product in products)
+
+    def is_repeated_page(self, previous: list, products: list) -> bool:
+        """
+        Sayfa bir öncekiyle aynı ürünleri içeriyorsa True döndürür; bazı siteler aralık dışındaki
+        sayfa numaralarında son sayfayı tekrar sunar.
+        """
+        return bool(products) and self.page_signature(products) == self.page_signature(previous)
 
-    def scrape_products(self, url: str, category_name: str, site_name: str) -> None:
+    def discover_last_page(self, url: str, site_name: str, first_products: list, width: int = 4) -> tuple:
         """
-        Belirtilen URL'den ürünleri çekerek CSV dosyasına kaydeder.
+        Sayfalayıcı okunamadığında son sayfayı yoklayarak bulur.
+
+        Önce 2, 4, 8, ... probe_pages sayfaları ve aralığın çok dışındaki bir gözcü sayfa aynı anda
+        alınır; gözcü, sitenin aralık dışı sayfalarda ne sunduğunu (boş liste, ilk sayfa ya da son
+        sayfa) gösterir. Son geçerli ve ilk geçersiz sayfa arasında her turda width noktası aynı anda
+        yoklanarak aralık daraltılır. Yoklanan sayfaların ürünleri yeniden alınmamak üzere döndürülür.
 
         Args:
-            url (str): Ürünlerin çekileceği ana URL.
-            category_name (str): Ürünlerin ait olduğu kategori adı.
-            site_name (str): Web sitesinin adı.
+            url (str): Kategorinin ilk sayfasının URL'si.
+            site_name (str): Site adı.
+            first_products (list): İlk sayfanın ürünleri.
+            width (int): Daraltma turu başına aynı anda yoklanacak sayfa sayısı.
 
         Returns:
-            tuple: Çekilen tüm ürünler, site adı ve kategori adı.
+            tuple: (toplam sayfa sayısı, sayfa numarası -> ürünler sözlüğü).
         """
-        all_products = []
+        probed = {1: first_products}
 
-        try:
-            soup = self.page_fetcher.fetch(url)
-            if not soup:
+        def probe(pages: list) -> None:
+            pages = [page_num for page_num in pages if page_num not in probed]
+            page_urls = [self.build_page_url(url, site_name, page_num) for page_num in pages]
+            for page_num, soup in zip(pages, self.fetch_pages(page_urls)):
+                probed[page_num] = self.extract_products(soup, site_name) if soup else None
+            if self.metrics:
+                self.metrics.inc("page_probes_total", len(pages), site=site_name)
+
+        steps = []
+        step = 2
+        while step < self.probe_pages:
+            steps.append(step)
+            step *= 2
+        steps.append(self.probe_pages)
+        sentinel = self.probe_pages * 1000
+        probe(steps + [sentinel])
+
+        first_signature = self.page_signature(first_products)
+        sentinel_products = probed.pop(sentinel)
+        tail_signature = None
+        if sentinel_products and self.page_signature(sentinel_products) != first_signature:
+            tail_signature = self.page_signature(sentinel_products)
+
+        def beyond(page_num: int) -> bool:
+            products = probed[page_num]
+            if not products:
+                return True
+            signature = self.page_signature(products)
+            return signature == first_signature or signature == tail_signature
+
+        low, high = 1, None
+        for page_num in steps:
+            if beyond(page_num):
+                high = page_num
+                break
+            low = page_num
+        if high is None:
+            last_page = low
+        else:
+            while high - low > 1:
+                points = sorted({low + (high - low) * index // (width + 1) for index in range(1, width + 1)} - {low, high})
+                probe(points)
+                for page_num in points:
+                    if beyond(page_num):
+                        high = page_num
+                        break
+                    low = page_num
+            # Aralık dışında son sayfayı sunan sitelerde, gözcüyle aynı içerikli ilk sayfa gerçek son sayfadır.
+            last_page = high if tail_signature is not None else low
+        return last_page, {page_num: products for page_num, products in probed.items()
+                           if 1 < page_num <= last_page and products}
+
+    def write_page(self, writer: CategoryWriter, products: list, site_name: str, category_name: str) -> int:
+        """
+        Bir sayfanın ürünlerini yazar, artımlı modda değişiklikleri delta akışına işler
+        ve çalıştırma sayaçlarını günceller. Tekrar ayıklama açıksa kanonik bağlantısı daha önce
+        yazılmış ürünler atlanır; yazılan Link değiştirilmez.
+
+        Returns:
+            int: Yazılan ürün sayısı.
+        """
+        started = time.perf_counter()
+        if self.seen is not None:
+            unique = [product for product in products
+                      if not str(product.get("Link") or "").startswith("http")
+                      or self.seen.add(canonical_url(product["Link"]))]
+            with self.stats_lock:
+                self.duplicates_dropped += len(products) - len(unique)
+            products = unique
+        if writer:
+            writer.write_rows(products)
+        if self.tracker:
+            self.tracker.observe(site_name, category_name, products)
+        if self.metrics:
+            self.metrics.observe("save_seconds", time.perf_counter() - started, PARSE_BUCKETS, site=site_name)
+            self.metrics.observe("products_per_page", len(products), COUNT_BUCKETS, site=site_name)
+        with self.stats_lock:
+            self.pages_scraped += 1
+            self.products_scraped += len(products)
+        return len(products)
+
+    def close(self) -> None:
+        """
+        Çıktı deposunu, artımlı mod durum veritabanını ve delta dosyasını kapatır; günlük varsa
+        tüm kategoriler bittiğinde çalıştırmayı kapatır.
+        """
+        self.product_writer.close()
+        if self.tracker:
+            self.tracker.close()
+        if self.fingerprints:
+            self.fingerprints.close()
+        if self.journal:
+            total_categories = sum(len(categories) for categories in self.config.links.values())
+            if not self.journal.finish_run(total_categories):
+                print("Tamamlanmayan kategoriler var; kalan işler --resume ile sürdürülebilir.")
+            self.journal.close()
+
+    def build_page_url(self, url: str, site_name: str, page_num: int) -> str:
+        """
+        Kategori URL'sinden verilen sayfa numarasının URL'sini üretir.
+
+        Args:
+            url (str): Kategorinin ana URL'si.
+            site_name (str): Site adı.
+            page_num (int): Sayfa numarası.
+
+        Returns:
+            str: Sayfanın URL'si.
+        """
+        adapter = SITE_ADAPTERS.get(site_name.lower())
+        return adapter.page_url(url, page_num) if adapter else url
+
+    def listing_page(self, url: str, text: str):
+        """
+        Alınan HTML'den sayfa nesnesi üretir; parmak izi etkinse içerik değişmemişse ayrıştırmaz.
+
+        Returns:
+            BeautifulSoup | ListingPage: Sayfa; metin yoksa None.
+        """
+        if text is None:
+            return None
+        if self.fingerprints is None:
+            return self.page_fetcher.parse(url, text)
+        fingerprint = page_fingerprint(url, text)
+        cached = self.fingerprints.get(url, fingerprint)
+        if self.metrics:
+            self.metrics.inc("fingerprint_hits_total" if cached else "fingerprint_misses_total",
+                             host=urlparse(url).netloc)
+        return cached or ListingPage(url, fingerprint, soup=self.page_fetcher.parse(url, text))
+
+    def fetch_page(self, url: str):
+        """
+        Tek bir sayfayı alır; parmak izi kapalıysa doğrudan page_fetcher.fetch kullanılır.
+        """
+        if self.fingerprints is None:
+            return self.page_fetcher.fetch(url)
+        if hasattr(self.page_fetcher, "fetch_text_future"):
+            return self.listing_page(url, self.page_fetcher.fetch_text_future(url).result())
+        return self.listing_page(url, self.page_fetcher.fetch_text(url))
+
+    def fetch_pages(self, page_urls: list):
+        """
+        Sayfaları aynı anda alır ve sonuçları sayfa sırasıyla, hazır oldukça verir.
+
+        Async motorda sayfalar olay döngüsüne, thread motorunda kategoriler arasında paylaşılan
+        sayfa havuzuna verilir. Her iki durumda da en fazla page_window sayfa aynı anda alınır ya da
+        sırasını bekler; kategori belleği sayfa sayısıyla büyümez.
+
+        Args:
+            page_urls (list): Alınacak sayfaların URL'leri.
+
+        Yields:
+            BeautifulSoup: Her sayfa için BeautifulSoup nesnesi ya da None.
+        """
+        if not page_urls:
+            return
+        if hasattr(self.page_fetcher, "fetch_iter"):
+            if self.fingerprints is None:
+                yield from self.page_fetcher.fetch_iter(page_urls, window=self.page_window)
                 return
-            
-            total_pages =int( self.get_total_pages(soup, site_name) )
+            for page_url, text in windowed_results(page_urls, self.page_fetcher.fetch_text_future, self.page_window):
+                yield self.listing_page(page_url, text)
+            return
+        if self.page_executor is None:
+            for page_url in page_urls:
+                yield self.fetch_page(page_url)
+            return
 
-            for page_num in range(1, total_pages + 1):
-                if page_num == 1:
-                    page_url = f"{url}"
-                else:
-                    if site_name == "tebilon" or site_name == "teknosa":
-                        page_url = f"{url}?page={page_num}"
-                    elif site_name == "sinerji":
-                        page_url = f"{url}?px={page_num}"
-                    elif site_name == "itopta":
-                        page_url = f"{url}?pg={page_num}"
-                    elif site_name == "gamegaraj":
-                        page_url = f"{url}/page/{page_num}/"
-                        
-                soup = self.page_fetcher.fetch(page_url)
-                if not soup:
-                    continue  
+        for _, page in windowed_results(page_urls, partial(self.page_executor.submit, self.fetch_page), self.page_window):
+            yield page
+
+    async def fetch_listing_async(self, url: str, site_name: str, first_page: bool = False) -> tuple:
+        """
+        Sayfayı olay döngüsünde alır; ayrıştırma ve ürün çıkarma sayfa havuzunda yapılır.
+
+        Returns:
+            tuple: (toplam sayfa sayısı ya da None, ürün listesi); sayfa alınamazsa None.
+        """
+        import asyncio
+        text = await self.page_fetcher.fetch_text(url)
+        if text is None:
+            return None
+
+        def extract():
+            soup = self.listing_page(url, text)
+            total_pages = int(self.get_total_pages(soup, site_name)) if first_page else None
+            return total_pages, self.extract_products(soup, site_name)
+        return await asyncio.get_running_loop().run_in_executor(self.page_executor, extract)
+
+    async def fetch_pages_async(self, page_urls: list, site_name: str):
+        """
+        fetch_pages'in eşyordam karşılığı: sayfaları en fazla page_window tanesi aynı anda
+        alınacak şekilde başlatır ve ürünleri sayfa sırasıyla verir.
+
+        Yields:
+            list: Her sayfanın ürünleri; sayfa alınamazsa None.
+        """
+        import asyncio
+        pending = deque()
+        try:
+            for page_url in page_urls:
+                if len(pending) >= max(self.page_window, 1):
+                    listing = await pending.popleft()
+                    yield listing[1] if listing else None
+                pending.append(asyncio.ensure_future(self.fetch_listing_async(page_url, site_name)))
+            while pending:
+                listing = await pending.popleft()
+                yield listing[1] if listing else None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def scrape_products_async(self, url: str, category_name: str, site_name: str) -> int:
+        """
+        scrape_products'ın async motordaki karşılığı. Kategori, fetcher'ın olay döngüsünde bir
+        eşyordam olarak yürür; sayfaları beklerken iş parçacığı tutmaz. Ayrıştırma, yazma ve
+        günlük işlemleri sayfa havuzunda yapılır.
+
+        Returns:
+            int: Kaydedilen ürün sayısı.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+
+        def offload(function, *args):
+            return loop.run_in_executor(self.page_executor, partial(function, *args))
 
-                all_products.extend(self.extract_products(soup, site_name))
+        writer = None
+        completed = False
+        product_count = 0
+        failed_pages = 0
+        fetched = None
 
-            return all_products, site_name, category_name
+        try:
+            journaled = {}
+            probed = {}
+            if self.journal:
+                if self.journal.is_category_done(site_name, category_name):
+                    return 0
+                journaled = self.journal.completed_pages(site_name, category_name)
+
+            if 1 in journaled:
+                total_pages = journaled[1]
+                products = await offload(self.journal.load_rows, site_name, category_name, 1)
+            else:
+                first = await self.fetch_listing_async(url, site_name, first_page=True)
+                if not first:
+                    return 0
+                total_pages, products = first
+                if self.probe_pages and total_pages == 1 and products:
+                    total_pages, probed = await offload(self.discover_last_page, url, site_name, products)
+                if self.journal:
+                    await offload(self.journal.record_page, site_name, category_name, 1, total_pages, products)
+
+            page_urls = [self.build_page_url(url, site_name, page_num)
+                         for page_num in range(2, total_pages + 1) if page_num not in journaled and page_num not in probed]
+
+            if self.write_snapshot:
+                writer = await offload(self.product_writer.open, site_name, category_name)
+            product_count += await offload(self.write_page, writer, products, site_name, category_name)
+            previous = products
+            fetched = self.fetch_pages_async(page_urls, site_name)
+            for page_num in range(2, total_pages + 1):
+                if page_num in journaled:
+                    products = await offload(self.journal.load_rows, site_name, category_name, page_num)
+                else:
+                    if page_num in probed:
+                        products = probed.pop(page_num)
+                    else:
+                        products = await fetched.__anext__()
+                        if products is None:
+                            failed_pages += 1
+                            continue
+                    if self.journal:
+                        await offload(self.journal.record_page, site_name, category_name, page_num, total_pages, products)
+
+                if self.is_repeated_page(previous, products):
+                    print(f"{site_name} {category_name}: {page_num}. sayfa bir öncekinin tekrarı, kategori burada bitirildi.")
+                    break
+                product_count += await offload(self.write_page, writer, products, site_name, category_name)
+                previous = products
+            completed = True
+            if not failed_pages:
+                if self.tracker:
+                    await offload(self.tracker.finish_category, site_name, category_name)
+                if self.journal:
+                    await offload(self.journal.finish_category, site_name, category_name)
+            return product_count
         except Exception as e:
             self.config.save_error_to_json(e)
+        finally:
+            if fetched is not None:
+                await fetched.aclose()
+            if writer:
+                await offload(writer.close, completed)
 
     def scrape_and_log(self, url_category_pair, site_name):
         """
-        Verilen URL ve kategori çiftini kullanarak ürünleri çeker ve verileri CSV dosyasına kaydeder.
+        Verilen URL ve kategori çiftini kullanarak ürünleri çeker ve verileri dosyaya kaydeder.
 
-        Bu metod, belirtilen URL'den ürünleri almak için `scrape_products` fonksiyonunu çağırır
-        ve elde edilen ürün verilerini belirtilen site ve kategori adıyla birlikte bir CSV dosyasına
-        kaydeder. Hata durumunda, hata kaydedilir ve kullanıcıya bilgi verilir.
+        Bu metod, belirtilen URL'den ürünleri almak için `scrape_products` fonksiyonunu çağırır;
+        ürünler sayfa sayfa site ve kategori adıyla adlandırılan dosyaya yazılır. Hata durumunda,
+        hata kaydedilir ve kullanıcıya bilgi verilir.
 
         Args:
             url_category_pair (tuple): URL ve kategori çiftini içeren bir tuple.
@@ -419,8 +3380,7 @@ class WebScraper:
         """
         try:
             url, category = url_category_pair
-            all_products, site_name, category_name = self.scrape_products(url, category, site_name)
-            self.save_to_csv(all_products, site_name, category_name)
+            self.scrape_products(url, category, site_name)
         except Exception as e:
             self.config.save_error_to_json(e)
 
@@ -430,18 +3390,43 @@ class WebScraper:
 
         Bu metod, tüm bağlantıları ve kategorileri içeren bir yapıdan yararlanarak
         verileri çekmek için bir iş parçacığı havuzu oluşturur. Her kategori için
-        bir iş parçacığı başlatılır ve işlemin ilerleyişi bir çubuk ile gösterilir. 
+        bir iş parçacığı başlatılır ve işlemin ilerleyişi bir çubuk ile gösterilir. Async motorda
+        kategoriler iş parçacığı yerine olay döngüsünde eşyordam olarak yürür.
         İşlem tamamlandığında toplam süre hesaplanır. 
 
         Hata durumunda, tüm hatalar tek bir try-except bloğunda yakalanarak
         kaydedilir ve kullanıcıya bilgi verilir.
         """
+        from tqdm import tqdm
         try:
             start_time = time.time()
             max_workers = os.cpu_count() * 2
             total_tasks = sum(len(categories) for site, categories in self.config.links.items())
+
+            if hasattr(self.page_fetcher, "submit"):
+                # Async motorda kategoriler olay döngüsünde eşyordam olarak yürür; uçuştaki istek
+                # sayısını kategori iş parçacıkları değil, fetcher'ın bağlantı havuzu sınırlar.
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="page") as page_executor:
+                    self.page_executor = page_executor
+                    with tqdm(total=total_tasks, desc="İlerleme", unit="kategori") as pbar:
+                        futures = []
+                        for site_name, site_categories in self.config.links.items():
+                            for url, category_name in site_categories.items():
+                                future = self.page_fetcher.submit(
+                                    self.scrape_products_async(url, category_name, site_name.lower().strip()))
+                                future.add_done_callback(lambda _: pbar.update(1))
+                                futures.append(future)
+                        for future in futures:
+                            future.result()
+                    self.page_executor = None
+                self.print_summary(time.time() - start_time)
+                return
             
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Sayfa görevleri ayrı bir havuzda çalışır; kategori görevleri kendi sayfalarını
+            # beklerken aynı havuzu tıkayıp kilitlenmeye yol açmaz.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                 ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="page") as page_executor:
+                self.page_executor = page_executor
                 futures = []
 
                 with tqdm(total=total_tasks, desc="İlerleme", unit="kategori") as pbar:
@@ -453,15 +3438,576 @@ class WebScraper:
 
                     for future in futures:
                         future.result()
+                self.page_executor = None
 
-            print(f"Toplam süre: {((time.time()) - start_time):.2f} saniye")
+            self.print_summary(time.time() - start_time)
             
         except Exception as e:
             self.config.save_error_to_json(e)
 
+    def print_summary(self, elapsed: float) -> None:
+        """
+        Toplam süreyi, sayfa/ürün hızlarını ve artımlı modda delta sayılarını yazdırır.
+
+        Args:
+            elapsed (float): Taramanın süresi (saniye).
+        """
+        print(f"Toplam süre: {elapsed:.2f} saniye")
+        print(f"{self.pages_scraped} sayfa ({self.pages_scraped / elapsed:.1f} sayfa/sn), "
+              f"{self.products_scraped} ürün ({self.products_scraped / elapsed:.1f} ürün/sn)")
+        if self.seen is not None:
+            print(f"Tekrar eden {self.duplicates_dropped} ürün atlandı.")
+        if self.fingerprints:
+            print(f"Parmak izi: {self.fingerprints.hits} değişmeyen sayfa ayrıştırılmadı, "
+                  f"{self.fingerprints.misses} sayfa ayrıştırıldı.")
+        if self.tracker:
+            counts = self.tracker.counts
+            print(f"Delta: {counts['insert']} yeni, {counts['price_change']} fiyat değişimi, "
+                  f"{counts['removed']} kaybolan ürün -> {self.tracker.delta_path}")
+        if self.metrics:
+            prom_path, json_path = self.metrics.write(metrics_dir_path, self.metrics_stamp)
+            print(f"Ölçümler: {prom_path}, {json_path}")
+
+_parse_context = None
+
+def _init_parse_worker() -> None:
+    """
+    Ayrıştırma sürecinde get_total_pages/extract_products için bir WebScraper bağlamı kurar.
+
+    Süreç havuzu işçileri os._exit ile kapandığından kendi hata kaydını açmaz; hatalar
+    parse_page sonucuyla ana sürece döner.
+    """
+    global _parse_context
+    _parse_context = WebScraper(Config(log_errors=False), None)
+
+def parse_page(text: str, site_name: str, parser: str, first_page: bool, regions: bool = False) -> tuple:
+    """
+    Süreç havuzunda çalışan ayrıştırma adımı: HTML'i ağaca çevirir, ilk sayfada toplam sayfa
+    sayısını okur ve ürünleri çıkarır.
+
+    Returns:
+        tuple: (toplam sayfa sayısı ya da None, ürün listesi, ayrıştırma süresi, çıkarma süresi,
+            ayrıştırma sırasında biriken hata kayıtları).
+    """
+    started = time.perf_counter()
+    soup = parse_html(text, parser, SITE_ADAPTERS.get(site_name.lower()) if regions else None)
+    parsed = time.perf_counter()
+    total_pages = _parse_context.get_total_pages(soup, site_name) if first_page else None
+    products = _parse_context.extract_products(soup, site_name)
+    return (total_pages, products, parsed - started, time.perf_counter() - parsed,
+            _parse_context.config.take_errors())
+
+class CrawlPipeline:
+    def __init__(self, scraper: WebScraper, fetch_workers: int = 32, parse_workers: int = None,
+                 write_queue_size: int = 64):
+        """
+        Taramayı sınırlı kuyruklarla ayrılmış üç aşamada yürütür: G/Ç aşaması ham HTML'i alır,
+        süreç havuzu ayrıştırır (GIL'e takılmadan tüm çekirdeklerde), yazıcı aşaması satırları
+        sayfa sırasına koyarak kaydeder.
+
+        Args:
+            scraper (WebScraper): Sayfa alıcı, çıktı yazıcısı ve sayaçları sağlayan WebScraper.
+            fetch_workers (int): Aynı anda alınan ya da ayrıştırılmayı bekleyen en fazla sayfa sayısı.
+            parse_workers (int): Ayrıştırma süreci sayısı; None ise çekirdek sayısı.
+            write_queue_size (int): Ayrıştırılmış sayfaların yazıcıyı bekleyebileceği kuyruk boyu.
+        """
+        self.scraper = scraper
+        self.page_fetcher = scraper.page_fetcher
+        self.parser = getattr(self.page_fetcher, "parser", "html.parser")
+        self.regions = getattr(self.page_fetcher, "regions", False)
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count()
+        self.fetch_queue = queue.Queue()
+        self.parse_queue = queue.Queue()
+        self.result_queue = queue.Queue()
+        self.write_queue = queue.Queue(maxsize=write_queue_size)
+        self.fetch_slots = threading.Semaphore(fetch_workers)
+        self.parse_slots = threading.Semaphore(self.parse_workers * 2)
+        self.stopping = threading.Event()
+        self.categories = {}
+        self.io_executor = None
+        self.process_pool = None
+
+    def _fetch_future(self, url: str):
+        if hasattr(self.page_fetcher, "fetch_text_future"):
+            return self.page_fetcher.fetch_text_future(url)
+        return self.io_executor.submit(self.page_fetcher.fetch_text, url)
+
+    def _dispatch(self) -> None:
+        """
+        G/Ç aşaması: kuyruktaki sayfaları fetch_slots sınırı içinde alınmaya gönderir.
+        """
+        while True:
+            task = self.fetch_queue.get()
+            if task is None or self.stopping.is_set():
+                return
+            if self.categories[task[:2]]["done"]:
+                continue
+            self.fetch_slots.acquire()
+            if self.stopping.is_set():
+                return
+            future = self._fetch_future(task[3])
+            future.add_done_callback(lambda future, task=task: self.parse_queue.put((task, future)))
+
+    def _emit(self, item: tuple) -> None:
+        """
+        Sonucu yazıcı kuyruğuna bırakır; boru hattı durdurulduysa (ör. yazıcı hata verdiyse)
+        dolu kuyrukta beklemeden sonucu düşürür.
+        """
+        while not self.stopping.is_set():
+            try:
+                self.write_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _submit_parse(self) -> None:
+        """
+        Ayrıştırma aşaması: alınan sayfaları süreç havuzuna verir; havuzda en fazla
+        parse_workers * 2 sayfa bekler.
+        """
+        while True:
+            item = self.parse_queue.get()
+            if item is None or self.stopping.is_set():
+                return
+            task, fetched = item
+            try:
+                text = fetched.result()
+            except Exception as e:
+                self.scraper.config.save_error_to_json(e)
+                text = None
+            if text is None:
+                self.fetch_slots.release()
+                self._emit((task, None, None))
+                continue
+            fingerprint = None
+            if self.scraper.fingerprints:
+                fingerprint = page_fingerprint(task[3], text)
+                cached = self.scraper.fingerprints.get(task[3], fingerprint)
+                if cached:
+                    self.fetch_slots.release()
+                    self._emit((task, cached.total_pages, cached.products))
+                    continue
+            self.parse_slots.acquire()
+            if self.stopping.is_set():
+                return
+            future = self.process_pool.submit(parse_page, text, task[0], self.parser, task[2] == 1,
+                                              self.regions)
+            self.fetch_slots.release()
+            future.add_done_callback(
+                lambda future, task=task, fingerprint=fingerprint: self.result_queue.put((task, future, fingerprint)))
+
+    def _collect(self) -> None:
+        """
+        Ayrıştırma sonuçlarını toplar: hata kayıtlarını ve parmak izlerini saklar, ölçümleri işler
+        ve sonucu yazıcıya verir. Havuzun geri çağırımı yalnızca sonucu kuyruğa bıraktığından
+        yazıcının gecikmesi havuzun sonuç toplamasını durdurmaz.
+        """
+        while True:
+            item = self.result_queue.get()
+            if item is None:
+                return
+            task, future, fingerprint = item
+            self.parse_slots.release()
+            try:
+                total_pages, products, parse_seconds, extract_seconds, errors = future.result()
+            except Exception as e:
+                self.scraper.config.save_error_to_json(e)
+                total_pages, products = None, None
+            else:
+                self.scraper.config.write_error_records(errors)
+                if fingerprint:
+                    self.scraper.fingerprints.put(task[3], fingerprint, total_pages, products)
+                if self.scraper.metrics:
+                    self.scraper.metrics.observe("parse_seconds", parse_seconds, PARSE_BUCKETS,
+                                                 host=urlparse(task[3]).netloc)
+                    self.scraper.metrics.observe("extract_seconds", extract_seconds, PARSE_BUCKETS, site=task[0])
+            self._emit((task, total_pages, products))
+
+    def _probe(self, task: tuple, products: list) -> None:
+        """
+        Sayfalayıcısı okunamayan kategorinin son sayfasını yoklayarak bulur; sayfa 1'i yeni toplamla,
+        ardından yoklanan sayfaları yazıcı kuyruğuna verir. Yoklama G/Ç havuzunda, yazıcıyı
+        bekletmeden yürür.
+        """
+        site_name, category_name, _, url = task
+        try:
+            total_pages, probed = self.scraper.discover_last_page(url, site_name, products)
+        except Exception as e:
+            self.scraper.config.save_error_to_json(e)
+            total_pages, probed = 1, {}
+        self.categories[(site_name, category_name)]["probed"] = set(probed)
+        self._emit((task, total_pages, products))
+        for page_num, page_products in sorted(probed.items()):
+            self._emit(((site_name, category_name, page_num, self.scraper.build_page_url(url, site_name, page_num)),
+                        None, page_products))
+
+    def _write(self, pbar) -> None:
+        """
+        Yazıcı aşaması: sayfaları kategori başına sayfa sırasıyla kaydeder, ilk sayfadan sonra
+        kalan sayfaları kuyruğa ekler ve kategoriler bittiğinde diğer aşamaları durdurur.
+        """
+        remaining = len(self.categories)
+        for (site_name, category_name), state in self.categories.items():
+            if 1 in state["journaled"]:
+                remaining -= self._accept((site_name, category_name, 1, state["url"]), state["journaled"][1],
+                                          self.scraper.journal.load_rows(site_name, category_name, 1), pbar)
+        while remaining:
+            task, total_pages, products = self.write_queue.get()
+            if products is not None and self.scraper.journal:
+                total = total_pages if task[2] == 1 else self.categories[task[:2]]["total_pages"]
+                self.scraper.journal.record_page(task[0], task[1], task[2], total, products)
+            remaining -= self._accept(task, total_pages, products, pbar)
+
+    def _accept(self, task: tuple, total_pages: int, products: list, pbar) -> int:
+        """
+        Bir sayfanın sonucunu kategori durumuna işler ve sırası gelen sayfaları yazar.
+
+        Returns:
+            int: Kategori bu sayfayla bittiyse 1, bitmediyse 0.
+        """
+        site_name, category_name, page_num, url = task
+        state = self.categories[(site_name, category_name)]
+        if state["done"]:
+            return 0
+        if page_num == 1:
+            if products is None:
+                state["done"] = True
+                pbar.update(1)
+                return 1
+            if self.scraper.probe_pages and int(total_pages) == 1 and products and state["probed"] is None:
+                self.io_executor.submit(self._probe, task, products)
+                return 0
+            state["total_pages"] = int(total_pages)
+            for next_page in range(2, state["total_pages"] + 1):
+                if next_page in (state["probed"] or ()):
+                    continue
+                if next_page in state["journaled"]:
+                    state["pending"][next_page] = self.scraper.journal.load_rows(site_name, category_name, next_page)
+                else:
+                    self.fetch_queue.put((site_name, category_name, next_page,
+                                          self.scraper.build_page_url(state["url"], site_name, next_page)))
+            if self.scraper.write_snapshot:
+                state["writer"] = self.scraper.product_writer.open(site_name, category_name)
+        state["pending"][page_num] = products
+
+        while state["next_page"] in state["pending"]:
+            page_products = state["pending"].pop(state["next_page"])
+            if page_products is None:
+                state["failed_pages"] += 1
+            elif self.scraper.is_repeated_page(state["previous"], page_products):
+                print(f"{site_name} {category_name}: {state['next_page']}. sayfa bir öncekinin tekrarı, "
+                      f"kategori burada bitirildi.")
+                state["pending"].clear()
+                state["next_page"] = state["total_pages"] + 1
+                break
+            else:
+                self.scraper.write_page(state["writer"], page_products, site_name, category_name)
+                state["previous"] = page_products
+            state["next_page"] += 1
+
+        if state["next_page"] <= state["total_pages"]:
+            return 0
+        state["done"] = True
+        if state["writer"]:
+            state["writer"].close()
+        if not state["failed_pages"]:
+            if self.scraper.tracker:
+                self.scraper.tracker.finish_category(site_name, category_name)
+            if self.scraper.journal:
+                self.scraper.journal.finish_category(site_name, category_name)
+        pbar.update(1)
+        return 1
+
+    def run(self) -> None:
+        """
+        Tüm kategorileri boru hattı üzerinden tarar.
+        """
+        start_time = time.time()
+        for site_name, site_categories in self.scraper.config.links.items():
+            site_name = site_name.lower().strip()
+            for url, category_name in site_categories.items():
+                journal = self.scraper.journal
+                if journal and journal.is_category_done(site_name, category_name):
+                    continue
+                journaled = journal.completed_pages(site_name, category_name) if journal else {}
+                self.categories[(site_name, category_name)] = {
+                    "url": url, "total_pages": None, "next_page": 1, "pending": {}, "writer": None,
+                    "failed_pages": 0, "journaled": journaled, "probed": None, "previous": [], "done": False}
+                if 1 not in journaled:
+                    self.fetch_queue.put((site_name, category_name, 1, url))
+
+        from concurrent.futures import ProcessPoolExecutor
+        from tqdm import tqdm
+        with ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix="fetch") as io_executor, \
+             ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker) as process_pool:
+            self.io_executor = io_executor
+            self.process_pool = process_pool
+            dispatcher = threading.Thread(target=self._dispatch, name="dispatch", daemon=True)
+            submitter = threading.Thread(target=self._submit_parse, name="parse-submit", daemon=True)
+            collector = threading.Thread(target=self._collect, name="parse-collect", daemon=True)
+            dispatcher.start()
+            submitter.start()
+            collector.start()
+            try:
+                with tqdm(total=len(self.categories), desc="İlerleme", unit="kategori") as pbar:
+                    self._write(pbar)
+            finally:
+                # Yazıcı hata verse bile aşamalar boş kuyrukta ya da slot beklerken takılı kalmasın.
+                self.stopping.set()
+                self.fetch_queue.put(None)
+                self.parse_queue.put(None)
+                self.result_queue.put(None)
+                for _ in range(self.fetch_workers):
+                    self.fetch_slots.release()
+                for _ in range(self.parse_workers * 2):
+                    self.parse_slots.release()
+                dispatcher.join()
+                submitter.join()
+                collector.join()
+
+        self.scraper.print_summary(time.time() - start_time)
+
+class QueueWorker:
+    def __init__(self, scraper: WebScraper, queue, worker_id: str = None, sites: list = None,
+                 batch_size: int = 16, fetch_workers: int = 16, poll_interval: float = 2.0):
+        """
+        Paylaşılan iş kuyruğundan (site, kategori, sayfa) görevleri kiralayıp işleyen tarama işçisi.
+
+        Aynı kuyruğu kullanan her süreç/makine bir işçi çalıştırır. Sayfa 1 işlenirken kalan
+        sayfalar kuyruğa eklenir; tüm sayfaları biten kategoriyi sahiplenen işçi çıktıyı sayfa
+        sırasıyla yazar. --sites ile işçilere farklı siteler verilerek host başına sınırlamalar
+        farklı IP'lere dağıtılabilir.
+
+        Args:
+            scraper (WebScraper): Sayfaları alıp ayrıştıracak ve çıktıyı yazacak tarayıcı.
+            queue (SqliteWorkQueue | RedisWorkQueue): Paylaşılan iş kuyruğu.
+            worker_id (str): İşçinin adı; verilmezse host adı ve süreç numarası kullanılır.
+            sites (list): Verilirse yalnızca bu sitelerin görevleri alınır.
+            batch_size (int): Tek seferde kiralanacak görev sayısı.
+            fetch_workers (int): Thread motorunda bir partiyi alacak iş parçacığı sayısı.
+            poll_interval (float): Başka işçilerin kiraları beklenirken yoklama aralığı (saniye).
+        """
+        self.scraper = scraper
+        self.queue = queue
+        self.worker_id = worker_id or f"{os.uname().nodename if hasattr(os, 'uname') else 'worker'}-{os.getpid()}"
+        self.sites = [site.lower().strip() for site in sites] if sites else None
+        self.batch_size = batch_size
+        self.fetch_workers = fetch_workers
+        self.poll_interval = poll_interval
+        # Aynı kuyruktaki işçiler aynı zaman damgasını paylaşır; ölçüm dosyaları birbirinin üzerine yazılmaz.
+        worker_slug = re.sub(r"[^\w.-]", "_", self.worker_id)
+        scraper.metrics_stamp = f"{scraper.formatli_tarih_saat}_{worker_slug}"
+
+    def process(self, task: dict, soup) -> None:
+        """
+        Alınan sayfayı ayrıştırır ve görevi onaylar; sayfa alınamadıysa görevi başarısız bildirir.
+        """
+        site_name = task["site"]
+        if not soup:
+            self.queue.fail(task)
+            return
+        try:
+            total_pages = None
+            next_pages = []
+            done_pages = []
+            if task["page"] == 1:
+                total_pages = int(self.scraper.get_total_pages(soup, site_name))
+            products = self.scraper.extract_products(soup, site_name)
+            if task["page"] == 1:
+                probed = {}
+                if self.scraper.probe_pages and total_pages == 1 and products:
+                    total_pages, probed = self.scraper.discover_last_page(task["url"], site_name, products)
+                for page_num in range(2, total_pages + 1):
+                    page_url = self.scraper.build_page_url(task["url"], site_name, page_num)
+                    if page_num in probed:
+                        done_pages.append((page_num, page_url, probed[page_num]))
+                    else:
+                        next_pages.append((page_num, page_url))
+            if not self.queue.ack(task, products, total_pages, next_pages, done_pages):
+                print(f"{task['url']} kirası süresi dolduğu için başka işçiye geçti.")
+        except Exception as e:
+            self.scraper.config.save_error_to_json(e)
+            self.queue.fail(task)
+
+    def export(self, site_name: str, category_name: str) -> None:
+        """
+        Tamamlanan kategorinin kuyruktaki sonuçlarını sayfa sırasıyla çıktıya yazar.
+        """
+        writer = None
+        completed = False
+        failed_pages = 0
+        try:
+            if self.scraper.write_snapshot:
+                writer = self.scraper.product_writer.open(site_name, category_name)
+            previous = []
+            for _, products in self.queue.results(site_name, category_name):
+                if products is None:
+                    failed_pages += 1
+                    continue
+                if self.scraper.is_repeated_page(previous, products):
+                    break
+                self.scraper.write_page(writer, products, site_name, category_name)
+                previous = products
+            completed = True
+            if self.scraper.tracker and not failed_pages:
+                self.scraper.tracker.finish_category(site_name, category_name)
+        except Exception as e:
+            self.scraper.config.save_error_to_json(e)
+        finally:
+            if writer:
+                writer.close(completed)
+
+    def run(self) -> None:
+        """
+        Kuyruk boşalana kadar görev kiralar, işler ve tamamlanan kategorileri yazar.
+        """
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix="page") as page_executor:
+            self.scraper.page_executor = page_executor
+            while True:
+                tasks = self.queue.lease(self.worker_id, self.batch_size, self.sites)
+                if tasks:
+                    for task, soup in zip(tasks, self.scraper.fetch_pages([task["url"] for task in tasks])):
+                        self.process(task, soup)
+                for site_name, category_name in self.queue.claim_completed(self.sites):
+                    self.export(site_name, category_name)
+                if not tasks:
+                    if self.queue.is_drained(self.sites):
+                        break
+                    time.sleep(self.poll_interval)
+            self.scraper.page_executor = None
+        for site_name, category_name in self.queue.claim_completed(self.sites):
+            self.export(site_name, category_name)
+
+        counts = self.queue.counts()
+        print(f"Kuyruk: {counts.get('done', 0)} tamamlanan, {counts.get('failed', 0)} başarısız görev")
+        self.scraper.print_summary(time.time() - start_time)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Donanım sitelerinden ürün ve fiyat verisi toplar.")
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread",
+                        help="Sayfa alma motoru: thread (requests) ya da async (aiohttp).")
+    parser.add_argument("--concurrency", type=int, default=200,
+                        help="async motorda aynı anda uçuşta olabilecek en fazla istek sayısı.")
+    parser.add_argument("--per-host", type=int, default=16,
+                        help="async motorda host başına en fazla bağlantı sayısı.")
+    parser.add_argument("--host-rate", type=float, default=2.0,
+                        help="Host başına başlangıç istek hızı (istek/saniye); AIMD ile uyarlanır.")
+    parser.add_argument("--max-host-rate", type=float, default=20.0,
+                        help="Host başına çıkılabilecek en yüksek istek hızı.")
+    parser.add_argument("--no-rate-limit", action="store_true",
+                        help="Host başına hız sınırlayıcıyı kapatır ve sabit bekleme ile yeniden dener.")
+    parser.add_argument("--cache-size-mb", type=int, default=512,
+                        help="Diskteki yanıt önbelleğinin sıkıştırılmış boyut sınırı (MB).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Diskteki yanıt önbelleğini kapatır.")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="html.parser",
+                        help="HTML ayrıştırıcı arka ucu.")
+    parser.add_argument("--region-parse", action="store_true",
+                        help="Listeleme sayfalarında yalnızca ürün listesi ve sayfalayıcı bölgelerini ayrıştırır.")
+    parser.add_argument("--output-format", choices=["csv", "parquet", "sqlite"], default="csv",
+                        help=f"Ürün çıktısının biçimi; parquet için pyarrow gerekir, sqlite tüm geçmişi {history_db_path} dosyasında tutar.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Link'e göre son durumu saklar; yeni, fiyatı değişen ve kaybolan ürünleri delta dosyasına yazar.")
+    parser.add_argument("--delta-only", action="store_true",
+                        help="--incremental ile birlikte tam kategori dosyalarını yazmaz.")
+    parser.add_argument("--page-window", type=int, default=None, metavar="N",
+                        help="Bir kategoride aynı anda alınan ya da yazılmayı bekleyen en fazla sayfa (varsayılan: çekirdek sayısının iki katı).")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Alma, ayrıştırma (süreç havuzu) ve yazma aşamalarını sınırlı kuyruklarla ayırır.")
+    parser.add_argument("--fetch-workers", type=int, default=32,
+                        help="--pipeline: aynı anda alınan ya da ayrıştırılmayı bekleyen en fazla sayfa sayısı.")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="--pipeline: ayrıştırma süreci sayısı (varsayılan: çekirdek sayısı).")
+    parser.add_argument("--write-queue", type=int, default=64,
+                        help="--pipeline: yazıcıyı bekleyebilecek en fazla ayrıştırılmış sayfa sayısı.")
+    parser.add_argument("--no-metrics", action="store_true",
+                        help=f"Çalıştırma sonunda {metrics_dir_path} altına Prometheus/JSON ölçüm dosyası yazmaz.")
+    parser.add_argument("--journal", action="store_true",
+                        help=f"Tamamlanan sayfaları {state_dir_path}crawl_journal.sqlite günlüğüne yazar; "
+                             "yarıda kalan tarama --resume ile sürdürülebilir.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Son yarım kalan (--journal ile başlatılmış) taramaya devam eder; bitmiş sayfa ve "
+                             "kategorileri atlar. Günlüğe yazmayı da açar.")
+    parser.add_argument("--dedupe", choices=["set", "bloom"],
+                        help="Kanonik bağlantısı çalıştırmada daha önce yazılmış ürünleri atlar; "
+                             "bloom sabit bellek kullanır ama çok küçük bir oranda benzersiz ürünü de atlayabilir.")
+    parser.add_argument("--skip-unchanged", action="store_true",
+                        help="Ürün listesi bölgesi önceki çalıştırmayla aynı olan sayfaları ayrıştırmaz; "
+                             f"satırları {state_dir_path}fingerprints.sqlite dosyasından alır.")
+    parser.add_argument("--probe-pages", type=int, default=0, metavar="N",
+                        help="Sayfalayıcı okunamayan kategorilerde son sayfayı en fazla N sayfaya kadar yoklayarak bulur; 0 kapalı.")
+    parser.add_argument("--queue", metavar="KONUM",
+                        help="Görevleri paylaşılan iş kuyruğundan alır: SQLite dosyası ya da redis://host:port/db.")
+    parser.add_argument("--enqueue", action="store_true",
+                        help="--queue ile birlikte kuyruğu boşaltıp links.json'daki kategorilerle yeniden doldurur.")
+    parser.add_argument("--worker-id", help="Kuyruk işçisinin adı; varsayılan host adı ve süreç numarası.")
+    parser.add_argument("--sites", nargs="+", help="Kuyruk işçisi yalnızca bu sitelerin görevlerini alır.")
+    parser.add_argument("--visibility-timeout", type=float, default=120.0,
+                        help="Kiralanan görev bu sürede onaylanmazsa başka işçiye verilir (saniye).")
+    parser.add_argument("--record", metavar="DOSYA",
+                        help="Alınan her yanıtı replay_server.py için bu SQLite derlemesine kaydeder.")
+    parser.add_argument("--replay", metavar="ADRES",
+                        help="İstekleri canlı siteler yerine bu adresteki replay_server.py'ye yönlendirir.")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    startup = [("modül", time.perf_counter())]
+    args = parse_args()
+    startup.append(("argümanlar", time.perf_counter()))
     config = Config()
-    page_fetcher = PageFetcher(config=config)
-    scraper = WebScraper(config=config, PageFetcher=page_fetcher)
-    scraper.run()
+    startup.append(("ayarlar", time.perf_counter()))
+    rate_limiter = None if args.no_rate_limit else HostRateLimiter(initial_rate=args.host_rate, max_rate=args.max_host_rate,
+                                                                   max_concurrency=args.per_host)
+    cache = None if args.no_cache else ResponseCache(max_bytes=args.cache_size_mb * 1024 * 1024)
+    recorder = ResponseRecorder(args.record) if args.record else None
+    metrics = None if args.no_metrics else CrawlMetrics()
+    if args.engine == "async":
+        page_fetcher = AsyncPageFetcher(config=config, concurrency=args.concurrency, per_host=args.per_host,
+                                        rate_limiter=rate_limiter, cache=cache, parser=args.parser,
+                                        recorder=recorder, replay_base=args.replay, metrics=metrics,
+                                        regions=args.region_parse)
+    else:
+        page_fetcher = PageFetcher(config=config, rate_limiter=rate_limiter, cache=cache, parser=args.parser,
+                                   recorder=recorder, replay_base=args.replay, metrics=metrics,
+                                   regions=args.region_parse)
+    work_queue = open_work_queue(args.queue, args.visibility_timeout) if args.queue else None
+    journal = CrawlJournal(resume=args.resume) if (args.journal or args.resume) and not work_queue else None
+    scraper = None
+    try:
+        if work_queue and args.enqueue:
+            work_queue.seed(config.links, datetime.now().strftime("%m-%d_%H"))
+        scraper = WebScraper(config=config, PageFetcher=page_fetcher, output_format=args.output_format,
+                             incremental=args.incremental or args.delta_only, write_snapshot=not args.delta_only,
+                             metrics=metrics, journal=journal,
+                             stamp=work_queue.stamp if work_queue else None,
+                             seen={"set": SeenSet, "bloom": BloomSeenSet}[args.dedupe]() if args.dedupe else None,
+                             fingerprints=FingerprintStore() if args.skip_unchanged else None,
+                             probe_pages=args.probe_pages, page_window=args.page_window)
+        startup.append(("bileşenler", time.perf_counter()))
+        phases = []
+        previous = import_started
+        for phase, finished in startup:
+            source = (" (paketten)" if config.from_bundle else " (JSON dosyalarından)") if phase == "ayarlar" else ""
+            phases.append(f"{phase} {(finished - previous) * 1000:.0f} ms{source}")
+            if metrics:
+                metrics.inc("startup_seconds", finished - previous, phase=phase)
+            previous = finished
+        print(f"Başlangıç süresi: {', '.join(phases)}, toplam {(previous - import_started) * 1000:.0f} ms")
+        if work_queue:
+            QueueWorker(scraper, work_queue, worker_id=args.worker_id, sites=args.sites,
+                        fetch_workers=args.fetch_workers).run()
+        elif args.pipeline:
+            CrawlPipeline(scraper, fetch_workers=args.fetch_workers, parse_workers=args.parse_workers,
+                          write_queue_size=args.write_queue).run()
+        else:
+            scraper.run()
+    finally:
+        if scraper:
+            scraper.close()
+        if work_queue:
+            work_queue.close()
+        page_fetcher.close()
+        config.close()
 
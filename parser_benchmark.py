@@ -0,0 +1,103 @@
+import argparse
+import os
+import time
+import importlib.util
+
+from TechCrawler import Config, PageFetcher, WebScraper, parse_html, PARSER_BACKENDS, SITE_ADAPTERS
+
+pages_dir_path = "saved_pages/"
+
+def download_pages(config: Config, pages_dir: str) -> None:
+    """
+    links.json'daki her kategorinin ilk listeleme sayfasını site klasörlerine kaydeder.
+
+    Args:
+        config (Config): Config nesnesi.
+        pages_dir (str): Sayfaların kaydedileceği klasör.
+    """
+    page_fetcher = PageFetcher(config=config)
+    try:
+        for site_name, site_categories in config.links.items():
+            site_dir = os.path.join(pages_dir, site_name.lower().strip())
+            os.makedirs(site_dir, exist_ok=True)
+            for url, category_name in site_categories.items():
+                text = page_fetcher.fetch_text(url)
+                if text is None:
+                    print(f"Alınamadı: {url}")
+                    continue
+                with open(os.path.join(site_dir, f"{category_name}.html"), "w", encoding="utf-8") as f:
+                    f.write(text)
+    finally:
+        page_fetcher.close()
+
+def load_pages(pages_dir: str) -> dict:
+    """
+    Kaydedilmiş sayfaları site adına göre yükler.
+
+    Returns:
+        dict: Site adı -> HTML metinleri listesi.
+    """
+    pages = {}
+    for site_name in sorted(os.listdir(pages_dir)):
+        site_dir = os.path.join(pages_dir, site_name)
+        if not os.path.isdir(site_dir):
+            continue
+        for file_name in sorted(os.listdir(site_dir)):
+            if file_name.endswith(".html"):
+                with open(os.path.join(site_dir, file_name), "r", encoding="utf-8") as f:
+                    pages.setdefault(site_name, []).append(f.read())
+    return pages
+
+def available_backends() -> list:
+    """
+    Bu ortamda kurulu olan ayrıştırıcı arka uçlarını döndürür.
+    """
+    modules = {"html.parser": None, "lxml": "lxml", "selectolax": "selectolax"}
+    return [backend for backend in PARSER_BACKENDS
+            if modules[backend] is None or importlib.util.find_spec(modules[backend]) is not None]
+
+def benchmark(scraper: WebScraper, pages: dict, backends: list, repeat: int, regions: bool = False) -> list:
+    """
+    Her site ve arka uç için ayrıştırma + get_total_pages + extract_products hızını ölçer.
+    regions True ise her arka uç bir de yalnızca adaptör bölgeleri ayrıştırılarak ölçülür.
+
+    Returns:
+        list: (site, arka uç, sayfa/saniye, ürün sayısı) satırları.
+    """
+    results = []
+    for site_name, texts in pages.items():
+        adapters = [None, SITE_ADAPTERS.get(site_name)] if regions else [None]
+        for backend in backends:
+            for adapter in adapters:
+                product_count = 0
+                start_time = time.perf_counter()
+                for _ in range(repeat):
+                    product_count = 0
+                    for text in texts:
+                        soup = parse_html(text, backend, adapter)
+                        scraper.get_total_pages(soup, site_name)
+                        product_count += len(scraper.extract_products(soup, site_name))
+                elapsed = time.perf_counter() - start_time
+                label = f"{backend}+bölge" if adapter else backend
+                results.append((site_name, label, len(texts) * repeat / elapsed, product_count))
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML ayrıştırıcı arka uçlarını kaydedilmiş sayfalar üzerinde karşılaştırır.")
+    parser.add_argument("--pages-dir", default=pages_dir_path, help="Site klasörlerine ayrılmış kayıtlı sayfalar.")
+    parser.add_argument("--download", action="store_true", help="Önce her kategorinin ilk sayfasını indirip kaydeder.")
+    parser.add_argument("--repeat", type=int, default=3, help="Her sayfanın kaç kez ayrıştırılacağı.")
+    parser.add_argument("--regions", action="store_true",
+                        help="Her arka ucu bir de yalnızca ürün listesi ve sayfalayıcı bölgelerini ayrıştırarak ölçer.")
+    args = parser.parse_args()
+
+    config = Config()
+    if args.download:
+        download_pages(config, args.pages_dir)
+
+    scraper = WebScraper(config=config, PageFetcher=None)
+    results = benchmark(scraper, load_pages(args.pages_dir), available_backends(), args.repeat, args.regions)
+
+    print(f"{'site':<12}{'arka uç':<20}{'sayfa/sn':>10}{'ürün':>8}")
+    for site_name, backend, pages_per_second, product_count in results:
+        print(f"{site_name:<12}{backend:<20}{pages_per_second:>10.1f}{product_count:>8}")
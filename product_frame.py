@@ -0,0 +1,111 @@
+import argparse
+import glob
+import os
+
+import pandas as pd
+
+FRAME_COLUMNS = ["site", "kategori", "isim", "Fiyat_kurus", "Üretici", "Link"]
+CATEGORICAL_COLUMNS = ["site", "kategori", "Üretici"]
+price_pattern = r"^(?P<lira>[0-9]*)(?:,(?P<kurus>[0-9]*))?"
+
+def normalize_prices(prices: pd.Series) -> pd.Series:
+    """
+    Türkçe yazımlı fiyat sütununu ("1.234,56 TL") tek seferde kuruş cinsinden tamsayıya çevirir.
+
+    TechCrawler.parse_price_kurus ile aynı kuralı satır satır değil, vektörel dize işlemleriyle
+    uygular: rakam ve virgül dışındaki her şey atılır, ilk virgülden sonrası kuruş olarak okunur.
+    "Fiyat yok", "Fiyat bulunamadı", "nan" gibi rakam içermeyen değerler eksik (<NA>) olur.
+
+    Args:
+        prices (pd.Series): Ham Fiyat sütunu.
+
+    Returns:
+        pd.Series: Int64 tipinde, kuruş cinsinden fiyatlar.
+    """
+    digits = prices.astype("string").str.replace(r"[^0-9,]", "", regex=True)
+    parts = digits.str.extract(price_pattern)
+    valid = digits.str.contains(r"[0-9]", regex=True).fillna(False).astype(bool)
+    lira = pd.to_numeric(parts["lira"].where(parts["lira"] != "", "0"), errors="coerce")
+    kurus = pd.to_numeric((parts["kurus"].fillna("") + "00").str[:2], errors="coerce")
+    return (lira * 100 + kurus).where(valid).astype("Int64")
+
+def compact_frame(df: pd.DataFrame, site_name: str = None, category_name: str = None) -> pd.DataFrame:
+    """
+    Ürün tablosunu sıkı şemaya çevirir: Fiyat -> Fiyat_kurus (Int64), tekrarlanan alanlar kategorik.
+
+    Args:
+        df (pd.DataFrame): isim, Fiyat, Üretici, Link sütunlarını içeren ham tablo.
+        site_name (str): Verilirse site sütunu bu değerle doldurulur.
+        category_name (str): Verilirse kategori sütunu bu değerle doldurulur.
+
+    Returns:
+        pd.DataFrame: FRAME_COLUMNS sırasındaki tablo.
+    """
+    frame = pd.DataFrame({
+        "site": site_name if site_name is not None else df.get("site"),
+        "kategori": category_name if category_name is not None else df.get("kategori"),
+        "isim": df.get("isim"),
+        "Fiyat_kurus": normalize_prices(df["Fiyat"]) if "Fiyat" in df else df.get("Fiyat_kurus"),
+        "Üretici": df.get("Üretici"),
+        "Link": df.get("Link"),
+    }, index=df.index)
+    frame[["isim", "Link"]] = frame[["isim", "Link"]].astype("string")
+    frame["Fiyat_kurus"] = frame["Fiyat_kurus"].astype("Int64")
+    for column in CATEGORICAL_COLUMNS:
+        frame[column] = frame[column].astype("string").astype("category")
+    return frame
+
+def load_run(data_dir: str, category: str = None) -> pd.DataFrame:
+    """
+    Bir çalıştırma dizinindeki site/kategori dosyalarını tek sıkı tabloda birleştirir.
+
+    Dosya adları ProductWriter'ın ürettiği <site>_<kategori>.<csv|parquet> biçimindedir.
+
+    Args:
+        data_dir (str): Site_Data_<MM-DD_HH> dizini.
+        category (str): Verilirse yalnızca bu kategori yüklenir.
+
+    Returns:
+        pd.DataFrame: compact_frame şemasında, isimsiz satırları atılmış tablo.
+    """
+    frames = []
+    for site_dir in sorted(glob.glob(os.path.join(data_dir, "*"))):
+        if not os.path.isdir(site_dir):
+            continue
+        site_name = os.path.basename(site_dir).rsplit("_", 2)[0]
+        for path in sorted(glob.glob(os.path.join(site_dir, f"{site_name}_*.*"))):
+            stem, extension = os.path.splitext(os.path.basename(path))
+            category_name = stem[len(site_name) + 1:]
+            if category is not None and category_name != category:
+                continue
+            if extension == ".csv":
+                df = pd.read_csv(path, dtype=str, usecols=lambda column: column in ("isim", "Fiyat", "Üretici", "Link"))
+            elif extension == ".parquet":
+                df = pd.read_parquet(path, columns=["isim", "Fiyat", "Üretici", "Link"])
+            else:
+                continue
+            frames.append(compact_frame(df, site_name, category_name))
+    if not frames:
+        return compact_frame(pd.DataFrame(columns=["isim", "Fiyat", "Üretici", "Link"]))
+    combined = pd.concat([frame.astype({column: "string" for column in CATEGORICAL_COLUMNS}) for frame in frames],
+                         ignore_index=True)
+    combined = combined.dropna(subset=["isim"]).reset_index(drop=True)
+    return combined.astype({column: "category" for column in CATEGORICAL_COLUMNS})
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bir çalıştırmanın ürün dosyalarını sayısal fiyatlı, sıkı bir tabloya dönüştürür.")
+    parser.add_argument("data_dir", help="Site_Data_<MM-DD_HH> dizini.")
+    parser.add_argument("--category", help="Yalnızca bu kategori yüklenir.")
+    parser.add_argument("--output", help="Tablonun yazılacağı .parquet veya .csv dosyası.")
+    args = parser.parse_args()
+
+    products = load_run(args.data_dir, args.category)
+    missing = int(products["Fiyat_kurus"].isna().sum())
+    print(f"{products['site'].nunique()} site, {products['kategori'].nunique()} kategori, {len(products)} ürün "
+          f"({missing} fiyatsız), bellek: {products.memory_usage(deep=True).sum() / 1024:.1f} KB")
+    if args.output:
+        if args.output.endswith(".parquet"):
+            products.to_parquet(args.output, index=False)
+        else:
+            products.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(f"Tablo '{args.output}' dosyasına kaydedildi.")
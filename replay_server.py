@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import random
+import sqlite3
+import zlib
+from urllib.parse import urlparse
+
+from aiohttp import web
+
+class ReplayServer:
+    def __init__(self, corpus_path: str, latency: float = 0.0, jitter: float = 0.0, bandwidth: int = 0,
+                 error_rate: float = 0.0, burst_every: int = 0, burst_length: int = 0, burst_status: int = 403):
+        """
+        TechCrawler.py --record ile kaydedilmiş derlemeyi localhost üzerinden sunar.
+
+        İstek yolu "/<özgün url>" biçimindedir (TechCrawler.py --replay bu biçimi üretir). Gecikme,
+        bant genişliği ve hata enjeksiyonu ile canlı sitelerin davranışı taklit edilir; örneğin
+        --burst-every 50 --burst-length 5, error_log.json'daki teknosa 403 patlamalarına benzer
+        şekilde her host'a gelen her 50 istekten sonra 5 isteği 403 ile yanıtlar.
+
+        Args:
+            corpus_path (str): ResponseRecorder derleme dosyası.
+            latency (float): Her yanıttan önce eklenecek gecikme (saniye).
+            jitter (float): Gecikmeye eklenecek en fazla rastgele sapma (saniye).
+            bandwidth (int): Yanıt başına bant genişliği sınırı (bayt/saniye); 0 sınırsız.
+            error_rate (float): Rastgele 503 döndürme olasılığı (0-1).
+            burst_every (int): Host başına kaç istekte bir hata patlaması başlatılacağı; 0 kapalı.
+            burst_length (int): Patlamanın kaç istek süreceği.
+            burst_status (int): Patlama sırasında döndürülecek durum kodu.
+        """
+        self.connection = sqlite3.connect(f"file:{corpus_path}?mode=ro", uri=True, check_same_thread=False)
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.burst_status = burst_status
+        self.host_requests = {}
+
+    def injected_status(self, host: str) -> int:
+        """
+        İstek için hata enjekte edilecekse durum kodunu, edilmeyecekse None döndürür.
+        """
+        count = self.host_requests.get(host, 0)
+        self.host_requests[host] = count + 1
+        if self.burst_every and count % (self.burst_every + self.burst_length) >= self.burst_every:
+            return self.burst_status
+        if self.error_rate and random.random() < self.error_rate:
+            return 503
+        return None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        url = request.raw_path[1:]
+        await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        status = self.injected_status(urlparse(url).netloc)
+        if status:
+            return web.Response(status=status, text=f"{status} (enjekte edildi)")
+
+        row = self.connection.execute(
+            "SELECT status, content_type, body FROM recordings WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return web.Response(status=404, text="Derlemede bulunamadı")
+        recorded_status, content_type, body = row
+        body = zlib.decompress(body)
+
+        response = web.StreamResponse(status=recorded_status,
+                                      headers={"Content-Type": content_type or "text/html"})
+        response.content_length = len(body)
+        await response.prepare(request)
+        chunk_size = 16 * 1024
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start:start + chunk_size]
+            await response.write(chunk)
+            if self.bandwidth:
+                await asyncio.sleep(len(chunk) / self.bandwidth)
+        await response.write_eof()
+        return response
+
+    def app(self) -> web.Application:
+        application = web.Application()
+        application.router.add_route("GET", "/{tail:.*}", self.handle)
+        return application
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Kaydedilmiş yanıt derlemesini ağ olmadan uçtan uca kıyaslama için sunar. "
+                    "Kullanım: python TechCrawler.py --record derleme.sqlite ile kaydedin, bu sunucuyu başlatın, "
+                    "sonra python TechCrawler.py --replay http://127.0.0.1:8080 --no-cache ile taramayı çalıştırın.")
+    parser.add_argument("corpus", help="TechCrawler.py --record ile oluşturulan derleme dosyası.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Yanıt gecikmesi (saniye).")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Gecikmeye eklenecek en fazla rastgele sapma (saniye).")
+    parser.add_argument("--bandwidth", type=int, default=0, help="Yanıt başına bant genişliği (KB/sn); 0 sınırsız.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Rastgele 503 olasılığı (0-1).")
+    parser.add_argument("--burst-every", type=int, default=0, help="Host başına kaç istekte bir hata patlaması başlar.")
+    parser.add_argument("--burst-length", type=int, default=0, help="Hata patlamasının kaç istek sürdüğü.")
+    parser.add_argument("--burst-status", type=int, default=403, help="Patlama sırasında dönen durum kodu.")
+    args = parser.parse_args()
+
+    server = ReplayServer(args.corpus, latency=args.latency, jitter=args.jitter, bandwidth=args.bandwidth * 1024,
+                          error_rate=args.error_rate, burst_every=args.burst_every,
+                          burst_length=args.burst_length, burst_status=args.burst_status)
+    web.run_app(server.app(), host=args.host, port=args.port)
@@ -1,27 +1,103 @@
-import os
+import argparse
+import re
+from itertools import combinations
+
+import numpy as np
 import pandas as pd
 from rapidfuzz import process
 from rapidfuzz import fuzz
+from rapidfuzz import utils
+
+from product_frame import load_run
+
+model_token_pattern = re.compile(r"[a-z]*\d[a-z0-9]*")
+
+def load_category(data_dir: str, category: str) -> pd.DataFrame:
+    """
+    Bir çalıştırma dizinindeki tüm sitelerin aynı kategoriye ait dosyalarını tek tabloda birleştirir.
+
+    Args:
+        data_dir (str): Site_Data_<MM-DD_HH> dizini.
+        category (str): links.json'daki kategori adı (ör. "cpu").
+
+    Returns:
+        pd.DataFrame: product_frame.load_run şemasında (Fiyat_kurus Int64, site/Üretici kategorik) tablo.
+    """
+    return load_run(data_dir, category)
+
+def block_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Her ürün için (üretici, model belirteci) blok anahtarlarını üretir.
+
+    Model belirteçleri rakam içeren kelimelerdir ("4070", "7800x3d", "b650m"); rakam içermeyen
+    ürünler yalnızca üretici bloğuna düşer.
+
+    Returns:
+        pd.DataFrame: row ve key sütunlarından oluşan, her satırın her anahtarı için bir kayıt.
+    """
+    manufacturer = df["Üretici"].astype("string").fillna("").str.casefold().str.strip()
+    tokens = df["isim"].astype(str).str.casefold().str.findall(model_token_pattern)
+    keys = pd.DataFrame({"row": df.index, "manufacturer": manufacturer, "token": tokens})
+    keys["token"] = keys["token"].map(lambda values: sorted(set(values)) or [""])
+    keys = keys.explode("token")
+    keys["key"] = keys["manufacturer"] + "|" + keys["token"]
+    return keys[["row", "key"]]
+
+def match_products(df: pd.DataFrame, threshold: int = 80, workers: int = -1) -> pd.DataFrame:
+    """
+    Farklı sitelerdeki aynı ürünleri bloklama + toplu benzerlik matrisiyle eşleştirir.
 
-dosya1 = "Site_Data_11-05_06/Sinerji_11-05_06/Sinerji_cpu.csv"
-dosya2 = "Site_Data_11-05_06/Itopya_11-05_06/Itopya_cpu.csv"
+    Her blokta her site çifti için rapidfuzz.process.cdist tek çağrıda ve tüm çekirdeklerle
+    hesaplanır; eşiği geçen çiftler birden fazla blokta çıksa bile bir kez, en yüksek skorla tutulur.
 
-df1 = pd.read_csv(dosya1)
-df2 = pd.read_csv(dosya2)
+    Args:
+        df (pd.DataFrame): load_category çıktısı.
+        threshold (int): Eşleşme sayılacak en düşük skor (0-100).
+        workers (int): cdist için iş parçacığı sayısı; -1 tüm çekirdekler.
 
-d1_kolon = df1.keys().to_list()
-d2_kolon = df2.keys().to_list()
+    Returns:
+        pd.DataFrame: İki ürünün site/isim/fiyat/bağlantı bilgileri ve skorundan oluşan eşleşme tablosu.
+    """
+    names = [utils.default_process(name) for name in df["isim"]]
+    sites = df["site"].astype(str).to_numpy()
+    best = {}
+    for _, block in block_keys(df).groupby("key"):
+        rows = block["row"].to_numpy()
+        block_sites = sites[rows]
+        for site_a, site_b in combinations(np.unique(block_sites), 2):
+            rows_a = rows[block_sites == site_a]
+            rows_b = rows[block_sites == site_b]
+            scores = process.cdist([names[i] for i in rows_a], [names[i] for i in rows_b],
+                                   scorer=fuzz.token_sort_ratio, score_cutoff=threshold,
+                                   dtype=np.uint8, workers=workers)
+            for i, j in zip(*np.nonzero(scores)):
+                pair = (rows_a[i], rows_b[j])
+                best[pair] = max(best.get(pair, 0), int(scores[i, j]))
 
-print(d1_kolon)
-print(d2_kolon)
+    columns = ["site", "isim", "Fiyat_kurus", "Link"]
+    if not best:
+        return pd.DataFrame(columns=[f"{column}_1" for column in columns] + [f"{column}_2" for column in columns] + ["skor"])
+    pairs = np.array(list(best.keys()))
+    left = df.loc[pairs[:, 0], columns].add_suffix("_1").reset_index(drop=True)
+    right = df.loc[pairs[:, 1], columns].add_suffix("_2").reset_index(drop=True)
+    matches = pd.concat([left, right], axis=1)
+    matches["skor"] = list(best.values())
+    return matches.sort_values(["skor", "isim_1"], ascending=[False, True], ignore_index=True)
 
-d1_isim = d1_kolon[0]
-d2_isim = d2_kolon[0]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bir kategorideki ürünleri tüm siteler arasında eşleştirir.")
+    parser.add_argument("data_dir", help="Site_Data_<MM-DD_HH> dizini.")
+    parser.add_argument("category", help="Kategori adı, ör. cpu.")
+    parser.add_argument("--threshold", type=int, default=80, help="En düşük benzerlik skoru.")
+    parser.add_argument("--workers", type=int, default=-1, help="cdist iş parçacığı sayısı; -1 tüm çekirdekler.")
+    parser.add_argument("--output", help="Eşleşme tablosunun yazılacağı CSV; verilmezse ekrana basılır.")
+    args = parser.parse_args()
 
-for index, row in df1.iterrows():
-    name1 = row[d1_isim]
-    for index2, row2 in df2.iterrows():
-        name2 = row2[d2_isim]
-        deneme = fuzz.ratio(name1, name2)
-        if deneme > 80:
-            print(f"{name1} ile {name2} arasındaki benzerlik: {deneme}")
+    products = load_category(args.data_dir, args.category)
+    print(f"{products['site'].nunique()} siteden {len(products)} ürün yüklendi.")
+    matches = match_products(products, args.threshold, args.workers)
+    if args.output:
+        matches.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(f"{len(matches)} eşleşme '{args.output}' dosyasına kaydedildi.")
+    else:
+        print(matches.to_string())
@@ -0,0 +1,303 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import zlib
+import xml.etree.ElementTree as ET
+from contextlib import asynccontextmanager
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+
+from TechCrawler import Config, HostRateLimiter, SITE_ADAPTERS, cofig_dir_path
+
+link_storage_dir_path = "link_storage/"
+
+SITEMAP_PATTERNS = {
+    "sinerji": {"category": r"-c-\d+/?$", "product": r"-p-\d+/?$"},
+    "teknosa": {"category": r"-c-\d+/?$", "product": r"-p-\d+/?$"},
+    "itopya": {"category": r"_k\d+/?$", "product": r"_u\d+/?$"},
+    "incehesap": {"category": r"-fiyatlari/?$", "product": r"-fiyati-\d+/?$"},
+    "gamegaraj": {"category": r"/grup/", "product": r"/urun/"},
+    "tebilon": {"category": r"/bilgisayar-parcalari/[^/]+/?$", "product": r"/urun/|-p-\d+/?$"},
+}
+CATEGORY_HINTS = ("categor", "kategori", "grup")
+PRODUCT_HINTS = ("product", "urun")
+slug_id_pattern = re.compile(r"(-c-\d+|_k\d+|-fiyatlari)$")
+
+def local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def category_slug(url: str) -> str:
+    """
+    Kategori bağlantısının kimlik ekleri atılmış son yol parçasını döndürür ("islemci-c-1" -> "islemci").
+    """
+    segment = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1].lower()
+    return slug_id_pattern.sub("", segment)
+
+def category_title(url: str) -> str:
+    return category_slug(url).replace("-", " ").replace("_", " ").strip().title()
+
+class SitemapDiscovery:
+    def __init__(self, config: Config, concurrency: int = 8, rate_limiter: HostRateLimiter = None,
+                 output_dir: str = link_storage_dir_path, emit_products: bool = True, max_depth: int = 3):
+        """
+        Sitelerin robots.txt ve sitemap dosyalarından kategori ve ürün bağlantılarını eşzamanlı olarak toplar.
+
+        Sitemap'ler akış halinde indirilip XMLPullParser ile parça parça ayrıştırılır; işlenen her
+        <url>/<sitemap> öğesi hemen silindiği için bellek kullanımı dosya boyutundan bağımsızdır.
+        Sıkıştırılmış (.xml.gz) dosyalar da akış halinde açılır.
+
+        Args:
+            config (Config): Config nesnesi.
+            concurrency (int): Site başına aynı anda indirilecek en fazla sitemap sayısı.
+            rate_limiter (HostRateLimiter): Verilirse istekler host başına hız sınırına uyar.
+            output_dir (str): <site>_collected_urls.json ve <site>_product_urls.txt dosyalarının klasörü.
+            emit_products (bool): True ise ürün bağlantıları <site>_product_urls.txt dosyasına yazılır.
+            max_depth (int): İç içe sitemap index'lerinde inilecek en fazla derinlik.
+        """
+        self.config = config
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.output_dir = output_dir
+        self.emit_products = emit_products
+        self.max_depth = max_depth
+
+    def headers(self) -> dict:
+        user_agents = self.config.user_agents.get('user_agents', []) if self.config.user_agents else []
+        return dict(random.choice(user_agents)) if user_agents else {}
+
+    @asynccontextmanager
+    async def get(self, session: aiohttp.ClientSession, url: str):
+        """
+        İstek hakkını alıp yanıtı verir; hata durumunda None verir. Yanıt ve host'un istek hakkı
+        blok bitince, yani gövde okunduktan sonra bırakılır.
+        """
+        host = urlparse(url).netloc
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(host)
+        status = None
+        response = None
+        try:
+            try:
+                response = await session.get(url, headers=self.headers(), timeout=aiohttp.ClientTimeout(total=120))
+                status = response.status
+                if status != 200:
+                    print(f"{url} alınamadı: {status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.config.save_error_to_json(e)
+                print(f"{url} alınamadı: {e}")
+            yield response if status == 200 else None
+        finally:
+            if response is not None:
+                response.release()
+            if self.rate_limiter:
+                self.rate_limiter.release(host, status)
+
+    async def sitemap_roots(self, session: aiohttp.ClientSession, base_url: str) -> list:
+        """
+        robots.txt'deki Sitemap: satırlarını döndürür; yoksa /sitemap.xml varsayılır.
+        """
+        roots = []
+        async with self.get(session, urljoin(base_url, "/robots.txt")) as response:
+            if response:
+                for line in (await response.text(errors="replace")).splitlines():
+                    key, _, value = line.partition(":")
+                    if key.strip().lower() == "sitemap" and value.strip():
+                        roots.append(value.strip())
+        return roots or [urljoin(base_url, "/sitemap.xml")]
+
+    async def stream_sitemap(self, session: aiohttp.ClientSession, url: str, on_sitemap, on_url) -> None:
+        """
+        Bir sitemap dosyasını indirirken ayrıştırır ve her öğeyi geri çağırımlara iletir.
+
+        Args:
+            url (str): Sitemap veya sitemap index adresi.
+            on_sitemap (callable): Index'teki her alt sitemap adresi için çağrılır.
+            on_url (callable): Her <url><loc> adresi için çağrılır.
+        """
+        async with self.get(session, url) as response:
+            if response is None:
+                return
+            parser = ET.XMLPullParser(events=("start", "end"))
+            decompressor = None
+            root = None
+            try:
+                first_chunk = True
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    if first_chunk:
+                        first_chunk = False
+                        if chunk[:2] == b"\x1f\x8b":
+                            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    parser.feed(decompressor.decompress(chunk) if decompressor else chunk)
+                    for event, element in parser.read_events():
+                        if event == "start":
+                            if root is None:
+                                root = element
+                            continue
+                        name = local_name(element.tag)
+                        if name not in ("sitemap", "url"):
+                            continue
+                        loc = next((child.text for child in element if local_name(child.tag) == "loc"), None)
+                        if loc:
+                            (on_sitemap if name == "sitemap" else on_url)(loc.strip())
+                        root.clear()
+                parser.close()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ET.ParseError, zlib.error) as e:
+                self.config.save_error_to_json(e)
+                print(f"{url} ayrıştırılamadı: {e}")
+
+    async def discover_site(self, session: aiohttp.ClientSession, site_name: str) -> dict:
+        """
+        Bir sitenin tüm sitemap ağacını gezip kategori bağlantılarını toplar, ürün bağlantılarını dosyaya akıtır.
+
+        Returns:
+            dict: categories (adres -> başlık) ve products (ürün sayısı) anahtarları.
+        """
+        adapter = SITE_ADAPTERS[site_name.lower()]
+        patterns = SITEMAP_PATTERNS.get(adapter.name, {})
+        category_pattern = re.compile(patterns["category"]) if "category" in patterns else None
+        product_pattern = re.compile(patterns["product"]) if "product" in patterns else None
+        categories = {}
+        product_count = 0
+        product_file = None
+        product_path = os.path.join(self.output_dir, f"{adapter.name}_product_urls.txt")
+        if self.emit_products:
+            product_file = open(f"{product_path}.part", "w", encoding="utf-8")
+
+        host = urlparse(adapter.base_url).netloc
+        seen = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def visit(url: str, depth: int) -> None:
+            if url in seen or depth > self.max_depth:
+                return
+            seen.add(url)
+            children = []
+            hint = url.lower()
+            is_category_map = any(word in hint for word in CATEGORY_HINTS)
+            is_product_map = any(word in hint for word in PRODUCT_HINTS)
+
+            def on_url(loc: str) -> None:
+                nonlocal product_count
+                if urlparse(loc).netloc != host:
+                    return
+                if (category_pattern and category_pattern.search(loc)) or is_category_map:
+                    categories[loc] = category_title(loc)
+                elif (product_pattern and product_pattern.search(loc)) or is_product_map:
+                    product_count += 1
+                    if product_file:
+                        product_file.write(loc + "\n")
+
+            async with semaphore:
+                await self.stream_sitemap(session, url, children.append, on_url)
+            await asyncio.gather(*(visit(child, depth + 1) for child in children))
+
+        try:
+            roots = await self.sitemap_roots(session, adapter.base_url)
+            await asyncio.gather(*(visit(root, 0) for root in roots))
+        finally:
+            if product_file:
+                product_file.close()
+                if product_count:
+                    os.replace(f"{product_path}.part", product_path)
+                else:
+                    os.remove(f"{product_path}.part")
+
+        if categories:
+            with open(os.path.join(self.output_dir, f"{adapter.name}_collected_urls.json"), "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(categories.items())), f, ensure_ascii=False, indent=4)
+        print(f"{site_name}: {len(seen)} sitemap, {len(categories)} kategori, {product_count} ürün bağlantısı")
+        return {"categories": categories, "products": product_count}
+
+    async def discover(self, site_names: list) -> dict:
+        """
+        Tüm siteleri aynı anda keşfeder.
+
+        Returns:
+            dict: Küçük harfli site adı -> discover_site sonucu.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        connector = aiohttp.TCPConnector(limit=self.concurrency * len(site_names), ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*(self.discover_site(session, site_name) for site_name in site_names),
+                                           return_exceptions=True)
+        discovered = {}
+        for site_name, result in zip(site_names, results):
+            if isinstance(result, Exception):
+                self.config.save_error_to_json(result)
+                print(f"{site_name} keşfedilemedi: {result}")
+            else:
+                discovered[site_name.lower().strip()] = result
+        return discovered
+
+def refresh_links(links: dict, discovered: dict) -> tuple:
+    """
+    links.json'daki kategori adreslerini keşfedilen kategorilerle karşılaştırıp günceller.
+
+    Sitemap'te bulunmayan bir adres, kimlik eki dışında aynı yola sahip yeni bir adresle
+    ("islemci-c-1" -> "islemci-c-7") değiştirilir; eşi bulunamayanlar olduğu gibi bırakılıp raporlanır.
+    Site adları, tarayıcıda olduğu gibi büyük/küçük harf ayrımı yapılmadan eşleştirilir.
+
+    Returns:
+        tuple: (güncel links sözlüğü, değişen adresler listesi, bulunamayan adresler listesi)
+    """
+    refreshed = {}
+    changed = []
+    missing = []
+    for site_name, site_categories in links.items():
+        found = discovered.get(site_name.lower().strip(), {}).get("categories")
+        if not found:
+            refreshed[site_name] = dict(site_categories)
+            continue
+        normalized = {url.rstrip("/"): url for url in found}
+        by_slug = {}
+        for url in found:
+            by_slug.setdefault(category_slug(url), url)
+        refreshed[site_name] = {}
+        for url, category_name in site_categories.items():
+            new_url = url
+            if url.rstrip("/") not in normalized:
+                new_url = by_slug.get(category_slug(url), url)
+                (changed if new_url != url else missing).append((site_name, url, new_url))
+            refreshed[site_name][new_url] = category_name
+    return refreshed, changed, missing
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sitemap'lerden kategori ve ürün bağlantılarını keşfeder; links.json'ı tazeler.")
+    parser.add_argument("--sites", nargs="+", help="Yalnızca bu siteler (links.json adlarıyla); varsayılan tümü.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Site başına eşzamanlı sitemap indirme sayısı.")
+    parser.add_argument("--host-rate", type=float, default=2.0, help="Host başına başlangıç istek hızı (istek/sn).")
+    parser.add_argument("--output-dir", default=link_storage_dir_path, help="Toplanan bağlantıların yazılacağı klasör.")
+    parser.add_argument("--no-products", action="store_true", help="Ürün bağlantılarını dosyaya yazmaz.")
+    parser.add_argument("--update-links", action="store_true", help="Değişen kategori adreslerini links.json'a yazar.")
+    args = parser.parse_args()
+
+    config = Config()
+    try:
+        known_sites = [name.lower().strip() for name in config.links]
+        site_names = [name.lower().strip() for name in args.sites] if args.sites else \
+            [name for name in known_sites if name in SITE_ADAPTERS]
+        for site_name in [name for name in site_names if name not in known_sites or name not in SITE_ADAPTERS]:
+            print(f"{site_name}: links.json'da ya da site adaptörlerinde yok, atlandı.")
+            site_names.remove(site_name)
+        if not site_names:
+            parser.error("keşfedilecek site yok.")
+        discovery = SitemapDiscovery(config, concurrency=args.concurrency,
+                                     rate_limiter=HostRateLimiter(initial_rate=args.host_rate),
+                                     output_dir=args.output_dir, emit_products=not args.no_products)
+        discovered = asyncio.run(discovery.discover(site_names))
+
+        links, changed, missing = refresh_links(config.links, discovered)
+        for site_name, url, new_url in changed:
+            print(f"{site_name}: {url} -> {new_url}")
+        for site_name, url, _ in missing:
+            print(f"{site_name}: {url} sitemap'te bulunamadı")
+        if args.update_links and changed:
+            with open(f"{cofig_dir_path}links.json", "w", encoding="utf-8") as f:
+                json.dump(links, f, ensure_ascii=False, indent=4)
+            print(f"links.json güncellendi ({len(changed)} adres).")
+    finally:
+        config.close()
@@ -0,0 +1,94 @@
+"""
+Testlerde kullanılan, her adaptörün seçicilerine uyan küçük listeleme sayfaları.
+"""
+
+def _page(body: str, head: str = "", nonce: str = "a1") -> str:
+    return (f'<!DOCTYPE html><html><head><meta name="csrf-token" content="{nonce}">{head}</head><body>'
+            f'<header><nav><a href="/kampanya">Kampanya</a></nav></header>'
+            f'<script nonce="{nonce}">window.session = "{nonce}";</script>{body}'
+            f'<footer><a href="/iletisim">İletişim</a></footer></body></html>')
+
+def _gamegaraj(price: str, nonce: str) -> str:
+    product = (f'<li class="product"><h5 class="edgtf-product-list-title"><a href="https://www.gamegaraj.com/urun/rtx-4060/">'
+               f'Asus RTX 4060</a></h5><span class="price"><ins><span class="woocommerce-Price-amount">{price} ₺</span></ins></span></li>')
+    return _page(f'<div class="edgtf-wrapper"><div><div class="edgtf-content"><div><div class="edgtf-container"><div><div>'
+                 f'<div class="edgtf-page-content-holder edgtf-grid-col-9 edgtf-grid-col-push-3"><ul>{product}</ul>'
+                 f'<nav><ul><li><span>1</span></li><li><a href="/page/3/">3</a></li></ul></nav>'
+                 f'</div></div></div></div></div></div></div></div>', nonce=nonce)
+
+def _itopya(price: str, nonce: str) -> str:
+    product = (f'<div class="product"><div class="product-body"><h2><a href="/msi-b650">MSI B650</a></h2></div>'
+               f'<div class="product-footer"><div class="price"><strong>{price}&nbsp;₺</strong></div></div></div>')
+    return _page(f'<section class="container-fluid"><div><div class="col-12 col-md-9 col-lg-9 col-xl-10">'
+                 f'<div>a</div><div>b</div><div>c</div><div id="productList">{product}</div>'
+                 f'<div><div class="actions"><span><strong>1/4</strong></span></div></div></div></div></section>', nonce=nonce)
+
+def _sinerji(price: str, nonce: str) -> str:
+    product = (f'<article><div class="title"><a href="/amd-ryzen-7">AMD Ryzen 7</a></div><ul><li>Soket: AM5</li></ul>'
+               f'<div class="row"><div class="col"><span>{price} TL</span></div></div></article>')
+    return _page(f'<section>{product}</section><div><a href="?px=2">2</a></div>', nonce=nonce)
+
+def _incehesap(price: str, nonce: str) -> str:
+    product = (f'<a href="/kingston-fury/"><div class="line-clamp-2 h-11 text-center leading-tight px-1 lg:px-4 md:space-x-3">'
+               f'Kingston Fury</div><span class="mx-auto whitespace-nowrap text-lg font-bold leading-none tracking-tight '
+               f'text-orange-500 md:text-2xl mb-2">{price} TL</span></a>')
+    return _page(f'<main><div class="container space-y-5 pb-5"><div class="flex flex-col xl:flex-row gap-5"><div>'
+                 f'<div>x</div><div class="card flex items-center justify-betweensm:px-6"><nav><a href="/ram/sayfa-5/">5</a></nav></div>'
+                 f'<div>y</div><div><div class="grid grid-cols-2 md:grid-cols-3 gap-1">{product}</div></div>'
+                 f'</div></div></div></main>', nonce=nonce)
+
+def _teknosa(price: str, nonce: str) -> str:
+    product = (f'<div id="product-item"><a href="/samsung-monitor" title="Samsung Monitör">s</a>'
+               f'<input type="hidden" value="{price}"></div>')
+    return _page(f'<div id="site-main"><div><div><div class="col-12 section-1"><div><div><div class="plp-grid">'
+                 f'<div class="plp-body">{product}<div class="plp-paging"><div class="plp-paging-button"><button>'
+                 f'<span>Daha fazla (1 / 3)</span></button></div></div></div></div></div></div></div></div></div></div>', nonce=nonce)
+
+def _tebilon(price: str, nonce: str) -> str:
+    product = (f'<div><div><div><div class="showcase__shadow col-md-12 no-padding">'
+               f'<div class="showcase__title col-md-12 text-center no-padding mobileShow"><a href="/corsair-psu">Corsair PSU</a></div>'
+               f'<div>a</div><div>b</div><div><div><div><div class="new newPrice col-md-12 col-12 text-center">{price} ₺</div>'
+               f'</div></div></div></div></div></div></div>')
+    return _page(f'<div id="mainPage"><main><section class="showcase"><div><div>'
+                 f'<div class="showcase__showcaseProducts col-md-12 col-sm-12 col-xs-12 mobileShow">'
+                 f'<div id="allProducts"><div>{product}</div></div>'
+                 f'<div class="col-md-12 productSort__paginationBottom"><div><a>1</a><a>2</a><a>3</a><a>...</a><a>6</a></div></div>'
+                 f'</div></div></div></section></main></div>', nonce=nonce)
+
+BUILDERS = {"gamegaraj": _gamegaraj, "itopya": _itopya, "sinerji": _sinerji, "incehesap": _incehesap,
+            "teknosa": _teknosa, "tebilon": _tebilon}
+
+def listing_page(site_name: str, price: str = "12.999,00", nonce: str = "a1") -> str:
+    """
+    Verilen sitenin düzeninde tek ürünlü bir listeleme sayfası döndürür.
+    """
+    return BUILDERS[site_name](price, nonce)
+
+def structured_script(products: list) -> str:
+    """
+    Ürünleri JSON-LD ItemList olarak taşıyan betik etiketini döndürür.
+
+    Args:
+        products (list): (isim, fiyat, bağlantı) üçlüleri; fiyat None ise offers yazılmaz.
+    """
+    import json
+    items = []
+    for position, (name, price, url) in enumerate(products, 1):
+        product = {"@type": "Product", "name": name, "url": url}
+        if price is not None:
+            product["offers"] = {"@type": "Offer", "price": price, "priceCurrency": "TRY"}
+        items.append({"@type": "ListItem", "position": position, "item": product})
+    data = {"@context": "https://schema.org", "@type": "ItemList", "itemListElement": items}
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+def structured_page(products: list, nonce: str = "a1") -> str:
+    """
+    head içinde JSON-LD ItemList taşıyan, DOM'da ürün ızgarası olmayan bir sayfa döndürür.
+    """
+    return _page("<div>boş</div>", head=structured_script(products), nonce=nonce)
+
+def listing_page_with_structured(site_name: str, products: list, price: str = "12.999,00") -> str:
+    """
+    Sitenin tek ürünlü listeleme sayfasının head'ine verilen ürünlerin JSON-LD verisini ekler.
+    """
+    return listing_page(site_name, price).replace("</head>", structured_script(products) + "</head>", 1)
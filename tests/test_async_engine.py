@@ -0,0 +1,55 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from TechCrawler import AsyncPageFetcher, Config, WebScraper
+
+from site_pages import listing_page
+
+class SlowListing(BaseHTTPRequestHandler):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    served = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(0.3)
+        body = listing_page("sinerji").replace('<a href="?px=2">2</a>', "").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with cls.lock:
+            cls.in_flight -= 1
+            cls.served += 1
+
+    def log_message(self, *args):
+        pass
+
+def test_categories_are_not_capped_by_threads(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowListing)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    categories = os.cpu_count() * 2 + 16
+    config = Config(bundle_path=None)
+    config.links = {"sinerji": {f"http://127.0.0.1:{server.server_port}/k{index}": f"k{index}"
+                                for index in range(categories)}}
+    monkeypatch.chdir(tmp_path)
+    fetcher = AsyncPageFetcher(config, per_host=categories)
+    scraper = WebScraper(config, fetcher)
+    try:
+        scraper.run()
+    finally:
+        fetcher.close()
+        server.shutdown()
+    assert SlowListing.served == categories
+    assert SlowListing.peak > os.cpu_count() * 2
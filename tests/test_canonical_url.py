@@ -0,0 +1,37 @@
+import pytest
+
+from TechCrawler import Config, SeenSet, WebScraper, canonical_url, parse_html
+
+from site_pages import listing_page
+
+@pytest.mark.parametrize("link, expected", [
+    ("HTTPS://WWW.Itopya.com:443//msi-b650/?utm_source=x&b=2&a=1#yorumlar", "https://www.itopya.com/msi-b650?a=1&b=2"),
+    ("http://example.test:8080/urun/", "http://example.test:8080/urun"),
+    ("Link bulunamadı", "Link bulunamadı")])
+def test_canonical_url(link, expected):
+    assert canonical_url(link) == expected
+
+@pytest.mark.parametrize("link", ["https://www.itopya.com:99999/msi-b650", "https://www.itopya.com:abc/msi-b650",
+                                  "https://[::1/msi-b650"])
+def test_malformed_link_is_kept(link):
+    assert canonical_url(link) == link
+
+@pytest.fixture
+def config():
+    config = Config(bundle_path=None)
+    yield config
+    config.close()
+
+def test_extracted_link_is_not_rewritten(config):
+    scraper = WebScraper(config, None)
+    [product] = scraper.extract_products(parse_html(listing_page("gamegaraj")), "gamegaraj")
+    assert product["Link"] == "https://www.gamegaraj.com/urun/rtx-4060/"
+
+def test_dedupe_uses_canonical_key_and_keeps_scraped_link(config):
+    scraper = WebScraper(config, None, write_snapshot=False, seen=SeenSet())
+    first = [{"isim": "RTX 4060", "Fiyat": "1,00", "Link": "https://www.gamegaraj.com/urun/rtx-4060/?ref=x"}]
+    again = [{"isim": "RTX 4060", "Fiyat": "1,00", "Link": "https://WWW.gamegaraj.com/urun/rtx-4060"}]
+    assert scraper.write_page(None, first, "gamegaraj", "gpu") == 1
+    assert scraper.write_page(None, again, "gamegaraj", "gpu") == 0
+    assert first[0]["Link"] == "https://www.gamegaraj.com/urun/rtx-4060/?ref=x"
+    assert scraper.duplicates_dropped == 1
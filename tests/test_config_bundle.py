@@ -0,0 +1,38 @@
+import os
+import pickle
+
+import pytest
+
+from TechCrawler import Config
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _write_bundle(path, signature, settings):
+    with open(path, "wb") as f:
+        pickle.dump((signature, settings), f)
+
+def test_bundle_is_reused(tmp_path):
+    bundle_path = str(tmp_path / "config_bundle.pickle")
+    Config(bundle_path=bundle_path, log_errors=False).close()
+    config = Config(bundle_path=bundle_path, log_errors=False)
+    assert config.from_bundle and config.links
+    config.close()
+
+def test_bundle_with_unexpected_settings_falls_back_to_json(tmp_path):
+    bundle_path = str(tmp_path / "config_bundle.pickle")
+    _write_bundle(bundle_path, Config.bundle_signature(), {"links": {}, "manufacturers": {}, "user_agents": {}})
+    config = Config(bundle_path=bundle_path, log_errors=False)
+    assert not config.from_bundle and config.links
+    config.close()
+
+def test_bundle_from_older_format_falls_back_to_json(tmp_path):
+    bundle_path = str(tmp_path / "config_bundle.pickle")
+    Config(bundle_path=bundle_path, log_errors=False).close()
+    with open(bundle_path, "rb") as f:
+        signature, settings = pickle.load(f)
+    _write_bundle(bundle_path, signature[1:], settings)
+    config = Config(bundle_path=bundle_path, log_errors=False)
+    assert not config.from_bundle
+    config.close()
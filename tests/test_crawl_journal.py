@@ -0,0 +1,34 @@
+from TechCrawler import CrawlJournal
+
+def _unfinished_run(path, stamp):
+    journal = CrawlJournal(path, stamp=stamp)
+    journal.record_page("itopya", "cpu", 1, 3, [{"isim": "MSI B650", "Fiyat": "1,00"}])
+    journal.record_page("itopya", "cpu", 2, 3, [{"isim": "MSI X670", "Fiyat": "2,00"}])
+    journal.finish_category("sinerji", "gpu")
+    assert not journal.finish_run(total_categories=2)
+    journal.close()
+
+def _counts(path):
+    journal = CrawlJournal(path, resume=True)
+    counts = tuple(journal.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                   for table in ("runs", "pages", "categories"))
+    journal.close()
+    return counts
+
+def test_new_run_drops_earlier_unfinished_runs(tmp_path):
+    path = str(tmp_path / "journal.sqlite")
+    _unfinished_run(path, "01-01_10")
+    _unfinished_run(path, "01-01_11")
+    assert _counts(path) == (1, 2, 1)
+
+def test_resume_keeps_unfinished_run(tmp_path):
+    path = str(tmp_path / "journal.sqlite")
+    _unfinished_run(path, "01-01_10")
+    journal = CrawlJournal(path, resume=True)
+    assert journal.resumed and journal.stamp == "01-01_10"
+    assert journal.completed_pages("itopya", "cpu") == {1: 3, 2: 3}
+    assert journal.load_rows("itopya", "cpu", 2) == [{"isim": "MSI X670", "Fiyat": "2,00"}]
+    assert journal.is_category_done("sinerji", "gpu")
+    assert journal.finish_run(total_categories=1)
+    journal.close()
+    assert _counts(path)[1] == 0
@@ -0,0 +1,30 @@
+import pytest
+
+from TechCrawler import Config, WebScraper, SITE_ADAPTERS, parse_html
+
+from site_pages import listing_page, structured_page
+
+@pytest.fixture(scope="module")
+def scraper():
+    config = Config(bundle_path=None)
+    yield WebScraper(config=config, PageFetcher=None)
+    config.close()
+
+@pytest.mark.parametrize("site_name", sorted(SITE_ADAPTERS))
+def test_price_change_breaks_fingerprint(scraper, site_name):
+    adapter = SITE_ADAPTERS[site_name]
+    before, after = listing_page(site_name, "12.999,00"), listing_page(site_name, "11.499,00")
+    extracted = [scraper.extract_products(parse_html(text), site_name)[0]["Fiyat"] for text in (before, after)]
+    assert extracted[0] != extracted[1]
+    assert adapter.fingerprint(before) != adapter.fingerprint(after)
+
+@pytest.mark.parametrize("site_name", sorted(SITE_ADAPTERS))
+def test_volatile_markup_keeps_fingerprint(site_name):
+    adapter = SITE_ADAPTERS[site_name]
+    assert adapter.fingerprint(listing_page(site_name, nonce="a1")) == adapter.fingerprint(listing_page(site_name, nonce="b2"))
+
+def test_structured_price_change_breaks_fingerprint():
+    adapter = SITE_ADAPTERS["teknosa"]
+    before = structured_page([("Samsung Monitör", "8999.00", "https://www.teknosa.com/samsung-monitor")])
+    after = structured_page([("Samsung Monitör", "8499.00", "https://www.teknosa.com/samsung-monitor")])
+    assert adapter.fingerprint(before) != adapter.fingerprint(after)
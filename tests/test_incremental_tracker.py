@@ -0,0 +1,31 @@
+import multiprocessing
+
+from TechCrawler import IncrementalTracker
+
+def _crawl(state_path, delta_path, category_name, errors):
+    try:
+        tracker = IncrementalTracker(state_path, delta_path)
+        for page_num in range(40):
+            tracker.observe("itopya", category_name, [
+                {"Link": f"https://www.itopya.com/urun-{page_num}-{index}", "isim": "MSI", "Fiyat": f"{index},00"}
+                for index in range(20)])
+        tracker.finish_category("itopya", category_name)
+        tracker.close()
+    except Exception as e:
+        errors.put(repr(e))
+
+def test_workers_share_state_file(tmp_path):
+    state_path = str(tmp_path / "product_state.sqlite")
+    errors = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_crawl, args=(state_path, str(tmp_path / f"delta_{index}.jsonl"),
+                                                            f"cat{index}", errors))
+               for index in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(120)
+    assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+    assert errors.empty()
+    tracker = IncrementalTracker(state_path, str(tmp_path / "delta_check.jsonl"))
+    assert tracker.connection.execute("SELECT COUNT(*) FROM products").fetchone()[0] == 800
+    tracker.close()
@@ -0,0 +1,29 @@
+import pytest
+
+from TechCrawler import ManufacturerMatcher
+
+MANUFACTURERS = {"MSI": "MSI", "Gigabyte": "Gigabyte", "Kingston": "Kingston", "G.SKILL": "G.SKILL",
+                 "Samsung": "Samsung", "Samsung SSD": "Samsung Semiconductor"}
+
+@pytest.mark.parametrize("name, expected", [
+    ("GİGABYTE RTX 4060", "Gigabyte"),
+    ("MSİ B650 TOMAHAWK", "MSI"),
+    ("Kıngston Fury 16GB", "Kingston"),
+    ("gigabyte b650m", "Gigabyte"),
+    ("G.SKILL Trident Z5", "G.SKILL"),
+    ("Samsung SSD 990 Pro", "Samsung Semiconductor"),
+    ("GSKILL Ripjaws", None),
+    ("Bilinmeyen Marka", None),
+])
+def test_match_handles_turkish_case(name, expected):
+    assert ManufacturerMatcher(MANUFACTURERS).match(name) == expected
+
+def test_match_many_agrees_with_match():
+    matcher = ManufacturerMatcher(MANUFACTURERS)
+    names = ["GİGABYTE RTX 4060", "Bilinmeyen", "MSİ B650", "Kıngston Fury", "Samsung 870 EVO"]
+    assert matcher.match_many(names) == [matcher.match(name) for name in names]
+    assert matcher.match_many(names) == ["Gigabyte", None, "MSI", "Kingston", "Samsung"]
+
+def test_empty_manufacturers():
+    assert ManufacturerMatcher({}).match("MSI B650") is None
+    assert ManufacturerMatcher({}).match_many(["MSI B650"]) == [None]
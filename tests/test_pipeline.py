@@ -0,0 +1,88 @@
+import threading
+
+from TechCrawler import Config, CrawlPipeline, WebScraper, parse_html
+
+from site_pages import listing_page
+
+class StaticFetcher:
+    parser = "html.parser"
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def fetch_text(self, url: str) -> str:
+        return self.text
+
+class SinerjiFetcher:
+    """
+    Sayfalayıcısı olmayan, last_page'den sonraki sayfalarda son sayfayı tekrar sunan bir sinerji kategorisi.
+    """
+    parser = "html.parser"
+    url = "https://www.sinerji.gen.tr/islemci"
+
+    def __init__(self, last_page: int, paginator_pages: int = 0):
+        self.last_page = last_page
+        self.paginator_pages = paginator_pages
+
+    def fetch_text(self, url: str) -> str:
+        page_num = int(url.rsplit("?px=", 1)[1]) if "?px=" in url else 1
+        page_num = min(page_num, self.last_page)
+        paginator = "".join(f'<a href="?px={page}">{page}</a>' for page in range(2, self.paginator_pages + 1))
+        return (f'<html><body><section><article><div class="title"><a href="/urun-{page_num}">Ryzen {page_num}</a></div>'
+                f'<div class="row"><div class="col"><span>{page_num}.000,00 TL</span></div></div></article></section>'
+                f'<div>{paginator}</div></body></html>')
+
+    def fetch(self, url: str):
+        return parse_html(self.fetch_text(url))
+
+def test_config_without_sink_keeps_errors_for_parent():
+    config = Config(bundle_path=None, log_errors=False)
+    assert config.error_sink is None
+    config.save_error_to_json(ValueError("bozuk fiyat"))
+    [record] = config.take_errors()
+    assert (record["error_name"], record["error_message"]) == ("ValueError", "bozuk fiyat")
+    assert config.take_errors() == []
+    config.close()
+
+def test_writer_error_does_not_hang_pipeline(tmp_path, monkeypatch):
+    config = Config(bundle_path=None)
+    config.links = {"itopya": {f"https://example.test/{index}": f"cat{index}" for index in range(16)}}
+    monkeypatch.chdir(tmp_path)
+    scraper = WebScraper(config, StaticFetcher(listing_page("itopya")), write_snapshot=False)
+
+    def write_page(*args):
+        raise RuntimeError("disk dolu")
+    monkeypatch.setattr(scraper, "write_page", write_page)
+    pipeline = CrawlPipeline(scraper, fetch_workers=2, parse_workers=1, write_queue_size=1)
+    raised = []
+
+    def run():
+        try:
+            pipeline.run()
+        except RuntimeError as e:
+            raised.append(e)
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    runner.join(60)
+    assert not runner.is_alive()
+    assert [str(e) for e in raised] == ["disk dolu"]
+    config.close()
+
+def _run_sinerji(config, monkeypatch, tmp_path, fetcher, probe_pages=0):
+    config.links = {"sinerji": {fetcher.url: "islemci"}}
+    monkeypatch.chdir(tmp_path)
+    scraper = WebScraper(config, fetcher, write_snapshot=False, probe_pages=probe_pages)
+    CrawlPipeline(scraper, fetch_workers=4, parse_workers=1).run()
+    return scraper
+
+def test_pipeline_probes_unreadable_paginator(tmp_path, monkeypatch):
+    config = Config(bundle_path=None)
+    scraper = _run_sinerji(config, monkeypatch, tmp_path, SinerjiFetcher(last_page=5), probe_pages=16)
+    assert (scraper.pages_scraped, scraper.products_scraped) == (5, 5)
+    config.close()
+
+def test_pipeline_stops_at_repeated_page(tmp_path, monkeypatch):
+    config = Config(bundle_path=None)
+    scraper = _run_sinerji(config, monkeypatch, tmp_path, SinerjiFetcher(last_page=3, paginator_pages=6))
+    assert (scraper.pages_scraped, scraper.products_scraped) == (3, 3)
+    config.close()
@@ -0,0 +1,31 @@
+import os
+import time
+
+from TechCrawler import ResponseCache
+
+def _put(cache, url):
+    cache.put(url, os.urandom(2000), "utf-8")
+    time.sleep(0.01)
+
+def test_hits_protect_entries_from_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / "responses.sqlite"), max_bytes=5000)
+    _put(cache, "https://example.test/a")
+    _put(cache, "https://example.test/b")
+    assert cache.get("https://example.test/a") is not None
+    time.sleep(0.01)
+    _put(cache, "https://example.test/c")
+    assert cache.get("https://example.test/a") is not None
+    assert cache.get("https://example.test/b") is None
+    cache.close()
+
+def test_access_times_survive_reopen(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    cache = ResponseCache(path, max_bytes=5000)
+    _put(cache, "https://example.test/a")
+    _put(cache, "https://example.test/b")
+    cache.get("https://example.test/a")
+    cache.close()
+    cache = ResponseCache(path, max_bytes=5000)
+    _put(cache, "https://example.test/c")
+    assert [cache.get(f"https://example.test/{name}") is not None for name in "abc"] == [True, False, True]
+    cache.close()
@@ -0,0 +1,60 @@
+import asyncio
+import gzip
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from TechCrawler import Config, HostRateLimiter
+from sitemap_discovery import SitemapDiscovery, refresh_links
+
+SITEMAP = ('<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+           + "".join(f"<url><loc>https://www.itopya.com/urun_u{index}</loc></url>" for index in range(2000))
+           + "</urlset>").encode("utf-8")
+
+async def _stream_with_limiter():
+    async def sitemap(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/xml"})
+        await response.prepare(request)
+        body = gzip.compress(SITEMAP)
+        for start in range(0, len(body), 1024):
+            await response.write(body[start:start + 1024])
+            await asyncio.sleep(0)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/sitemap.xml.gz", sitemap)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    host = f"127.0.0.1:{port}"
+    limiter = HostRateLimiter(initial_rate=100.0)
+    config = Config(bundle_path=None)
+    discovery = SitemapDiscovery(config, rate_limiter=limiter)
+    in_flight = []
+    try:
+        async with aiohttp.ClientSession() as session:
+            await discovery.stream_sitemap(session, f"http://{host}/sitemap.xml.gz", lambda loc: None,
+                                           lambda loc: in_flight.append(limiter.hosts[host]["in_flight"]))
+    finally:
+        await runner.cleanup()
+        config.close()
+    return in_flight, limiter.hosts[host]["in_flight"]
+
+def test_limiter_slot_is_held_while_body_streams():
+    in_flight, after = asyncio.run(_stream_with_limiter())
+    assert len(in_flight) == 2000
+    assert set(in_flight) == {1}
+    assert after == 0
+
+def test_refresh_links_matches_site_names_case_insensitively():
+    links = {"Sinerji": {"https://www.sinerji.gen.tr/islemci-c-1": "İşlemci"}}
+    discovered = {"sinerji": {"categories": {"https://www.sinerji.gen.tr/islemci-c-7": "Islemci"}}}
+    refreshed, changed, missing = refresh_links(links, discovered)
+    assert refreshed == {"Sinerji": {"https://www.sinerji.gen.tr/islemci-c-7": "İşlemci"}}
+    assert changed == [("Sinerji", "https://www.sinerji.gen.tr/islemci-c-1", "https://www.sinerji.gen.tr/islemci-c-7")]
+    assert missing == []
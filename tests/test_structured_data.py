@@ -0,0 +1,37 @@
+import pytest
+
+from TechCrawler import Config, WebScraper, format_price_tr, parse_html
+
+from site_pages import listing_page_with_structured, structured_page
+
+@pytest.fixture(scope="module")
+def scraper():
+    config = Config(bundle_path=None)
+    yield WebScraper(config=config, PageFetcher=None)
+    config.close()
+
+@pytest.mark.parametrize("value, expected", [
+    (12999, "12.999,00"), (12999.5, "12.999,50"), ("12999.90", "12.999,90"), ("12999.9", "12.999,90"),
+    ("12.999", "12.999,00"), ("1.234.567", "1.234.567,00"), ("12.999,00", "12.999,00"),
+    ("1,234.56", "1.234,56"), ("Fiyat sorunuz", "Fiyat sorunuz")])
+def test_format_price_tr(value, expected):
+    assert format_price_tr(value) == expected
+
+def _extract(scraper, text, site_name="itopya"):
+    return scraper.extract_products(parse_html(text), site_name)
+
+def test_complete_structured_data_is_used(scraper):
+    text = listing_page_with_structured("itopya", [("MSI B650 Tomahawk", "8999.00", "https://www.itopya.com/b650")])
+    assert [(p["isim"], p["Fiyat"]) for p in _extract(scraper, text)] == [("MSI B650 Tomahawk", "8.999,00")]
+
+def test_structured_item_without_price_falls_back_to_dom(scraper):
+    text = listing_page_with_structured("itopya", [("MSI B650 Tomahawk", None, "https://www.itopya.com/b650")])
+    assert [(p["isim"], p["Fiyat"]) for p in _extract(scraper, text)] == [("MSI B650", "12.999,00")]
+
+def test_structured_count_mismatch_falls_back_to_dom(scraper):
+    text = listing_page_with_structured("itopya", [("A", "1.00", "/a"), ("B", "2.00", "/b")])
+    assert [p["isim"] for p in _extract(scraper, text)] == ["MSI B650"]
+
+def test_structured_only_page_keeps_structured_products(scraper):
+    text = structured_page([("Samsung Monitör", "8499", "https://www.teknosa.com/samsung-monitor")])
+    assert [(p["isim"], p["Fiyat"]) for p in _extract(scraper, text, "teknosa")] == [("Samsung Monitör", "8.499,00")]
@@ -0,0 +1,29 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from TechCrawler import windowed_results
+
+def test_results_keep_order_and_window_bounds_outstanding_work():
+    lock = threading.Lock()
+    state = {"submitted": 0, "consumed": 0, "peak": 0}
+
+    def submit(executor, page_num):
+        with lock:
+            state["submitted"] += 1
+            state["peak"] = max(state["peak"], state["submitted"] - state["consumed"])
+        return executor.submit(time.sleep, 0.001 * (page_num % 3))
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        order = []
+        for page_num, _ in windowed_results(list(range(1, 101)), lambda page_num: submit(executor, page_num), 4):
+            order.append(page_num)
+            with lock:
+                state["consumed"] += 1
+    assert order == list(range(1, 101))
+    assert state["peak"] <= 4
+
+def test_empty_and_small_inputs():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(windowed_results([], lambda item: executor.submit(str, item), 4)) == []
+        assert list(windowed_results([1, 2], lambda item: executor.submit(str, item), 8)) == [(1, "1"), (2, "2")]
@@ -0,0 +1,46 @@
+import pytest
+
+from TechCrawler import RedisWorkQueue, SqliteWorkQueue
+
+LINKS = {"itopya": {"https://example.test/cpu": "cpu"}}
+
+def _row(page_num):
+    return [{"isim": f"MSI {page_num}", "Fiyat": f"{page_num},00"}]
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        queue = SqliteWorkQueue(str(tmp_path / "queue.sqlite"))
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        import redis
+        server = fakeredis.FakeServer()
+        monkeypatch.setattr(redis.Redis, "from_url", classmethod(lambda cls, url: fakeredis.FakeRedis(server=server)))
+        queue = RedisWorkQueue("redis://fake/0")
+    queue.seed(LINKS, "01-01_10")
+    yield queue
+    queue.close()
+
+def test_probed_pages_are_not_leased_again(queue):
+    [first] = queue.lease("w1", 10)
+    assert queue.ack(first, _row(1), 4, next_pages=[(4, "https://example.test/cpu?page=4")],
+                     done_pages=[(2, "https://example.test/cpu?page=2", _row(2)),
+                                 (3, "https://example.test/cpu?page=3", _row(3))])
+    assert queue.claim_completed() == []
+    [last] = queue.lease("w1", 10)
+    assert last["page"] == 4
+    assert queue.lease("w1", 10) == []
+    assert queue.ack(last, _row(4))
+    assert queue.claim_completed() == [("itopya", "cpu")]
+    assert list(queue.results("itopya", "cpu")) == [(page_num, _row(page_num)) for page_num in range(1, 5)]
+
+def test_fail_after_probed_pages(queue):
+    [first] = queue.lease("w1", 10)
+    assert queue.ack(first, _row(1), 3, next_pages=[(3, "https://example.test/cpu?page=3")],
+                     done_pages=[(2, "https://example.test/cpu?page=2", _row(2))])
+    [last] = queue.lease("w1", 10)
+    queue.max_attempts = 1
+    assert queue.fail(last)
+    assert queue.claim_completed() == [("itopya", "cpu")]
+    assert list(queue.results("itopya", "cpu")) == [(1, _row(1)), (2, _row(2)), (3, None)]